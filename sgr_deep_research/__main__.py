@@ -8,9 +8,10 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from sgr_deep_research import AgentFactory, __version__
-from sgr_deep_research.api.endpoints import router
+from sgr_deep_research.api.endpoints import agents_storage, router
 from sgr_deep_research.core import AgentRegistry, ToolRegistry
 from sgr_deep_research.core.agent_config import GlobalConfig
+from sgr_deep_research.core.services import LocalSearchService, MCPSessionPool, TavilySearchService
 from sgr_deep_research.default_definitions import get_default_agents_definitions
 from sgr_deep_research.settings import ServerConfig, setup_logging
 
@@ -26,7 +27,21 @@ async def lifespan(app: FastAPI):
         logger.info(f"Agent registered: {agent.__name__}")
     for defn in AgentFactory.get_definitions_list():
         logger.info(f"Agent definition loaded: {defn}")
+    agents_storage.configure(GlobalConfig().agent_store)
+    TavilySearchService.cache.configure(GlobalConfig().search_cache)
+    TavilySearchService.page_cache.configure(GlobalConfig().page_cache)
+    try:
+        logger.info(f"Discovered {await AgentFactory.load_mcp_tools()} MCP tools")
+    except Exception as e:
+        logger.warning(f"MCP tools discovery failed, retrying on agent creation: {e}")
     yield
+    agents_storage.close()
+    await AgentFactory.close_clients()
+    await TavilySearchService.close_all()
+    await LocalSearchService.close_all()
+    await MCPSessionPool.close_all()
+    TavilySearchService.cache.close()
+    TavilySearchService.page_cache.close()
 
 
 def main():
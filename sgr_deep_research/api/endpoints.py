@@ -1,27 +1,37 @@
 import asyncio
 import logging
+from datetime import datetime
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Query
 from fastapi.responses import StreamingResponse
 
 from sgr_deep_research.api.models import (
     AgentListItem,
     AgentListResponse,
     AgentStateResponse,
+    ChatCompletionChoice,
     ChatCompletionRequest,
+    ChatCompletionResponse,
+    ChatMessage,
     ClarificationRequest,
     HealthResponse,
+    MCPRefreshResponse,
+    MCPStatsResponse,
+    MCPToolStats,
 )
-from sgr_deep_research.core import BaseAgent
 from sgr_deep_research.core.agent_factory import AgentFactory
+from sgr_deep_research.core.base_agent import BaseAgent
 from sgr_deep_research.core.models import AgentStatesEnum
+from sgr_deep_research.core.services.agent_store import AgentFilter, AgentStore
+from sgr_deep_research.core.services.mcp_session_pool import MCPSessionPool
+from sgr_deep_research.core.stream import OpenAIStreamingGenerator, SinkStreamingGenerator
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# ToDo: better to move to a separate service
-agents_storage: dict[str, BaseAgent] = {}
+agents_storage = AgentStore()
 
 
 @router.get("/health", response_model=HealthResponse)
@@ -31,32 +41,54 @@ async def health_check():
 
 @router.get("/agents/{agent_id}/state", response_model=AgentStateResponse)
 async def get_agent_state(agent_id: str):
-    if agent_id not in agents_storage:
-        raise HTTPException(status_code=404, detail="Agent not found")
+    if (agent := agents_storage.get(agent_id)) is not None:
+        return AgentStateResponse(
+            agent_id=agent.id,
+            task=agent.task,
+            sources_count=len(agent._context.sources),
+            **agent._context.model_dump(),
+        )
 
-    agent = agents_storage[agent_id]
+    # Agent was evicted from memory, serve its stored snapshot
+    if (snapshot := agents_storage.snapshot(agent_id)) is None:
+        raise HTTPException(status_code=404, detail="Agent not found")
 
     return AgentStateResponse(
-        agent_id=agent.id,
-        task=agent.task,
-        sources_count=len(agent._context.sources),
-        **agent._context.model_dump(),
+        agent_id=snapshot.agent_id,
+        task=snapshot.task,
+        sources_count=len(snapshot.context.get("sources", {})),
+        **snapshot.context,
     )
 
 
 @router.get("/agents", response_model=AgentListResponse)
-async def get_agents_list():
+async def get_agents_list(
+    state: Annotated[list[AgentStatesEnum] | None, Query(description="Filter by agent states")] = None,
+    created_after: Annotated[datetime | None, Query(description="Agents created at or after this time")] = None,
+    created_before: Annotated[datetime | None, Query(description="Agents created before this time")] = None,
+    limit: Annotated[int, Query(ge=1, le=1000, description="Maximum number of agents per page")] = 100,
+    cursor: Annotated[str | None, Query(description="next_cursor from the previous page")] = None,
+):
+    agent_filter = AgentFilter(
+        states=set(state) if state else None,
+        created_after=created_after,
+        created_before=created_before,
+    )
+    try:
+        page = agents_storage.list_agents(agent_filter, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     agents_list = [
         AgentListItem(
-            agent_id=agent.id,
-            task=agent.task,
-            state=agent._context.state,
-            creation_time=agent.creation_time,
+            agent_id=summary.agent_id,
+            task=summary.task,
+            state=summary.state,
+            creation_time=summary.creation_time,
         )
-        for agent in agents_storage.values()
+        for summary in page.items
     ]
-
-    return AgentListResponse(agents=agents_list, total=len(agents_list))
+    return AgentListResponse(agents=agents_list, total=page.total, next_cursor=page.next_cursor)
 
 
 @router.get("/v1/models")
@@ -75,6 +107,35 @@ async def get_available_models():
     return {"data": models_data, "object": "list"}
 
 
+@router.post("/mcp/refresh", response_model=MCPRefreshResponse)
+async def refresh_mcp_tools():
+    """Rediscover tools of the MCP servers of all agent definitions."""
+    try:
+        tools_count = await AgentFactory.load_mcp_tools(refresh=True)
+    except Exception as e:
+        logger.error(f"MCP tools refresh failed: {e}")
+        raise HTTPException(status_code=502, detail=f"MCP tools refresh failed: {e}")
+    return MCPRefreshResponse(tools_count=tools_count)
+
+
+@router.get("/mcp/stats", response_model=MCPStatsResponse)
+async def get_mcp_stats():
+    """Get call latency statistics of MCP tools."""
+    tools = {
+        name: MCPToolStats(
+            calls=histogram.count,
+            errors=histogram.errors,
+            mean_seconds=histogram.total_seconds / histogram.count if histogram.count else None,
+            p50_seconds=histogram.percentile(50),
+            p95_seconds=histogram.percentile(95),
+            p99_seconds=histogram.percentile(99),
+            histogram={str(bound): count for bound, count in zip([*histogram.bounds, "inf"], histogram.counts)},
+        )
+        for name, histogram in MCPSessionPool.latency_stats().items()
+    }
+    return MCPStatsResponse(tools=tools)
+
+
 def extract_user_content_from_messages(messages):
     for message in reversed(messages):
         if message.role == "user":
@@ -91,9 +152,10 @@ async def provide_clarification(agent_id: str, request: ClarificationRequest):
 
         logger.info(f"Providing clarification to agent {agent.id}: {request.clarifications[:100]}...")
 
+        _use_stream(agent)
         await agent.provide_clarification(request.clarifications)
         return StreamingResponse(
-            agent.streaming_generator.stream(),
+            agent.streaming_generator.event_stream(),
             media_type="text/plain",
             headers={
                 "Cache-Control": "no-cache",
@@ -107,25 +169,97 @@ async def provide_clarification(agent_id: str, request: ClarificationRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/agents/{agent_id}/stream")
+async def resume_agent_stream(
+    agent_id: str,
+    last_event_id: Annotated[int | None, Header(ge=-1, description="Id of the last received event")] = None,
+):
+    """Reconnect to the agent stream, replaying events after Last-Event-
+    ID."""
+    agent = agents_storage.get(agent_id)
+    if not agent:
+        raise HTTPException(status_code=404, detail="Agent not found")
+    if agent._context.state == AgentStatesEnum.WAITING_FOR_CLARIFICATION:
+        # the stream continues once the clarification is provided
+        _use_stream(agent)
+
+    return StreamingResponse(
+        agent.streaming_generator.event_stream(last_event_id),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Agent-ID": str(agent.id),
+        },
+    )
+
+
 def _is_agent_id(model_str: str) -> bool:
     """Check if model string is an agent ID (contains underscore and UUID-like
     format)."""
     return "_" in model_str and len(model_str) > 20
 
 
+def _use_sink(agent: BaseAgent) -> SinkStreamingGenerator:
+    """Switch agent output to a no-op sink for a non-streaming
+    completion."""
+    if not isinstance(agent.streaming_generator, SinkStreamingGenerator):
+        agent.streaming_generator.close()
+        agent.streaming_generator = SinkStreamingGenerator(model=agent.id)
+    agent.streaming_generator.finished.clear()
+    return agent.streaming_generator
+
+
+def _use_stream(agent: BaseAgent) -> OpenAIStreamingGenerator:
+    """Switch agent output back to a streaming generator after a
+    non-streaming completion."""
+    if isinstance(agent.streaming_generator, SinkStreamingGenerator):
+        agent.streaming_generator.close()
+        agent.streaming_generator = agent.create_streaming_generator()
+    return agent.streaming_generator
+
+
+def _completion_response(agent: BaseAgent) -> ChatCompletionResponse:
+    """Build non-streaming response of an agent that finished or waits for
+    clarification."""
+    if agent._context.state in (AgentStatesEnum.FAILED, AgentStatesEnum.ERROR):
+        raise HTTPException(status_code=500, detail=f"Agent {agent.id} execution failed")
+    if agent._context.state == AgentStatesEnum.WAITING_FOR_CLARIFICATION:
+        # clarification questions are the result of the last tool call
+        content = next((m["content"] for m in reversed(agent.conversation) if m["role"] == "tool"), "")
+    else:
+        content = agent._context.execution_result or ""
+
+    return ChatCompletionResponse(
+        id=agent.streaming_generator.id,
+        created=agent.streaming_generator.created,
+        model=agent.id,
+        choices=[
+            ChatCompletionChoice(
+                index=0,
+                message=ChatMessage(role="assistant", content=content),
+                finish_reason="stop",
+            )
+        ],
+        usage=agent._context.usage.model_dump(),
+    )
+
+
 @router.post("/v1/chat/completions")
 async def create_chat_completion(request: ChatCompletionRequest):
-    if not request.stream:
-        raise HTTPException(status_code=501, detail="Only streaming responses are supported. Set 'stream=true'")
-
     # Check if this is a clarification request for an existing agent
     if (
         request.model
         and isinstance(request.model, str)
         and _is_agent_id(request.model)
-        and request.model in agents_storage
-        and agents_storage[request.model]._context.state == AgentStatesEnum.WAITING_FOR_CLARIFICATION
+        and (agent := agents_storage.get(request.model)) is not None
+        and agent._context.state == AgentStatesEnum.WAITING_FOR_CLARIFICATION
     ):
+        if not request.stream:
+            sink = _use_sink(agent)
+            await agent.provide_clarification(extract_user_content_from_messages(request.messages))
+            await sink.finished.wait()
+            return _completion_response(agent)
         return await provide_clarification(
             agent_id=request.model,
             request=ClarificationRequest(clarifications=extract_user_content_from_messages(request.messages)),
@@ -145,9 +279,15 @@ async def create_chat_completion(request: ChatCompletionRequest):
         logger.info(f"Created agent '{request.model}' for task: {task[:100]}...")
 
         agents_storage[agent.id] = agent
+        if not request.stream:
+            sink = _use_sink(agent)
+            _ = asyncio.create_task(agent.execute())
+            await sink.finished.wait()
+            return _completion_response(agent)
+
         _ = asyncio.create_task(agent.execute())
         return StreamingResponse(
-            agent.streaming_generator.stream(),
+            agent.streaming_generator.event_stream(),
             media_type="text/plain",
             headers={
                 "Cache-Control": "no-cache",
@@ -53,6 +53,24 @@ class HealthResponse(BaseModel):
     service: str = Field(default="SGR Agent Core API", description="Service name")
 
 
+class MCPRefreshResponse(BaseModel):
+    tools_count: int = Field(description="Number of discovered MCP tools")
+
+
+class MCPToolStats(BaseModel):
+    calls: int = Field(description="Number of tool calls")
+    errors: int = Field(description="Number of failed, timed out or cancelled calls")
+    mean_seconds: float | None = Field(default=None, description="Mean call duration")
+    p50_seconds: float | None = Field(default=None, description="Median call duration (bucket upper bound)")
+    p95_seconds: float | None = Field(default=None, description="95th percentile call duration (bucket upper bound)")
+    p99_seconds: float | None = Field(default=None, description="99th percentile call duration (bucket upper bound)")
+    histogram: Dict[str, int] = Field(description="Calls by duration bucket upper bound in seconds")
+
+
+class MCPStatsResponse(BaseModel):
+    tools: Dict[str, MCPToolStats] = Field(description="Call latency statistics by MCP tool name")
+
+
 class AgentStateResponse(BaseModel):
     agent_id: str = Field(description="Agent ID")
     task: str = Field(description="Agent task")
@@ -63,6 +81,10 @@ class AgentStateResponse(BaseModel):
     sources_count: int = Field(description="Number of sources found")
     current_step_reasoning: Dict[str, Any] | None = Field(default=None, description="Current agent step")
     execution_result: str | None = Field(default=None, description="Execution result")
+    usage: Dict[str, int] | None = Field(default=None, description="Total LLM token usage")
+    phase_usage: Dict[str, Dict[str, int]] = Field(
+        default_factory=dict, description="LLM token usage by phase (reasoning, action_selection, tool)"
+    )
 
 
 class AgentListItem(BaseModel):
@@ -74,7 +96,8 @@ class AgentListItem(BaseModel):
 
 class AgentListResponse(BaseModel):
     agents: List[AgentListItem] = Field(description="List of agents")
-    total: int = Field(description="Total number of agents")
+    total: int = Field(description="Total number of agents matching the filter")
+    next_cursor: str | None = Field(default=None, description="Cursor of the next page, None on the last page")
 
 
 class ClarificationRequest(BaseModel):
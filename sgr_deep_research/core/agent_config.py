@@ -1,8 +1,9 @@
 import logging
 from pathlib import Path
-from typing import ClassVar, Self
+from typing import ClassVar, Literal, Self
 
 import yaml
+from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from sgr_deep_research.core.agent_definition import AgentConfig, Definitions
@@ -10,7 +11,47 @@ from sgr_deep_research.core.agent_definition import AgentConfig, Definitions
 logger = logging.getLogger(__name__)
 
 
+class AgentStoreConfig(BaseModel):
+    """Storage of agents served by the API.
+
+    Running agents are always kept in memory. Finished agents beyond
+    max_finished_agents are evicted from memory as snapshots (context,
+    conversation and log) into the selected backend.
+    """
+
+    backend: Literal["memory", "sqlite"] = Field(default="memory", description="Snapshot storage backend")
+    max_finished_agents: int = Field(default=100, ge=0, description="Finished agents kept alive in memory")
+    max_snapshots: int = Field(default=10000, gt=0, description="Maximum snapshots kept by the memory backend")
+    snapshot_ttl: int | None = Field(default=None, gt=0, description="Snapshot time to live in seconds")
+    sqlite_path: str = Field(default="agents.db", description="SQLite database file for the sqlite backend")
+
+
+class SearchCacheConfig(BaseModel):
+    """Search results cache shared between agents."""
+
+    enabled: bool = Field(default=True, description="Cache search results")
+    backend: Literal["memory", "sqlite"] = Field(default="memory", description="Search cache storage backend")
+    max_size: int = Field(default=1000, gt=0, description="Maximum cached search results (LRU)")
+    ttl: int | None = Field(default=3600, gt=0, description="Cached search result time to live in seconds")
+    sqlite_path: str = Field(default="search_cache.db", description="SQLite database file for the sqlite backend")
+
+
+class PageCacheConfig(BaseModel):
+    """Extracted page contents cache shared between agents."""
+
+    enabled: bool = Field(default=True, description="Cache extracted page contents")
+    backend: Literal["memory", "sqlite"] = Field(default="memory", description="Page cache storage backend")
+    max_pages: int = Field(default=5000, gt=0, description="Maximum pages kept by the sqlite backend (LRU)")
+    hot_size: int = Field(default=200, gt=0, description="Maximum pages kept decompressed in memory (LRU)")
+    ttl: int | None = Field(default=86400, gt=0, description="Cached page time to live in seconds")
+    sqlite_path: str = Field(default="page_cache.db", description="SQLite database file for the sqlite backend")
+
+
 class GlobalConfig(BaseSettings, AgentConfig, Definitions):
+    agent_store: AgentStoreConfig = Field(default_factory=AgentStoreConfig, description="Agent storage settings")
+    search_cache: SearchCacheConfig = Field(default_factory=SearchCacheConfig, description="Search cache settings")
+    page_cache: PageCacheConfig = Field(default_factory=PageCacheConfig, description="Page cache settings")
+
     _instance: ClassVar[Self | None] = None
     _initialized: ClassVar[bool] = False
 
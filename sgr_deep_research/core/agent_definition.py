@@ -3,7 +3,7 @@ import logging
 import os
 from functools import cached_property
 from pathlib import Path
-from typing import Any, Self
+from typing import Any, Literal, Self
 
 import yaml
 from fastmcp.mcp_config import MCPConfig
@@ -22,14 +22,56 @@ class LLMConfig(BaseModel):
         default=None, description="Proxy URL (e.g., socks5://127.0.0.1:1081 or http://127.0.0.1:8080)"
     )
 
+    max_connections: int = Field(default=100, gt=0, description="Maximum number of pooled HTTP connections")
+    max_keepalive_connections: int = Field(
+        default=20, ge=0, description="Maximum number of idle keep-alive connections"
+    )
+    keepalive_expiry: float = Field(default=30.0, ge=0.0, description="Idle keep-alive connection expiry in seconds")
+    http2: bool = Field(
+        default=False, description="Enable HTTP/2 (requires the 'h2' package: pip install httpx[http2])"
+    )
+
 
 class SearchConfig(BaseModel):
+    backend: Literal["tavily", "local"] = Field(default="tavily", description="Search backend")
     tavily_api_key: str | None = Field(default=None, description="Tavily API key")
     tavily_api_base_url: str = Field(default="https://api.tavily.com", description="Tavily API base URL")
 
     max_results: int = Field(default=10, ge=1, description="Maximum number of search results")
     max_pages: int = Field(default=5, gt=0, description="Maximum pages to scrape")
     content_limit: int = Field(default=1500, gt=0, description="Content character limit per source")
+    passage_selection: bool = Field(
+        default=True, description="Send passages most relevant to the task instead of the page beginning"
+    )
+    passage_chars: int = Field(default=500, gt=0, description="Approximate passage size for passage selection")
+    content_normalization: bool = Field(
+        default=True, description="Strip boilerplate lines and near-duplicate paragraphs from extracted pages"
+    )
+    boilerplate_min_pages: int = Field(
+        default=2,
+        ge=2,
+        description="Distinct extracted pages of one site a short line must appear in to be removed as boilerplate",
+    )
+    duplicate_threshold: float = Field(
+        default=0.8, gt=0.0, le=1.0, description="Shingle similarity of paragraphs removed as near-duplicates"
+    )
+
+    timeout: float = Field(default=60.0, gt=0.0, description="Search API request timeout in seconds")
+    max_connections: int = Field(default=50, gt=0, description="Maximum number of pooled HTTP connections")
+    max_keepalive_connections: int = Field(
+        default=10, ge=0, description="Maximum number of idle keep-alive connections"
+    )
+    keepalive_expiry: float = Field(default=30.0, ge=0.0, description="Idle keep-alive connection expiry in seconds")
+
+    local_documents_dir: str | None = Field(
+        default=None, description="Directory of documents searched by the local backend"
+    )
+    local_documents_suffixes: list[str] = Field(
+        default=[".txt", ".md"], description="File suffixes of documents indexed by the local backend"
+    )
+    local_index_path: str = Field(
+        default=":memory:", description="SQLite full-text index file of the local backend (rebuilt if ':memory:')"
+    )
 
 
 class PromptsConfig(BaseModel):
@@ -103,7 +145,50 @@ class ExecutionConfig(BaseModel, extra="allow"):
     max_clarifications: int = Field(default=3, ge=0, description="Maximum number of clarifications")
     max_iterations: int = Field(default=10, gt=0, description="Maximum number of iterations")
     max_searches: int = Field(default=4, ge=0, description="Maximum number of searches")
+    max_concurrent_searches: int = Field(
+        default=3, gt=0, description="Maximum number of search queries an agent runs concurrently"
+    )
+    max_parallel_tool_calls: int = Field(
+        default=4, gt=0, description="Maximum number of tool calls of one step executed concurrently"
+    )
     mcp_context_limit: int = Field(default=15000, gt=0, description="Maximum context length from MCP server response")
+    mcp_spill_results: bool = Field(
+        default=True, description="Save full MCP results truncated to mcp_context_limit under logs_dir/mcp_results"
+    )
+    mcp_tools_ttl: float | None = Field(
+        default=3600.0, gt=0, description="Seconds discovered MCP tools are reused before rediscovery (None: forever)"
+    )
+    mcp_sessions_per_config: int = Field(
+        default=1, gt=0, description="Number of warm MCP client sessions kept per MCP configuration"
+    )
+    mcp_health_check_interval: float = Field(
+        default=30.0, ge=0.0, description="Seconds an MCP session may stay idle before it is pinged on use"
+    )
+    mcp_max_concurrent_calls: int = Field(
+        default=10, gt=0, description="Maximum number of concurrent tool calls per MCP configuration"
+    )
+    mcp_call_timeout: float | None = Field(
+        default=60.0, gt=0, description="MCP tool call timeout in seconds, including queueing (None: no timeout)"
+    )
+    mcp_connect_retries: int = Field(default=3, ge=0, description="MCP reconnection attempts before a call fails")
+    mcp_reconnect_backoff: float = Field(
+        default=0.5, ge=0.0, description="Initial MCP reconnection delay in seconds, doubled on each attempt"
+    )
+    stream_buffer_size: int = Field(
+        default=10000, ge=2, description="Maximum number of buffered stream chunks available for replay"
+    )
+    stream_buffer_bytes: int = Field(
+        default=16 * 1024 * 1024, gt=0, description="Maximum total size of buffered stream data"
+    )
+    stream_overflow: Literal["drop_oldest", "coalesce"] = Field(
+        default="drop_oldest", description="How to make room in a full stream buffer"
+    )
+    stream_coalesce_ms: float = Field(
+        default=0, ge=0, description="Batch streamed token deltas for this many ms (0 disables coalescing)"
+    )
+    stream_coalesce_bytes: int = Field(
+        default=4096, gt=0, description="Flush batched token deltas once this much content is pending"
+    )
 
     logs_dir: str = Field(default="logs", description="Directory for saving bot logs")
     reports_dir: str = Field(default="reports", description="Directory for saving reports")
@@ -151,8 +236,10 @@ class AgentDefinition(AgentConfig):
     def necessary_fields_validator(self) -> Self:
         if self.llm.api_key is None:
             raise ValueError(f"LLM API key is not provided for agent '{self.name}'")
-        if self.search and self.search.tavily_api_key is None:
+        if self.search and self.search.backend == "tavily" and self.search.tavily_api_key is None:
             raise ValueError(f"Search API key is not provided for agent '{self.name}'")
+        if self.search and self.search.backend == "local" and self.search.local_documents_dir is None:
+            raise ValueError(f"Local documents directory is not provided for agent '{self.name}'")
         if not self.tools:
             raise ValueError(f"Tools are not provided for agent '{self.name}'")
         return self
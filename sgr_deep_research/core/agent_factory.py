@@ -1,15 +1,15 @@
 """Agent Factory for dynamic agent creation from definitions."""
 
 import logging
-from typing import Type, TypeVar
+from typing import ClassVar, Type, TypeVar
 
 import httpx
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from sgr_deep_research.core.agent_config import GlobalConfig
 from sgr_deep_research.core.agent_definition import AgentDefinition, LLMConfig
 from sgr_deep_research.core.base_agent import BaseAgent
-from sgr_deep_research.core.services import AgentRegistry, MCP2ToolConverter, ToolRegistry
+from sgr_deep_research.core.services import AgentRegistry, MCP2ToolConverter, SearchBackend, ToolRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +23,22 @@ class AgentFactory:
     and create instances with the appropriate configuration.
     """
 
+    _clients: ClassVar[dict[tuple, AsyncOpenAI]] = {}
+
+    @staticmethod
+    def _client_key(llm_config: LLMConfig) -> tuple:
+        """Build pool key: clients are shared between agents with the same
+        endpoint, credentials, proxy and connection settings."""
+        return (
+            llm_config.base_url,
+            llm_config.api_key,
+            llm_config.proxy,
+            llm_config.max_connections,
+            llm_config.max_keepalive_connections,
+            llm_config.keepalive_expiry,
+            llm_config.http2,
+        )
+
     @classmethod
     def _create_client(cls, llm_config: LLMConfig) -> AsyncOpenAI:
         """Create OpenAI client from configuration.
@@ -33,11 +49,42 @@ class AgentFactory:
         Returns:
             Configured AsyncOpenAI client
         """
-        client_kwargs = {"base_url": llm_config.base_url, "api_key": llm_config.api_key}
-        if llm_config.proxy:
-            client_kwargs["http_client"] = httpx.AsyncClient(proxy=llm_config.proxy)
+        http_client = DefaultAsyncHttpxClient(
+            proxy=llm_config.proxy,
+            http2=llm_config.http2,
+            limits=httpx.Limits(
+                max_connections=llm_config.max_connections,
+                max_keepalive_connections=llm_config.max_keepalive_connections,
+                keepalive_expiry=llm_config.keepalive_expiry,
+            ),
+        )
+        return AsyncOpenAI(base_url=llm_config.base_url, api_key=llm_config.api_key, http_client=http_client)
+
+    @classmethod
+    def get_client(cls, llm_config: LLMConfig) -> AsyncOpenAI:
+        """Get pooled OpenAI client for configuration, creating it on first
+        use.
 
-        return AsyncOpenAI(**client_kwargs)
+        Args:
+            llm_config: LLM configuration
+
+        Returns:
+            Shared AsyncOpenAI client
+        """
+        key = cls._client_key(llm_config)
+        if (client := cls._clients.get(key)) is None or client.is_closed():
+            client = cls._clients[key] = cls._create_client(llm_config)
+            logger.info(f"Created pooled OpenAI client for {llm_config.base_url} ({len(cls._clients)} in pool)")
+        return client
+
+    @classmethod
+    async def close_clients(cls) -> None:
+        """Close all pooled OpenAI clients and their connection pools."""
+        clients, cls._clients = list(cls._clients.values()), {}
+        for client in clients:
+            await client.close()
+        if clients:
+            logger.info(f"Closed {len(clients)} pooled OpenAI clients")
 
     @classmethod
     async def create(cls, agent_def: AgentDefinition, task: str) -> Agent:
@@ -67,7 +114,7 @@ class AgentFactory:
             )
             logger.error(error_msg)
             raise ValueError(error_msg)
-        mcp_tools = await MCP2ToolConverter.build_tools_from_mcp(agent_def.mcp)
+        mcp_tools = await MCP2ToolConverter.get_tools(agent_def.mcp)
 
         tools = [*mcp_tools]
         for tool in agent_def.tools:
@@ -90,11 +137,13 @@ class AgentFactory:
             agent = BaseClass(
                 task=task,
                 toolkit=tools,
-                openai_client=cls._create_client(agent_def.llm),
+                openai_client=cls.get_client(agent_def.llm),
                 llm_config=agent_def.llm,
                 execution_config=agent_def.execution,
                 prompts_config=agent_def.prompts,
             )
+            if agent_def.search:
+                agent._context.search_service = SearchBackend.for_config(agent_def.search)
             logger.info(
                 f"Created agent '{agent_def.name}' "
                 f"using base class '{BaseClass.__name__}' "
@@ -114,3 +163,23 @@ class AgentFactory:
         """
         config = GlobalConfig()
         return list(config.agents.values())
+
+    @classmethod
+    async def load_mcp_tools(cls, refresh: bool = False) -> int:
+        """Discover MCP tools of all agent definitions ahead of agent
+        creation.
+
+        Args:
+            refresh: Rediscover tools even if they are cached
+
+        Returns:
+            Number of discovered tools
+        """
+        configs = {
+            agent_def.mcp.model_dump_json(): agent_def.mcp
+            for agent_def in cls.get_definitions_list()
+            if agent_def.mcp.mcpServers
+        }
+        if refresh:
+            return await MCP2ToolConverter.refresh(list(configs.values()))
+        return sum([len(await MCP2ToolConverter.get_tools(config)) for config in configs.values()])
@@ -9,6 +9,7 @@ from sgr_deep_research.core.tools import (
     ClarificationTool,
     CreateReportTool,
     FinalAnswerTool,
+    MultiWebSearchTool,
     NextStepToolsBuilder,
     NextStepToolStub,
     WebSearchTool,
@@ -54,6 +55,7 @@ class SGRAgent(BaseAgent):
         if self._context.searches_used >= self.max_searches:
             tools -= {
                 WebSearchTool,
+                MultiWebSearchTool,
             }
         return NextStepToolsBuilder.build_NextStepTools(list(tools))
 
@@ -64,11 +66,13 @@ class SGRAgent(BaseAgent):
             messages=await self._prepare_context(),
             max_tokens=self.llm_config.max_tokens,
             temperature=self.llm_config.temperature,
+            stream_options={"include_usage": True},
         ) as stream:
             async for event in stream:
                 if event.type == "chunk":
-                    self.streaming_generator.add_chunk(event)
-        reasoning: NextStepToolStub = (await stream.get_final_completion()).choices[0].message.parsed  # type: ignore
+                    self.streaming_generator.add_chunk(event.chunk)
+        completion = await self._final_completion(stream, "reasoning")
+        reasoning: NextStepToolStub = completion.choices[0].message.parsed  # type: ignore
         # we are not fully sure if it should be in conversation or not. Looks like not necessary data
         # self.conversation.append({"role": "assistant", "content": reasoning.model_dump_json(exclude={"function"})})
         self._log_reasoning(reasoning)
@@ -100,10 +104,8 @@ class SGRAgent(BaseAgent):
         return tool
 
     async def _action_phase(self, tool: BaseTool) -> str:
-        result = await tool(self._context)
-        self.conversation.append(
-            {"role": "tool", "content": result, "tool_call_id": f"{self._context.iteration}-action"}
-        )
-        self.streaming_generator.add_chunk_from_str(f"{result}\n")
-        self._log_tool_execution(tool, result)
-        return result
+        calls = self._tool_calls
+        if not calls or calls[0][1] is not tool:
+            calls = [(f"{self._context.iteration}-action", tool)]
+        results = await self._execute_tool_calls(calls)
+        return "\n".join(results)
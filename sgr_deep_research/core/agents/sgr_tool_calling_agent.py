@@ -1,16 +1,18 @@
 from typing import Literal, Type
 
-from openai import AsyncOpenAI, pydantic_function_tool
+from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletionFunctionToolParam
 
 from sgr_deep_research.core.agent_definition import ExecutionConfig, LLMConfig, PromptsConfig
 from sgr_deep_research.core.agents.sgr_agent import SGRAgent
 from sgr_deep_research.core.models import AgentStatesEnum
+from sgr_deep_research.core.services.tool_schema_cache import ToolSchemaCache
 from sgr_deep_research.core.tools import (
     BaseTool,
     ClarificationTool,
     CreateReportTool,
     FinalAnswerTool,
+    MultiWebSearchTool,
     ReasoningTool,
     WebSearchTool,
 )
@@ -58,8 +60,9 @@ class SGRToolCallingAgent(SGRAgent):
         if self._context.searches_used >= self.max_searches:
             tools -= {
                 WebSearchTool,
+                MultiWebSearchTool,
             }
-        return [pydantic_function_tool(tool, name=tool.tool_name, description="") for tool in tools]
+        return [ToolSchemaCache.get(tool) for tool in tools]
 
     async def _reasoning_phase(self) -> ReasoningTool:
         async with self.openai_client.chat.completions.stream(
@@ -67,15 +70,15 @@ class SGRToolCallingAgent(SGRAgent):
             messages=await self._prepare_context(),
             max_tokens=self.llm_config.max_tokens,
             temperature=self.llm_config.temperature,
+            stream_options={"include_usage": True},
             tools=await self._prepare_tools(),
             tool_choice={"type": "function", "function": {"name": ReasoningTool.tool_name}},
         ) as stream:
             async for event in stream:
                 if event.type == "chunk":
                     self.streaming_generator.add_chunk(event.chunk)
-            reasoning: ReasoningTool = (
-                (await stream.get_final_completion()).choices[0].message.tool_calls[0].function.parsed_arguments
-            )
+            completion = await self._final_completion(stream, "reasoning")
+            reasoning: ReasoningTool = completion.choices[0].message.tool_calls[0].function.parsed_arguments
         self.conversation.append(
             {
                 "role": "assistant",
@@ -105,6 +108,7 @@ class SGRToolCallingAgent(SGRAgent):
             messages=await self._prepare_context(),
             max_tokens=self.llm_config.max_tokens,
             temperature=self.llm_config.temperature,
+            stream_options={"include_usage": True},
             tools=await self._prepare_tools(),
             tool_choice=self.tool_choice,
         ) as stream:
@@ -112,20 +116,23 @@ class SGRToolCallingAgent(SGRAgent):
                 if event.type == "chunk":
                     self.streaming_generator.add_chunk(event.chunk)
 
-        completion = await stream.get_final_completion()
+        completion = await self._final_completion(stream, "action_selection")
 
-        try:
-            tool = completion.choices[0].message.tool_calls[0].function.parsed_arguments
-        except (IndexError, AttributeError, TypeError):
+        tools = [tool_call.function.parsed_arguments for tool_call in completion.choices[0].message.tool_calls or []]
+        if not tools:
             # LLM returned a text response instead of a tool call - treat as completion
             final_content = completion.choices[0].message.content or "Task completed successfully"
-            tool = FinalAnswerTool(
-                reasoning="Agent decided to complete the task",
-                completed_steps=[final_content],
-                status=AgentStatesEnum.COMPLETED,
-            )
-        if not isinstance(tool, BaseTool):
+            tools = [
+                FinalAnswerTool(
+                    reasoning="Agent decided to complete the task",
+                    completed_steps=[final_content],
+                    status=AgentStatesEnum.COMPLETED,
+                )
+            ]
+        if not all(isinstance(tool, BaseTool) for tool in tools):
             raise ValueError("Selected tool is not a valid BaseTool instance")
+        # All independent tool calls of the step are executed together in the action phase
+        self._tool_calls = self._select_tool_calls(tools)
         self.conversation.append(
             {
                 "role": "assistant",
@@ -133,16 +140,16 @@ class SGRToolCallingAgent(SGRAgent):
                 "tool_calls": [
                     {
                         "type": "function",
-                        "id": f"{self._context.iteration}-action",
+                        "id": call_id,
                         "function": {
                             "name": tool.tool_name,
                             "arguments": tool.model_dump_json(),
                         },
                     }
+                    for call_id, tool in self._tool_calls
                 ],
             }
         )
-        self.streaming_generator.add_tool_call(
-            f"{self._context.iteration}-action", tool.tool_name, tool.model_dump_json()
-        )
-        return tool
+        for call_id, tool in self._tool_calls:
+            self.streaming_generator.add_tool_call(call_id, tool.tool_name, tool.model_dump_json())
+        return self._tool_calls[0][1]
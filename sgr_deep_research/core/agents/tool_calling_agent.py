@@ -1,15 +1,17 @@
 from typing import Literal, Type
 
-from openai import AsyncOpenAI, pydantic_function_tool
+from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletionFunctionToolParam
 
 from sgr_deep_research.core.agent_definition import ExecutionConfig, LLMConfig, PromptsConfig
 from sgr_deep_research.core.base_agent import BaseAgent
+from sgr_deep_research.core.services.tool_schema_cache import ToolSchemaCache
 from sgr_deep_research.core.tools import (
     BaseTool,
     ClarificationTool,
     CreateReportTool,
     FinalAnswerTool,
+    MultiWebSearchTool,
     WebSearchTool,
 )
 
@@ -55,8 +57,9 @@ class ToolCallingAgent(BaseAgent):
         if self._context.searches_used >= self.max_searches:
             tools -= {
                 WebSearchTool,
+                MultiWebSearchTool,
             }
-        return [pydantic_function_tool(tool, name=tool.tool_name, description="") for tool in tools]
+        return [ToolSchemaCache.get(tool) for tool in tools]
 
     async def _reasoning_phase(self) -> None:
         """No explicit reasoning phase, reasoning is done internally by LLM."""
@@ -68,16 +71,20 @@ class ToolCallingAgent(BaseAgent):
             messages=await self._prepare_context(),
             max_tokens=self.llm_config.max_tokens,
             temperature=self.llm_config.temperature,
+            stream_options={"include_usage": True},
             tools=await self._prepare_tools(),
             tool_choice=self.tool_choice,
         ) as stream:
             async for event in stream:
                 if event.type == "chunk":
-                    self.streaming_generator.add_chunk(event)
-        tool = (await stream.get_final_completion()).choices[0].message.tool_calls[0].function.parsed_arguments
+                    self.streaming_generator.add_chunk(event.chunk)
+        completion = await self._final_completion(stream, "action_selection")
+        tools = [tool_call.function.parsed_arguments for tool_call in completion.choices[0].message.tool_calls]
 
-        if not isinstance(tool, BaseTool):
+        if not tools or not all(isinstance(tool, BaseTool) for tool in tools):
             raise ValueError("Selected tool is not a valid BaseTool instance")
+        # All independent tool calls of the step are executed together in the action phase
+        self._tool_calls = self._select_tool_calls(tools)
         self.conversation.append(
             {
                 "role": "assistant",
@@ -85,25 +92,23 @@ class ToolCallingAgent(BaseAgent):
                 "tool_calls": [
                     {
                         "type": "function",
-                        "id": f"{self._context.iteration}-action",
+                        "id": call_id,
                         "function": {
                             "name": tool.tool_name,
                             "arguments": tool.model_dump_json(),
                         },
                     }
+                    for call_id, tool in self._tool_calls
                 ],
             }
         )
-        self.streaming_generator.add_tool_call(
-            f"{self._context.iteration}-action", tool.tool_name, tool.model_dump_json()
-        )
-        return tool
+        for call_id, tool in self._tool_calls:
+            self.streaming_generator.add_tool_call(call_id, tool.tool_name, tool.model_dump_json())
+        return self._tool_calls[0][1]
 
     async def _action_phase(self, tool: BaseTool) -> str:
-        result = await tool(self._context)
-        self.conversation.append(
-            {"role": "tool", "content": result, "tool_call_id": f"{self._context.iteration}-action"}
-        )
-        self.streaming_generator.add_chunk_from_str(f"{result}\n")
-        self._log_tool_execution(tool, result)
-        return result
+        calls = self._tool_calls
+        if not calls or calls[0][1] is not tool:
+            calls = [(f"{self._context.iteration}-action", tool)]
+        results = await self._execute_tool_calls(calls)
+        return "\n".join(results)
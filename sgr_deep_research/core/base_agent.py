@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import os
@@ -7,7 +8,8 @@ from datetime import datetime
 from typing import Type
 
 from openai import AsyncOpenAI
-from openai.types.chat import ChatCompletionFunctionToolParam
+from openai.lib.streaming.chat import AsyncChatCompletionStream
+from openai.types.chat import ChatCompletionFunctionToolParam, ParsedChatCompletion
 
 from sgr_deep_research.core.agent_definition import ExecutionConfig, LLMConfig, PromptsConfig
 from sgr_deep_research.core.models import AgentStatesEnum, ResearchContext
@@ -17,6 +19,8 @@ from sgr_deep_research.core.stream import OpenAIStreamingGenerator
 from sgr_deep_research.core.tools import (
     BaseTool,
     ClarificationTool,
+    FinalAnswerTool,
+    MCPBaseTool,
     ReasoningTool,
 )
 
@@ -49,17 +53,37 @@ class BaseAgent(AgentRegistryMixin):
         self.task = task
         self.toolkit = toolkit or []
 
-        self._context = ResearchContext()
+        self._context = ResearchContext(
+            task=task,
+            max_searches=execution_config.max_searches,
+            search_semaphore=asyncio.Semaphore(execution_config.max_concurrent_searches),
+        )
         self.conversation = []
         self.log = []
+        # (tool_call_id, tool) of the current step, run together by _execute_tool_calls
+        self._tool_calls: list[tuple[str, BaseTool]] = []
+        self.max_parallel_tool_calls = execution_config.max_parallel_tool_calls
         self.max_iterations = execution_config.max_iterations
         self.max_clarifications = execution_config.max_clarifications
 
         self.openai_client = openai_client
         self.llm_config = llm_config
         self.prompts_config = prompts_config
+        self.execution_config = execution_config
+
+        self.streaming_generator = self.create_streaming_generator()
 
-        self.streaming_generator = OpenAIStreamingGenerator(model=self.id)
+    def create_streaming_generator(self) -> OpenAIStreamingGenerator:
+        """Create output stream of the agent configured by its execution
+        config."""
+        return OpenAIStreamingGenerator(
+            model=self.id,
+            max_size=self.execution_config.stream_buffer_size,
+            max_bytes=self.execution_config.stream_buffer_bytes,
+            overflow=self.execution_config.stream_overflow,
+            coalesce_ms=self.execution_config.stream_coalesce_ms,
+            coalesce_bytes=self.execution_config.stream_coalesce_bytes,
+        )
 
     async def provide_clarification(self, clarifications: str):
         """Receive clarification from external source (e.g. user input)"""
@@ -107,16 +131,57 @@ class BaseAgent(AgentRegistryMixin):
     🔍 Result: '{result[:400]}...'
 ###############################################"""
         )
-        self.log.append(
-            {
-                "step_number": self._context.iteration,
-                "timestamp": datetime.now().isoformat(),
-                "step_type": "tool_execution",
-                "tool_name": tool.tool_name,
-                "agent_tool_context": tool.model_dump(),
-                "agent_tool_execution_result": result,
-            }
-        )
+        entry = {
+            "step_number": self._context.iteration,
+            "timestamp": datetime.now().isoformat(),
+            "step_type": "tool_execution",
+            "tool_name": tool.tool_name,
+            "agent_tool_context": tool.model_dump(),
+            "agent_tool_execution_result": result,
+        }
+        if isinstance(tool, MCPBaseTool) and tool.spill_file:
+            entry["agent_tool_result_file"] = tool.spill_file
+        self.log.append(entry)
+
+    def _select_tool_calls(self, tools: list[BaseTool]) -> list[tuple[str, BaseTool]]:
+        """Assign tool call ids to the tools selected for the current step.
+
+        Clarification and final answer change the agent state, so such a
+        call is executed alone and other calls of the step are dropped.
+        """
+        for tool in tools:
+            if isinstance(tool, (ClarificationTool, FinalAnswerTool)):
+                tools = [tool]
+                break
+        if len(tools) == 1:
+            return [(f"{self._context.iteration}-action", tools[0])]
+        return [(f"{self._context.iteration}-action-{i}", tool) for i, tool in enumerate(tools, 1)]
+
+    async def _execute_tool_calls(self, calls: list[tuple[str, BaseTool]]) -> list[str]:
+        """Run tool calls of one step concurrently (at most
+        max_parallel_tool_calls at once).
+
+        Results are added to the conversation in call order, after all
+        calls finished, so the conversation does not depend on which
+        call finishes first.
+
+        Raises:
+            Exception: First error of the calls, once all of them finished
+        """
+        semaphore = asyncio.Semaphore(self.max_parallel_tool_calls)
+
+        async def run(tool: BaseTool) -> str:
+            async with semaphore:
+                return await tool(self._context)
+
+        results = await asyncio.gather(*(run(tool) for _, tool in calls), return_exceptions=True)
+        if errors := [result for result in results if isinstance(result, BaseException)]:
+            raise errors[0]
+        for (call_id, tool), result in zip(calls, results):
+            self.conversation.append({"role": "tool", "content": result, "tool_call_id": call_id})
+            self.streaming_generator.add_chunk_from_str(f"{result}\n")
+            self._log_tool_execution(tool, result)
+        return results
 
     def _save_agent_log(self):
         from sgr_deep_research.core.agent_config import GlobalConfig
@@ -129,11 +194,32 @@ class BaseAgent(AgentRegistryMixin):
             "model_config": self.llm_config.model_dump(exclude={"api_key", "proxy"}),
             "task": self.task,
             "toolkit": [tool.tool_name for tool in self.toolkit],
+            "usage": self._context.usage.model_dump(),
+            "phase_usage": {phase: usage.model_dump() for phase, usage in self._context.phase_usage.items()},
             "log": self.log,
         }
 
         json.dump(agent_log, open(filepath, "w", encoding="utf-8"), indent=2, ensure_ascii=False)
 
+    async def _final_completion(self, stream: AsyncChatCompletionStream, phase: str) -> ParsedChatCompletion:
+        """Get final completion of LLM stream, accounting its token usage
+        to the phase."""
+        completion = await stream.get_final_completion()
+        self._context.add_usage(completion.usage, phase)
+        if completion.usage is not None:
+            self.log.append(
+                {
+                    "step_number": self._context.iteration,
+                    "timestamp": datetime.now().isoformat(),
+                    "step_type": "llm_usage",
+                    "phase": phase,
+                    "usage": completion.usage.model_dump(
+                        include={"prompt_tokens", "completion_tokens", "total_tokens"}
+                    ),
+                }
+            )
+        return completion
+
     async def _prepare_context(self) -> list[dict]:
         """Prepare conversation context with system prompt."""
         return [
@@ -188,7 +274,7 @@ class BaseAgent(AgentRegistryMixin):
                 if isinstance(action_tool, ClarificationTool):
                     self.logger.info("\n⏸️  Research paused - please answer questions")
                     self._context.state = AgentStatesEnum.WAITING_FOR_CLARIFICATION
-                    self.streaming_generator.finish()
+                    self.streaming_generator.finish(usage=self._context.usage.model_dump())
                     self._context.clarification_received.clear()
                     await self._context.clarification_received.wait()
                     continue
@@ -199,5 +285,8 @@ class BaseAgent(AgentRegistryMixin):
             traceback.print_exc()
         finally:
             if self.streaming_generator is not None:
-                self.streaming_generator.finish()
+                self.streaming_generator.finish(usage=self._context.usage.model_dump())
+                if self._context.state in AgentStatesEnum.FINISH_STATES.value:
+                    # replay data of a finished agent is dropped once its output is read
+                    self.streaming_generator.release()
             self._save_agent_log()
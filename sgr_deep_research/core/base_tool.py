@@ -1,17 +1,19 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import os
 from typing import TYPE_CHECKING, ClassVar
 
-from fastmcp import Client
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from sgr_deep_research.core.agent_config import GlobalConfig
+from sgr_deep_research.core.services.mcp_result import serialize_mcp_content, spill_mcp_content
 from sgr_deep_research.core.services.registry import ToolRegistry
 
 if TYPE_CHECKING:
     from sgr_deep_research.core.models import ResearchContext
+    from sgr_deep_research.core.services.mcp_session_pool import MCPSessionPool
 
 
 logger = logging.getLogger(__name__)
@@ -43,17 +45,31 @@ class BaseTool(BaseModel, ToolRegistryMixin):
 class MCPBaseTool(BaseTool):
     """Base model for MCP Tool schema."""
 
-    _client: ClassVar[Client | None] = None
+    _sessions: ClassVar[MCPSessionPool | None] = None
+    _spill_file: str | None = PrivateAttr(default=None)
+
+    @property
+    def spill_file(self) -> str | None:
+        """File with the full result if it was truncated to
+        mcp_context_limit."""
+        return self._spill_file
 
     async def __call__(self, _context) -> str:
         config = GlobalConfig()
         payload = self.model_dump()
         try:
-            async with self._client:
-                result = await self._client.call_tool(self.tool_name, payload)
-                return json.dumps([m.model_dump_json() for m in result.content], ensure_ascii=False)[
-                    : config.execution.mcp_context_limit
-                ]
+            result = await self._sessions.call_tool(self.tool_name, payload)
+            content, truncated = serialize_mcp_content(result.content, config.execution.mcp_context_limit)
+            if truncated and config.execution.mcp_spill_results:
+                await self._spill(result.content, os.path.join(config.execution.logs_dir, "mcp_results"))
+            return content
         except Exception as e:
             logger.error(f"Error processing MCP tool {self.tool_name}: {e}")
             return f"Error: {e}"
+
+    async def _spill(self, items: list, directory: str) -> None:
+        try:
+            self._spill_file = await asyncio.to_thread(spill_mcp_content, items, directory, self.tool_name)
+            logger.info(f"MCP tool {self.tool_name} result truncated, full result saved to {self._spill_file}")
+        except OSError as e:
+            logger.warning(f"Failed to save full result of MCP tool {self.tool_name}: {e}")
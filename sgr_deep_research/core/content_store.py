@@ -0,0 +1,175 @@
+import logging
+import tempfile
+import weakref
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from typing import ClassVar, Self
+
+logger = logging.getLogger(__name__)
+
+
+class _Segment:
+    """Anonymous spool file holding contents of many handles.
+
+    The file is closed (and its disk space released) once the store
+    moved on to a new segment and no handle references it anymore.
+    """
+
+    def __init__(self, directory: str | None):
+        self.file = tempfile.TemporaryFile(dir=directory)
+        self.size = 0
+        self.refs = 0
+        self.retired = False
+
+    def append(self, data: bytes) -> int:
+        offset = self.size
+        self.file.seek(offset)
+        self.file.write(data)
+        self.size += len(data)
+        return offset
+
+    def read(self, offset: int, length: int) -> bytes:
+        self.file.seek(offset)
+        return self.file.read(length)
+
+    def release(self) -> None:
+        self.refs -= 1
+        self._close_if_unused()
+
+    def retire(self) -> None:
+        self.retired = True
+        self._close_if_unused()
+
+    def _close_if_unused(self) -> None:
+        if self.retired and self.refs == 0 and not self.file.closed:
+            self.file.close()
+
+
+class ContentHandle:
+    """Reference to text kept in a ContentStore, sliced on demand.
+
+    Handles are immutable and cheap to copy; the text is stored as UTF-8
+    chunks so a slice only decodes the chunks it overlaps.
+    """
+
+    __slots__ = ("_segment", "_starts", "_spans", "char_count", "__weakref__")
+
+    def __init__(self, segment: _Segment, starts: list[int], spans: list[tuple[int, int]], char_count: int):
+        self._segment = segment
+        # character offset of each chunk and its (byte offset, byte length) in the segment
+        self._starts = starts
+        self._spans = spans
+        self.char_count = char_count
+
+    def __len__(self) -> int:
+        return self.char_count
+
+    def __repr__(self) -> str:
+        return f"ContentHandle(char_count={self.char_count}, chunks={len(self._spans)})"
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> Self:
+        return self
+
+    def chunks(self) -> Iterator[str]:
+        """Iterate over the whole text chunk by chunk."""
+        for offset, length in self._spans:
+            yield self._segment.read(offset, length).decode()
+
+    def read(self, start: int = 0, stop: int | None = None) -> str:
+        """Read text[start:stop] (non-negative bounds, stop defaults to the
+        end)."""
+        stop = self.char_count if stop is None else min(stop, self.char_count)
+        if start >= stop:
+            return ""
+        first = bisect_right(self._starts, start) - 1
+        last = bisect_right(self._starts, stop - 1) - 1
+        offset = self._spans[first][0]
+        end = self._spans[last][0] + self._spans[last][1]
+        text = self._segment.read(offset, end - offset).decode()
+        base = self._starts[first]
+        return text[start - base : stop - base]
+
+
+class ContentStore:
+    """Spool of page contents on disk.
+
+    Extracted pages can be megabytes each while only a short prefix is
+    ever shown to the LLM. Contents are streamed into anonymous temporary
+    files in chunks, and sources keep just a ContentHandle, so long-lived
+    agents do not hold whole pages in memory. Disk space of a segment is
+    released once all its handles are garbage collected.
+    """
+
+    _default: ClassVar["ContentStore | None"] = None
+
+    def __init__(self, directory: str | None = None, chunk_chars: int = 65536, segment_size: int = 64 * 1024 * 1024):
+        self.directory = directory
+        self.chunk_chars = chunk_chars
+        self.segment_size = segment_size
+        self._segment: _Segment | None = None
+
+    @classmethod
+    def default(cls) -> "ContentStore":
+        """Get process-wide content store."""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def _current_segment(self) -> _Segment:
+        if self._segment is None or self._segment.size >= self.segment_size:
+            if self._segment is not None:
+                self._segment.retire()
+            self._segment = _Segment(self.directory)
+        return self._segment
+
+    def write(self, chunks: Iterable[str]) -> ContentHandle:
+        """Store text streamed as chunks of any size.
+
+        Args:
+            chunks: Consecutive parts of the text
+
+        Returns:
+            Handle of the stored text
+        """
+        segment = self._current_segment()
+        starts: list[int] = []
+        spans: list[tuple[int, int]] = []
+        char_count = 0
+        pending: list[str] = []
+        pending_chars = 0
+
+        def flush():
+            nonlocal pending, pending_chars, char_count
+            data = "".join(pending).encode()
+            starts.append(char_count)
+            spans.append((segment.append(data), len(data)))
+            char_count += pending_chars
+            pending, pending_chars = [], 0
+
+        for chunk in chunks:
+            if chunk:
+                pending.append(chunk)
+                pending_chars += len(chunk)
+            if pending_chars >= self.chunk_chars:
+                flush()
+        if pending_chars or not spans:
+            flush()
+
+        handle = ContentHandle(segment, starts, spans, char_count)
+        segment.refs += 1
+        weakref.finalize(handle, segment.release)
+        return handle
+
+    def put(self, text: str) -> ContentHandle:
+        """Store text."""
+        return self.write(text[i : i + self.chunk_chars] for i in range(0, len(text), self.chunk_chars))
+
+    def close(self) -> None:
+        """Stop writing to the current segment (it is closed once its
+        handles are gone)."""
+        if self._segment is not None:
+            self._segment.retire()
+            self._segment = None
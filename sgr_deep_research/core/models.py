@@ -3,19 +3,54 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+from sgr_deep_research.core.content_store import ContentHandle, ContentStore
 
 
 class SourceData(BaseModel):
-    """Data about a research source."""
+    """Data about a research source.
+
+    Full scraped content is kept in the ContentStore: pass or assign
+    full_content to store it, and use read_content() to get a slice
+    without loading the whole page.
+    """
+
+    model_config = {"arbitrary_types_allowed": True}
 
     number: int = Field(description="Citation number")
     title: str | None = Field(default="Untitled", description="Page title")
     url: str = Field(description="Source URL")
     snippet: str = Field(default="", description="Search snippet or summary")
-    full_content: str = Field(default="", description="Full scraped content")
+    content: ContentHandle | None = Field(
+        default=None, exclude=True, description="Handle of full scraped content in the content store"
+    )
     char_count: int = Field(default=0, description="Character count of full content")
 
+    @model_validator(mode="before")
+    @classmethod
+    def store_full_content(cls, data: Any) -> Any:
+        if isinstance(data, dict) and "full_content" in data:
+            data = dict(data)
+            if full_content := data.pop("full_content"):
+                data["content"] = ContentStore.default().put(full_content)
+            data.setdefault("char_count", len(full_content or ""))
+        return data
+
+    @property
+    def full_content(self) -> str:
+        """Whole scraped content (prefer read_content() for a part)."""
+        return self.read_content()
+
+    @full_content.setter
+    def full_content(self, value: str) -> None:
+        self.content = ContentStore.default().put(value) if value else None
+        self.char_count = len(value)
+
+    def read_content(self, start: int = 0, stop: int | None = None) -> str:
+        """Read full_content[start:stop] from the content store."""
+        return self.content.read(start, stop) if self.content is not None else ""
+
     def __str__(self):
         return f"[{self.number}] {self.title or 'Untitled'} - {self.url}"
 
@@ -32,6 +67,23 @@ class SearchResult(BaseModel):
         return f"Search: '{self.query}' ({len(self.citations)} sources)"
 
 
+class TokenUsage(BaseModel):
+    """LLM token usage counters."""
+
+    prompt_tokens: int = Field(default=0, description="Number of prompt tokens")
+    completion_tokens: int = Field(default=0, description="Number of completion tokens")
+    total_tokens: int = Field(default=0, description="Total number of tokens")
+
+    def add(self, usage: Any) -> None:
+        """Add usage of a completion (CompletionUsage or None if not
+        reported)."""
+        if usage is None:
+            return
+        self.prompt_tokens += usage.prompt_tokens
+        self.completion_tokens += usage.completion_tokens
+        self.total_tokens += usage.total_tokens
+
+
 class AgentStatesEnum(str, Enum):
     INITED = "inited"
     RESEARCHING = "researching"
@@ -46,6 +98,9 @@ class AgentStatesEnum(str, Enum):
 class ResearchContext(BaseModel):
     model_config = {"arbitrary_types_allowed": True}
 
+    task: str | None = Field(
+        default=None, exclude=True, description="Research task of the agent, used to rank extracted passages"
+    )
     current_step_reasoning: Any = None
     execution_result: str | None = None
 
@@ -56,14 +111,56 @@ class ResearchContext(BaseModel):
     sources: dict[str, SourceData] = Field(default_factory=dict, description="Dictionary of found sources")
 
     searches_used: int = Field(default=0, description="Number of searches performed")
+    max_searches: int | None = Field(default=None, description="Maximum number of searches (unlimited if None)")
 
     clarifications_used: int = Field(default=0, description="Number of clarifications requested")
+    usage: TokenUsage = Field(default_factory=TokenUsage, description="Total LLM token usage")
+    phase_usage: dict[str, TokenUsage] = Field(
+        default_factory=dict, description="LLM token usage by phase (reasoning, action_selection, tool)"
+    )
     clarification_received: asyncio.Event = Field(
         default_factory=asyncio.Event, description="Event for clarification synchronization"
     )
+    search_service: Any = Field(
+        default=None, exclude=True, description="Shared search backend service of the agent search config"
+    )
+    search_semaphore: asyncio.Semaphore | None = Field(
+        default=None, exclude=True, description="Limit of concurrent search queries of the agent"
+    )
+
+    def add_usage(self, usage: Any, phase: str) -> None:
+        """Account token usage of an LLM call made in the given phase.
+
+        Tools calling an LLM themselves should report it with phase
+        "tool".
+        """
+        self.usage.add(usage)
+        self.phase_usage.setdefault(phase, TokenUsage()).add(usage)
+
+    def reserve_searches(self, count: int) -> int:
+        """Reserve up to count searches of the budget, counting them as
+        used.
+
+        Search tools call it before their first await, so tool calls
+        running concurrently cannot exceed max_searches together.
+        Searches that fail are given back with release_searches().
+
+        Returns:
+            Number of searches reserved
+        """
+        if self.max_searches is not None:
+            count = min(count, max(self.max_searches - self.searches_used, 0))
+        self.searches_used += count
+        return count
+
+    def release_searches(self, count: int) -> None:
+        """Give back reserved searches that were not performed."""
+        self.searches_used -= count
 
     def agent_state(self) -> dict:
-        return self.model_dump(exclude={"searches", "sources", "clarification_received"})
+        return self.model_dump(
+            exclude={"searches", "sources", "clarification_received", "search_service", "search_semaphore"}
+        )
 
 
 class AgentStatistics(BaseModel):
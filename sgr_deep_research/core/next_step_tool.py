@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import copy
 import logging
 import operator
 from abc import ABC
+from collections import OrderedDict
 from functools import reduce
-from typing import Annotated, Literal, Type, TypeVar
+from typing import Annotated, Any, ClassVar, Literal, Type, TypeVar
 
 from pydantic import BaseModel, Field, create_model
 
@@ -22,6 +24,20 @@ class NextStepToolStub(ReasoningTool, ABC):
 
     function: T = Field(description="Select the appropriate tool for the next step")
 
+    @classmethod
+    def model_json_schema(cls, *args, **kwargs) -> dict[str, Any]:
+        """JSON schema generated once per built class.
+
+        Only the default schema is cached; a copy is returned because
+        consumers (e.g. openai strict schema conversion) mutate it in
+        place.
+        """
+        if args or kwargs:
+            return super().model_json_schema(*args, **kwargs)
+        if "_json_schema" not in cls.__dict__:
+            cls._json_schema = super().model_json_schema()
+        return copy.deepcopy(cls._json_schema)
+
 
 class DiscriminantToolMixin(BaseModel):
     tool_name_discriminator: str = Field(..., description="Tool name discriminator")
@@ -35,7 +51,14 @@ class DiscriminantToolMixin(BaseModel):
 
 class NextStepToolsBuilder:
     """SGR Core - Builder for NextStepTool with a dynamic union tool function type on
-    pydantic models level."""
+    pydantic models level.
+
+    Built models are cached by tool set, so pydantic validators and JSON
+    schema are reused across reasoning steps and agents.
+    """
+
+    cache_size: ClassVar[int] = 128
+    _cache: ClassVar[OrderedDict[frozenset[type], Type[NextStepToolStub]]] = OrderedDict()
 
     @classmethod
     def _create_discriminant_tool(cls, tool_class: Type[T]) -> Type[BaseModel]:
@@ -60,8 +83,23 @@ class NextStepToolsBuilder:
 
     @classmethod
     def build_NextStepTools(cls, tools_list: list[Type[T]]) -> Type[NextStepToolStub]:  # noqa
-        return create_model(
+        key = frozenset(tools_list)
+        if (model := cls._cache.get(key)) is not None:
+            cls._cache.move_to_end(key)
+            return model
+
+        model = create_model(
             "NextStepTools",
             __base__=NextStepToolStub,
             function=(cls._create_tool_types_union(tools_list), Field()),
         )
+        cls._cache[key] = model
+        if len(cls._cache) > cls.cache_size:
+            cls._cache.popitem(last=False)
+        logger.debug(f"Built NextStepTools for {len(key)} tools ({len(cls._cache)} cached)")
+        return model
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached NextStepTools models."""
+        cls._cache.clear()
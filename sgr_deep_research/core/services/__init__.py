@@ -1,14 +1,30 @@
 """Services module for external integrations and business logic."""
 
+from sgr_deep_research.core.services.agent_store import AgentStore
+from sgr_deep_research.core.services.local_search import LocalSearchService
 from sgr_deep_research.core.services.mcp_service import MCP2ToolConverter
+from sgr_deep_research.core.services.mcp_session_pool import MCPSessionPool
+from sgr_deep_research.core.services.page_cache import PageCache
+from sgr_deep_research.core.services.passage_selector import PassageSelector
 from sgr_deep_research.core.services.prompt_loader import PromptLoader
 from sgr_deep_research.core.services.registry import AgentRegistry, ToolRegistry
+from sgr_deep_research.core.services.search_backend import SearchBackend
+from sgr_deep_research.core.services.search_cache import SearchCache
 from sgr_deep_research.core.services.tavily_search import TavilySearchService
+from sgr_deep_research.core.services.tool_schema_cache import ToolSchemaCache
 
 __all__ = [
+    "SearchBackend",
     "TavilySearchService",
+    "LocalSearchService",
     "MCP2ToolConverter",
+    "MCPSessionPool",
     "ToolRegistry",
     "AgentRegistry",
+    "AgentStore",
     "PromptLoader",
+    "ToolSchemaCache",
+    "SearchCache",
+    "PageCache",
+    "PassageSelector",
 ]
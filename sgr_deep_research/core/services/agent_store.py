@@ -0,0 +1,456 @@
+import base64
+import heapq
+import json
+import logging
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from collections import OrderedDict, deque
+from datetime import datetime
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Self
+
+from pydantic import BaseModel, Field
+
+from sgr_deep_research.core.models import AgentStatesEnum
+
+if TYPE_CHECKING:
+    from sgr_deep_research.core.agent_config import AgentStoreConfig
+    from sgr_deep_research.core.base_agent import BaseAgent
+
+logger = logging.getLogger(__name__)
+
+
+class AgentSummary(BaseModel):
+    """Lightweight agent description used for listings."""
+
+    agent_id: str = Field(description="Agent ID")
+    task: str = Field(description="Agent task")
+    state: AgentStatesEnum = Field(description="Agent state")
+    creation_time: datetime = Field(description="Agent creation time")
+
+    @classmethod
+    def from_agent(cls, agent: "BaseAgent") -> Self:
+        return cls(agent_id=agent.id, task=agent.task, state=agent._context.state, creation_time=agent.creation_time)
+
+    def sort_key(self) -> tuple[float, str]:
+        """Listing order key: creation time, agent id as tie-breaker."""
+        return self.creation_time.timestamp(), self.agent_id
+
+
+class AgentSnapshot(AgentSummary):
+    """Serialized agent kept after it is evicted from memory."""
+
+    context: dict[str, Any] = Field(default_factory=dict, description="Dumped ResearchContext")
+    conversation: list[dict[str, Any]] = Field(default_factory=list, description="Agent conversation")
+    log: list[dict[str, Any]] = Field(default_factory=list, description="Agent execution log")
+
+    @classmethod
+    def from_agent(cls, agent: "BaseAgent") -> Self:
+        return cls(
+            agent_id=agent.id,
+            task=agent.task,
+            state=agent._context.state,
+            creation_time=agent.creation_time,
+            context=agent._context.model_dump(mode="json", exclude={"clarification_received"}),
+            conversation=agent.conversation,
+            log=agent.log,
+        )
+
+    def summary(self) -> AgentSummary:
+        return AgentSummary(agent_id=self.agent_id, task=self.task, state=self.state, creation_time=self.creation_time)
+
+
+class AgentFilter(BaseModel):
+    """Agent listing filter, all conditions are optional."""
+
+    states: set[AgentStatesEnum] | None = Field(default=None, description="Match any of these states")
+    created_after: datetime | None = Field(default=None, description="Created at or after this time")
+    created_before: datetime | None = Field(default=None, description="Created before this time")
+
+    @property
+    def after_ts(self) -> float | None:
+        return self.created_after.timestamp() if self.created_after else None
+
+    @property
+    def before_ts(self) -> float | None:
+        return self.created_before.timestamp() if self.created_before else None
+
+    def matches(self, summary: AgentSummary) -> bool:
+        creation_ts = summary.creation_time.timestamp()
+        return (
+            (not self.states or summary.state in self.states)
+            and (self.after_ts is None or creation_ts >= self.after_ts)
+            and (self.before_ts is None or creation_ts < self.before_ts)
+        )
+
+
+class AgentPage(BaseModel):
+    """Page of agent summaries, newest first."""
+
+    items: list[AgentSummary] = Field(default_factory=list, description="Agents on this page")
+    total: int = Field(default=0, description="Total number of agents matching the filter")
+    next_cursor: str | None = Field(default=None, description="Cursor of the next page, None on the last page")
+
+
+class SnapshotBackend(ABC):
+    """Storage for snapshots of agents evicted from memory.
+
+    Snapshots never change state, so backends keep them indexed by state
+    and creation time to serve filtered listings in O(page).
+    """
+
+    @abstractmethod
+    def save(self, snapshot: AgentSnapshot) -> None:
+        """Store snapshot, replacing existing one with the same agent id."""
+
+    @abstractmethod
+    def get(self, agent_id: str) -> AgentSnapshot | None:
+        """Get snapshot by agent id."""
+
+    @abstractmethod
+    def query(self, agent_filter: AgentFilter, below: tuple[float, str] | None, limit: int) -> list[AgentSummary]:
+        """Get up to limit matching summaries with sort key lower than
+        below, newest first."""
+
+    @abstractmethod
+    def count(self, agent_filter: AgentFilter) -> int:
+        """Count snapshots matching the filter."""
+
+    @abstractmethod
+    def __contains__(self, agent_id: str) -> bool: ...
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all snapshots."""
+
+    def close(self) -> None:
+        """Release backend resources."""
+
+
+class InMemorySnapshotBackend(SnapshotBackend):
+    """Snapshots in process memory with LRU eviction and optional TTL."""
+
+    def __init__(self, max_size: int = 10000, ttl: int | None = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._items: OrderedDict[str, AgentSnapshot] = OrderedDict()
+        self._stored_at: dict[str, float] = {}
+        # (stored_at, agent_id) in storage order, for TTL expiration
+        self._expiry: deque[tuple[float, str]] = deque()
+        # sort keys of snapshots by state, ascending
+        self._index: dict[AgentStatesEnum, list[tuple[float, str]]] = {}
+
+    def _remove(self, agent_id: str) -> None:
+        snapshot = self._items.pop(agent_id)
+        del self._stored_at[agent_id]
+        keys = self._index[snapshot.state]
+        del keys[bisect_left(keys, snapshot.sort_key())]
+
+    def _purge_expired(self) -> None:
+        if self.ttl is None:
+            return
+        deadline = time.monotonic() - self.ttl
+        while self._expiry and self._expiry[0][0] < deadline:
+            stored_at, agent_id = self._expiry.popleft()
+            if self._stored_at.get(agent_id) == stored_at:
+                self._remove(agent_id)
+
+    def save(self, snapshot: AgentSnapshot) -> None:
+        self._purge_expired()
+        if snapshot.agent_id in self._items:
+            self._remove(snapshot.agent_id)
+        stored_at = time.monotonic()
+        self._items[snapshot.agent_id] = snapshot
+        self._stored_at[snapshot.agent_id] = stored_at
+        if self.ttl is not None:
+            self._expiry.append((stored_at, snapshot.agent_id))
+        insort(self._index.setdefault(snapshot.state, []), snapshot.sort_key())
+        while len(self._items) > self.max_size:
+            self._remove(next(iter(self._items)))
+
+    def get(self, agent_id: str) -> AgentSnapshot | None:
+        self._purge_expired()
+        if (snapshot := self._items.get(agent_id)) is not None:
+            self._items.move_to_end(agent_id)
+        return snapshot
+
+    def _bounds(self, keys: list[tuple[float, str]], agent_filter: AgentFilter, below: tuple[float, str] | None):
+        lo = bisect_left(keys, (agent_filter.after_ts,)) if agent_filter.after_ts is not None else 0
+        hi = bisect_left(keys, (agent_filter.before_ts,)) if agent_filter.before_ts is not None else len(keys)
+        if below is not None:
+            hi = min(hi, bisect_left(keys, below))
+        return lo, hi
+
+    def query(self, agent_filter: AgentFilter, below: tuple[float, str] | None, limit: int) -> list[AgentSummary]:
+        self._purge_expired()
+        ranges = []
+        for state in agent_filter.states or list(self._index):
+            keys = self._index.get(state, [])
+            lo, hi = self._bounds(keys, agent_filter, below)
+            ranges.append(map(keys.__getitem__, range(hi - 1, lo - 1, -1)))
+        merged = heapq.merge(*ranges, reverse=True)
+        return [self._items[agent_id].summary() for _, agent_id in islice(merged, limit)]
+
+    def count(self, agent_filter: AgentFilter) -> int:
+        self._purge_expired()
+        total = 0
+        for state in agent_filter.states or list(self._index):
+            lo, hi = self._bounds(self._index.get(state, []), agent_filter, None)
+            total += hi - lo
+        return total
+
+    def __contains__(self, agent_id: str) -> bool:
+        self._purge_expired()
+        return agent_id in self._items
+
+    def __len__(self) -> int:
+        self._purge_expired()
+        return len(self._items)
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._stored_at.clear()
+        self._expiry.clear()
+        self._index.clear()
+
+
+class SQLiteSnapshotBackend(SnapshotBackend):
+    """Snapshots persisted in a SQLite database, survive server
+    restarts."""
+
+    def __init__(self, path: str = "agents.db", ttl: int | None = None):
+        self.path = path
+        self.ttl = ttl
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS agent_snapshots ("
+                "agent_id TEXT PRIMARY KEY, "
+                "task TEXT NOT NULL, "
+                "state TEXT NOT NULL, "
+                "creation_time REAL NOT NULL, "
+                "stored_at REAL NOT NULL, "
+                "data TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS agent_snapshots_state_time "
+                "ON agent_snapshots (state, creation_time, agent_id)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS agent_snapshots_time ON agent_snapshots (creation_time, agent_id)"
+            )
+
+    def _min_stored_at(self) -> float:
+        return time.time() - self.ttl if self.ttl is not None else float("-inf")
+
+    def _where(self, agent_filter: AgentFilter, below: tuple[float, str] | None = None) -> tuple[str, list]:
+        clauses, params = ["stored_at >= ?"], [self._min_stored_at()]
+        if agent_filter.states:
+            clauses.append(f"state IN ({', '.join('?' * len(agent_filter.states))})")
+            params.extend(state.value for state in agent_filter.states)
+        if agent_filter.after_ts is not None:
+            clauses.append("creation_time >= ?")
+            params.append(agent_filter.after_ts)
+        if agent_filter.before_ts is not None:
+            clauses.append("creation_time < ?")
+            params.append(agent_filter.before_ts)
+        if below is not None:
+            clauses.append("(creation_time, agent_id) < (?, ?)")
+            params.extend(below)
+        return " AND ".join(clauses), params
+
+    def save(self, snapshot: AgentSnapshot) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO agent_snapshots VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    snapshot.agent_id,
+                    snapshot.task,
+                    snapshot.state.value,
+                    snapshot.creation_time.timestamp(),
+                    time.time(),
+                    snapshot.model_dump_json(),
+                ),
+            )
+            if self.ttl is not None:
+                self._conn.execute("DELETE FROM agent_snapshots WHERE stored_at < ?", (self._min_stored_at(),))
+
+    def get(self, agent_id: str) -> AgentSnapshot | None:
+        row = self._conn.execute(
+            "SELECT data FROM agent_snapshots WHERE agent_id = ? AND stored_at >= ?",
+            (agent_id, self._min_stored_at()),
+        ).fetchone()
+        return AgentSnapshot.model_validate_json(row[0]) if row else None
+
+    def query(self, agent_filter: AgentFilter, below: tuple[float, str] | None, limit: int) -> list[AgentSummary]:
+        where, params = self._where(agent_filter, below)
+        rows = self._conn.execute(
+            f"SELECT agent_id, task, state, creation_time FROM agent_snapshots WHERE {where} "
+            "ORDER BY creation_time DESC, agent_id DESC LIMIT ?",
+            (*params, limit),
+        )
+        return [
+            AgentSummary(agent_id=agent_id, task=task, state=state, creation_time=datetime.fromtimestamp(creation_time))
+            for agent_id, task, state, creation_time in rows
+        ]
+
+    def count(self, agent_filter: AgentFilter) -> int:
+        where, params = self._where(agent_filter)
+        return self._conn.execute(f"SELECT COUNT(*) FROM agent_snapshots WHERE {where}", params).fetchone()[0]
+
+    def __contains__(self, agent_id: str) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM agent_snapshots WHERE agent_id = ? AND stored_at >= ?",
+            (agent_id, self._min_stored_at()),
+        ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return self.count(AgentFilter())
+
+    def clear(self) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM agent_snapshots")
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class AgentStore:
+    """Storage of agents served by the API.
+
+    Running agents are kept in memory as live objects. Finished agents
+    (AgentStatesEnum.FINISH_STATES) beyond max_finished_agents are
+    evicted, oldest first, into the snapshot backend, so their state
+    remains available after they are dropped from memory.
+    """
+
+    def __init__(self, backend: SnapshotBackend | None = None, max_finished_agents: int = 100):
+        self.backend = backend if backend is not None else InMemorySnapshotBackend()
+        self.max_finished_agents = max_finished_agents
+        self._agents: OrderedDict[str, "BaseAgent"] = OrderedDict()
+
+    def configure(self, config: "AgentStoreConfig") -> None:
+        """Replace snapshot backend and limits from configuration."""
+        self.backend.close()
+        if config.backend == "sqlite":
+            self.backend = SQLiteSnapshotBackend(config.sqlite_path, ttl=config.snapshot_ttl)
+        else:
+            self.backend = InMemorySnapshotBackend(max_size=config.max_snapshots, ttl=config.snapshot_ttl)
+        self.max_finished_agents = config.max_finished_agents
+        logger.info(f"Agent store configured with {config.backend} backend")
+
+    def __setitem__(self, agent_id: str, agent: "BaseAgent") -> None:
+        self._agents[agent_id] = agent
+        self.evict_finished()
+
+    def __getitem__(self, agent_id: str) -> "BaseAgent":
+        return self._agents[agent_id]
+
+    def get(self, agent_id: str, default: "BaseAgent | None" = None) -> "BaseAgent | None":
+        """Get live (in memory) agent by id."""
+        return self._agents.get(agent_id, default)
+
+    def __contains__(self, agent_id: str) -> bool:
+        return agent_id in self._agents or agent_id in self.backend
+
+    def __len__(self) -> int:
+        return len(self._agents) + len(self.backend)
+
+    def clear(self) -> None:
+        self._agents.clear()
+        self.backend.clear()
+
+    def snapshot(self, agent_id: str) -> AgentSnapshot | None:
+        """Get snapshot of live or evicted agent by id."""
+        if (agent := self._agents.get(agent_id)) is not None:
+            return AgentSnapshot.from_agent(agent)
+        return self.backend.get(agent_id)
+
+    @staticmethod
+    def _encode_cursor(key: tuple[float, str]) -> str:
+        return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[float, str]:
+        try:
+            creation_ts, agent_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return float(creation_ts), str(agent_id)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid cursor: {cursor}") from e
+
+    def list_agents(
+        self,
+        agent_filter: AgentFilter | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> AgentPage:
+        """List live and evicted agents, newest first.
+
+        Live agents are bounded by running agents plus max_finished_agents
+        and are filtered directly; evicted agents are served from the
+        backend index, so the cost is O(live + page) regardless of how
+        many agents were ever created.
+
+        Args:
+            agent_filter: Filter by states and creation time
+            limit: Maximum number of agents on the page
+            cursor: next_cursor of the previous page
+
+        Returns:
+            Page of agent summaries
+
+        Raises:
+            ValueError: If cursor is malformed
+        """
+        agent_filter = agent_filter or AgentFilter()
+        below = self._decode_cursor(cursor) if cursor else None
+        self.evict_finished()
+
+        live = [
+            summary for summary in map(AgentSummary.from_agent, self._agents.values()) if agent_filter.matches(summary)
+        ]
+        total = len(live) + self.backend.count(agent_filter)
+        live = sorted(
+            (summary for summary in live if below is None or summary.sort_key() < below),
+            key=AgentSummary.sort_key,
+            reverse=True,
+        )
+        stored = self.backend.query(agent_filter, below, limit + 1)
+        items = list(islice(heapq.merge(live, stored, key=AgentSummary.sort_key, reverse=True), limit + 1))
+
+        next_cursor = self._encode_cursor(items[limit - 1].sort_key()) if len(items) > limit else None
+        return AgentPage(items=items[:limit], total=total, next_cursor=next_cursor)
+
+    @staticmethod
+    def _is_finished(agent: "BaseAgent") -> bool:
+        state = agent._context.state
+        return isinstance(state, AgentStatesEnum) and state in AgentStatesEnum.FINISH_STATES.value
+
+    def evict_finished(self) -> None:
+        """Move finished agents beyond max_finished_agents to the snapshot
+        backend."""
+        finished = [agent_id for agent_id, agent in self._agents.items() if self._is_finished(agent)]
+        for agent_id in finished[: max(len(finished) - self.max_finished_agents, 0)]:
+            self.backend.save(AgentSnapshot.from_agent(self._agents.pop(agent_id)))
+            logger.debug(f"Evicted finished agent {agent_id} to snapshot storage")
+
+    def close(self) -> None:
+        """Snapshot all agents still in memory and close the backend.
+
+        Agents that have not finished are interrupted by the shutdown and
+        cannot be resumed later, so their snapshots are saved as FAILED.
+        """
+        for agent in self._agents.values():
+            snapshot = AgentSnapshot.from_agent(agent)
+            if not self._is_finished(agent):
+                snapshot.state = AgentStatesEnum.FAILED
+                snapshot.context["state"] = AgentStatesEnum.FAILED.value
+            self.backend.save(snapshot)
+        self._agents.clear()
+        self.backend.close()
@@ -0,0 +1,169 @@
+import logging
+import re
+import zlib
+from collections import Counter, defaultdict
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+_SPACES = re.compile(r"[ \t\f\v\u00a0\u200b]+")
+_WORD = re.compile(r"\w+")
+
+
+class ContentNormalizer:
+    """Cleanup of extracted page contents before they reach the prompt.
+
+    Three passes over a batch of pages:
+
+    - whitespace collapsing: runs of spaces are squeezed, lines stripped
+      and consecutive blank lines merged into one paragraph break;
+    - boilerplate removal: short lines (menus, cookie banners, footers)
+      found in at least boilerplate_min_pages distinct pages of the same
+      site are dropped from them. Near-duplicate pages (mirrors, URL
+      variants) count once, lines making up most of a page are kept and
+      a page is never reduced to nothing;
+    - near-duplicate removal: paragraphs whose word shingles overlap an
+      earlier paragraph of the page by at least duplicate_threshold
+      (Jaccard similarity) are dropped.
+    """
+
+    def __init__(
+        self,
+        boilerplate_min_pages: int = 2,
+        boilerplate_max_chars: int = 200,
+        duplicate_threshold: float = 0.8,
+        shingle_size: int = 4,
+    ):
+        self.boilerplate_min_pages = boilerplate_min_pages
+        self.boilerplate_max_chars = boilerplate_max_chars
+        self.duplicate_threshold = duplicate_threshold
+        self.shingle_size = shingle_size
+
+    @staticmethod
+    def collapse_whitespace(text: str) -> list[str]:
+        """Get stripped lines of text with single empty lines between
+        paragraphs."""
+        lines = []
+        for line in text.splitlines():
+            line = _SPACES.sub(" ", line).strip()
+            if line or (lines and lines[-1]):
+                lines.append(line)
+        while lines and not lines[-1]:
+            lines.pop()
+        return lines
+
+    @staticmethod
+    def site(url: str) -> str:
+        """Host of the page URL, without www prefix."""
+        return (urlsplit(url).hostname or "").removeprefix("www.")
+
+    def _distinct_pages(self, pages: list[list[str]]) -> list[int]:
+        """Indexes of pages that are not near-duplicates of an earlier
+        one."""
+        distinct: list[int] = []
+        distinct_shingles: list[set[int]] = []
+        for i, lines in enumerate(pages):
+            shingles = self._shingles(" ".join(lines))
+            if any(
+                len(shingles & other) / (len(shingles | other) or 1) >= self.duplicate_threshold
+                for other in distinct_shingles
+            ):
+                continue
+            distinct.append(i)
+            distinct_shingles.append(shingles)
+        return distinct
+
+    def boilerplate_lines(self, pages: list[list[str]], sites: list[str] | None = None) -> list[set[str]]:
+        """Find short lines repeated across pages of the same site.
+
+        Args:
+            pages: Lines of each page
+            sites: Site of each page, all pages are of one site if omitted
+
+        Returns:
+            Boilerplate lines to drop from each page
+        """
+        by_site: defaultdict[str, list[int]] = defaultdict(list)
+        for i, site in enumerate(sites or [""] * len(pages)):
+            by_site[site].append(i)
+
+        boilerplate: list[set[str]] = [set() for _ in pages]
+        for indexes in by_site.values():
+            distinct = [indexes[i] for i in self._distinct_pages([pages[i] for i in indexes])]
+            if len(distinct) < self.boilerplate_min_pages:
+                continue
+            counts = Counter(line for i in distinct for line in {line for line in pages[i] if line})
+            repeated = {
+                line
+                for line, count in counts.items()
+                if count >= self.boilerplate_min_pages and len(line) <= self.boilerplate_max_chars
+            }
+            for i in indexes:
+                size = sum(map(len, pages[i]))
+                lines = {line for line in pages[i] if line in repeated and 2 * len(line) <= size}
+                if any(line and line not in lines for line in pages[i]):
+                    boilerplate[i] = lines
+        return boilerplate
+
+    def _shingles(self, paragraph: str) -> set[int]:
+        words = _WORD.findall(paragraph.lower())
+        if len(words) < self.shingle_size:
+            return {zlib.crc32(" ".join(words).encode())} if words else set()
+        return {
+            zlib.crc32(" ".join(words[i : i + self.shingle_size]).encode())
+            for i in range(len(words) - self.shingle_size + 1)
+        }
+
+    def remove_duplicates(self, paragraphs: list[str]) -> list[str]:
+        """Drop paragraphs nearly identical to an earlier one."""
+        kept: list[str] = []
+        kept_shingles: list[set[int]] = []
+        # shingle -> indexes of kept paragraphs containing it, to compare only with overlapping ones
+        index: defaultdict[int, list[int]] = defaultdict(list)
+        for paragraph in paragraphs:
+            shingles = self._shingles(paragraph)
+            overlaps = Counter(i for shingle in shingles for i in index.get(shingle, ()))
+            if any(
+                common / (len(shingles) + len(kept_shingles[i]) - common) >= self.duplicate_threshold
+                for i, common in overlaps.items()
+            ):
+                continue
+            for shingle in shingles:
+                index[shingle].append(len(kept))
+            kept.append(paragraph)
+            kept_shingles.append(shingles)
+        return kept
+
+    def normalize(self, texts: list[str], urls: list[str] | None = None) -> list[str]:
+        """Normalize a batch of page contents.
+
+        Args:
+            texts: Contents of pages extracted together
+            urls: Page URLs, boilerplate is only looked for among pages of
+                the same site (all pages are of one site if omitted)
+
+        Returns:
+            Normalized contents in the same order
+        """
+        pages = [self.collapse_whitespace(text) for text in texts]
+        page_boilerplate = self.boilerplate_lines(pages, [self.site(url) for url in urls] if urls else None)
+
+        normalized = []
+        for lines, boilerplate in zip(pages, page_boilerplate):
+            paragraphs: list[str] = []
+            current: list[str] = []
+            for line in [*lines, ""]:
+                if line and line not in boilerplate:
+                    current.append(line)
+                elif not line and current:
+                    paragraphs.append("\n".join(current))
+                    current = []
+            normalized.append("\n\n".join(self.remove_duplicates(paragraphs)))
+
+        before, after = sum(map(len, texts)), sum(map(len, normalized))
+        logger.info(
+            f"🧹 Normalized {len(texts)} pages: {before} -> {after} characters "
+            f"({(before - after) / before if before else 0:.0%} removed, "
+            f"{len(set().union(*page_boilerplate))} boilerplate lines)"
+        )
+        return normalized
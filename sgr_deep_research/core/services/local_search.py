@@ -0,0 +1,157 @@
+import logging
+import re
+import sqlite3
+from pathlib import Path
+from typing import ClassVar, Self
+
+from sgr_deep_research.core.agent_definition import SearchConfig
+from sgr_deep_research.core.models import SourceData
+from sgr_deep_research.core.services.search_backend import SearchBackend
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"\w+")
+
+
+class LocalSearchService(SearchBackend):
+    """Offline full-text search over a local directory of documents.
+
+    Text documents (local_documents_suffixes) under local_documents_dir
+    are indexed into a SQLite FTS5 table and ranked with BM25. Sources
+    have file:// URLs, which extract() resolves from the index. The index
+    is updated incrementally by file modification time, so a persistent
+    local_index_path makes restarts cheap. No network calls are made and
+    results are deterministic, which suits benchmarks and load tests.
+    """
+
+    name = "local"
+    _instances: ClassVar[dict[str, "LocalSearchService"]] = {}
+
+    def __init__(self, config: SearchConfig):
+        if not config.local_documents_dir:
+            raise ValueError("local_documents_dir is required for the local search backend")
+        self.config = config
+        self.documents_dir = Path(config.local_documents_dir)
+        self._conn = sqlite3.connect(config.local_index_path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "id INTEGER PRIMARY KEY, "
+                "path TEXT UNIQUE NOT NULL, "
+                "url TEXT UNIQUE NOT NULL, "
+                "mtime REAL NOT NULL)"
+            )
+            # documents rowid is files.id
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS documents USING fts5(url UNINDEXED, title, content, "
+                "tokenize = 'unicode61 remove_diacritics 2')"
+            )
+        self.reindex()
+
+    @classmethod
+    def get(cls, config: SearchConfig) -> Self:
+        key = config.model_dump_json()
+        if (service := cls._instances.get(key)) is None:
+            service = cls._instances[key] = cls(config)
+        return service
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close all shared services and their indexes."""
+        services, cls._instances = list(cls._instances.values()), {}
+        for service in services:
+            service._conn.close()
+
+    @staticmethod
+    def _title(path: Path, content: str) -> str:
+        for line in content.splitlines():
+            if line := line.strip().lstrip("#").strip():
+                return line[:200]
+        return path.stem
+
+    def reindex(self) -> int:
+        """Index new and changed documents, drop removed ones.
+
+        Returns:
+            Number of (re)indexed documents
+        """
+        indexed = dict(self._conn.execute("SELECT path, mtime FROM files"))
+        paths = {
+            path
+            for path in self.documents_dir.rglob("*")
+            if path.is_file() and path.suffix.lower() in self.config.local_documents_suffixes
+        }
+        changed = 0
+        with self._conn:
+            for path in sorted(paths):
+                mtime = path.stat().st_mtime
+                if indexed.pop(str(path), None) == mtime:
+                    continue
+                content = path.read_text(encoding="utf-8", errors="replace")
+                url = path.resolve().as_uri()
+                (file_id,) = self._conn.execute(
+                    "INSERT INTO files (path, url, mtime) VALUES (?, ?, ?) "
+                    "ON CONFLICT (path) DO UPDATE SET mtime = excluded.mtime RETURNING id",
+                    (str(path), url, mtime),
+                ).fetchone()
+                self._conn.execute("DELETE FROM documents WHERE rowid = ?", (file_id,))
+                self._conn.execute(
+                    "INSERT INTO documents (rowid, url, title, content) VALUES (?, ?, ?, ?)",
+                    (file_id, url, self._title(path, content), content),
+                )
+                changed += 1
+            for path in indexed:
+                (file_id,) = self._conn.execute("DELETE FROM files WHERE path = ? RETURNING id", (path,)).fetchone()
+                self._conn.execute("DELETE FROM documents WHERE rowid = ?", (file_id,))
+        if changed or indexed:
+            logger.info(f"Local search index: {changed} documents indexed, {len(indexed)} removed")
+        return changed
+
+    @staticmethod
+    def _match_expression(query: str) -> str:
+        # Any of the query terms, quoted so that FTS5 operators in user queries are literal
+        return " OR ".join(f'"{term}"' for term in dict.fromkeys(_WORD.findall(query.lower())))
+
+    async def search(
+        self,
+        query: str,
+        max_results: int | None = None,
+        include_raw_content: bool = True,
+    ) -> list[SourceData]:
+        max_results = max_results or self.config.max_results
+        logger.info(f"🔍 Local search: '{query}' (max_results={max_results})")
+        if not (expression := self._match_expression(query)):
+            return []
+
+        rows = self._conn.execute(
+            "SELECT url, title, snippet(documents, 2, '', '', '...', 32), "
+            f"{'content' if include_raw_content else 'NULL'} "
+            "FROM documents WHERE documents MATCH ? ORDER BY bm25(documents, 0, 5.0, 1.0), url LIMIT ?",
+            (expression, max_results),
+        ).fetchall()
+        sources = []
+        for i, (url, title, snippet, content) in enumerate(rows):
+            source = SourceData(number=i, title=title, url=url, snippet=snippet)
+            if content:
+                source.full_content = content
+                source.char_count = len(content)
+            sources.append(source)
+        return sources
+
+    async def extract(self, urls: list[str]) -> list[SourceData]:
+        logger.info(f"📄 Local extract: {len(urls)} URLs")
+        sources = []
+        for url in dict.fromkeys(urls):
+            row = self._conn.execute(
+                "SELECT documents.title, documents.content FROM files "
+                "JOIN documents ON documents.rowid = files.id WHERE files.url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                logger.warning(f"⚠️ Document not found in local index: {url}")
+                continue
+            title, content = row
+            sources.append(
+                SourceData(number=len(sources), title=title, url=url, full_content=content, char_count=len(content))
+            )
+        return sources
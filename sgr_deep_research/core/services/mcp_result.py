@@ -0,0 +1,68 @@
+import json
+import os
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+
+def _truncate_strings(value: Any, limit: int) -> Any:
+    if isinstance(value, str):
+        return value[:limit]
+    if isinstance(value, dict):
+        return {key: _truncate_strings(item, limit) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_truncate_strings(item, limit) for item in value]
+    return value
+
+
+def serialize_mcp_content(items: Sequence[BaseModel], limit: int) -> tuple[str, bool]:
+    """Serialize MCP result content within a character budget.
+
+    The result is the first `limit` characters of a JSON list of the
+    items' JSON strings. Only the part of each item that can still fit
+    is encoded: a character of a string value takes at least one
+    character once encoded (twice), so strings are cut to the remaining
+    budget first, and items after the budget are not serialized at all.
+
+    Args:
+        items: Content items of an MCP tool result
+        limit: Maximum number of characters
+
+    Returns:
+        Serialized content and whether it was truncated
+    """
+    parts = ["["]
+    size = 1
+    for i, item in enumerate(items):
+        if size >= limit:
+            return "".join(parts)[:limit], True
+        remaining = limit - size
+        data = _truncate_strings(item.model_dump(mode="json"), remaining)
+        text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))[:remaining]
+        part = (", " if i else "") + json.dumps(text, ensure_ascii=False)
+        parts.append(part)
+        size += len(part)
+    parts.append("]")
+    size += 1
+    return "".join(parts)[:limit], size > limit
+
+
+def spill_mcp_content(items: Sequence[BaseModel], directory: str, tool_name: str) -> str:
+    """Write full MCP result content to a JSON lines file, one item per
+    line.
+
+    Returns:
+        Path of the written file
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(
+        directory, f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{tool_name}-{uuid.uuid4().hex[:8]}.jsonl"
+    )
+    with open(path, "w", encoding="utf-8") as file:
+        for item in items:
+            file.write(item.model_dump_json())
+            file.write("\n")
+    return path
@@ -1,15 +1,33 @@
 import logging
-from typing import Type
+import time
+from functools import partial
+from typing import ClassVar, Type
 
-from fastmcp import Client
 from fastmcp.mcp_config import MCPConfig
 from jambo import SchemaConverter
 from pydantic import create_model
 
+from sgr_deep_research.core.agent_config import GlobalConfig
+from sgr_deep_research.core.services.mcp_session_pool import MCPSessionPool
+from sgr_deep_research.core.services.single_flight import SingleFlight
+from sgr_deep_research.core.services.tool_schema_cache import ToolSchemaCache
+
 logger = logging.getLogger(__name__)
 
 
 class MCP2ToolConverter:
+    """Builds tool classes from tools of MCP servers.
+
+    Discovery lists the tools of every server and generates a pydantic
+    model per tool, so results are cached per MCP config: get_tools()
+    builds them once (concurrent callers share one build) and serves
+    them until execution.mcp_tools_ttl expires or refresh() is called.
+    """
+
+    # MCP config json -> (built at, tool classes)
+    _tools: ClassVar[dict[str, tuple[float, list]]] = {}
+    _building: ClassVar[SingleFlight] = SingleFlight()
+
     @staticmethod
     def _to_CamelCase(name: str) -> str:
         return name.replace("_", " ").title().replace(" ", "")
@@ -22,30 +40,82 @@ class MCP2ToolConverter:
         if not config.mcpServers:
             return tools
 
-        client: Client = Client(config)
-        async with client:
-            mcp_tools = await client.list_tools()
-
-            for t in mcp_tools:
-                if not t.name or not t.inputSchema:
-                    logger.error(f"Skipping tool due to missing name or input schema: {t}")
-                    continue
-
-                try:
-                    t.inputSchema["title"] = cls._to_CamelCase(t.name)
-                    PdModel = SchemaConverter.build(t.inputSchema)
-                except Exception as e:
-                    logger.error(f"Error creating model {t.name} from schema: {t.inputSchema}: {e}")
-                    continue
-
-                ToolCls: Type[BaseTool] = create_model(
-                    f"MCP{cls._to_CamelCase(t.name)}", __base__=(PdModel, MCPBaseTool), __doc__=t.description or ""
-                )
-                ToolCls.tool_name = t.name
-                ToolCls.description = t.description or ""
-                ToolCls._client = client
-                tools.append(ToolCls)
-                logger.info(f"Built MCP Tool: {ToolCls.tool_name}")
-
-            logger.info(f"Built {len(tools)} MCP tools.")
-            return tools
+        # Tool classes are rebuilt below, cached schemas of previous builds are stale
+        ToolSchemaCache.invalidate(MCPBaseTool)
+
+        execution = GlobalConfig().execution
+        sessions = MCPSessionPool.get(
+            config,
+            size=execution.mcp_sessions_per_config,
+            health_check_interval=execution.mcp_health_check_interval,
+            connect_retries=execution.mcp_connect_retries,
+            reconnect_backoff=execution.mcp_reconnect_backoff,
+            max_concurrent_calls=execution.mcp_max_concurrent_calls,
+            call_timeout=execution.mcp_call_timeout,
+        )
+        mcp_tools = await sessions.list_tools()
+
+        for t in mcp_tools:
+            if not t.name or not t.inputSchema:
+                logger.error(f"Skipping tool due to missing name or input schema: {t}")
+                continue
+
+            try:
+                t.inputSchema["title"] = cls._to_CamelCase(t.name)
+                PdModel = SchemaConverter.build(t.inputSchema)
+            except Exception as e:
+                logger.error(f"Error creating model {t.name} from schema: {t.inputSchema}: {e}")
+                continue
+
+            ToolCls: Type[BaseTool] = create_model(
+                f"MCP{cls._to_CamelCase(t.name)}", __base__=(PdModel, MCPBaseTool), __doc__=t.description or ""
+            )
+            ToolCls.tool_name = t.name
+            ToolCls.description = t.description or ""
+            ToolCls._sessions = sessions
+            tools.append(ToolCls)
+            logger.info(f"Built MCP Tool: {ToolCls.tool_name}")
+
+        logger.info(f"Built {len(tools)} MCP tools.")
+        return tools
+
+    @classmethod
+    async def get_tools(cls, config: MCPConfig) -> list:
+        """Get cached tool classes of MCP config, building them on first
+        use or after the TTL expired."""
+        key = config.model_dump_json()
+        ttl = GlobalConfig().execution.mcp_tools_ttl
+        cached = cls._tools.get(key)
+        if cached is not None and (ttl is None or time.monotonic() - cached[0] < ttl):
+            return list(cached[1])
+        return list(await cls._building.do(key, partial(cls._build_and_cache, key, config)))
+
+    @classmethod
+    async def _build_and_cache(cls, key: str, config: MCPConfig) -> list:
+        tools = await cls.build_tools_from_mcp(config)
+        cls._tools[key] = (time.monotonic(), tools)
+        return tools
+
+    @classmethod
+    async def refresh(cls, configs: list[MCPConfig] | None = None) -> int:
+        """Rebuild cached tool classes.
+
+        Args:
+            configs: MCP configs to rebuild (all cached ones by default)
+
+        Returns:
+            Number of tools built
+        """
+        if configs is None:
+            configs = [MCPConfig.model_validate_json(key) for key in cls._tools]
+        count = 0
+        for config in configs:
+            key = config.model_dump_json()
+            cls._tools.pop(key, None)
+            count += len(await cls._building.do(key, partial(cls._build_and_cache, key, config)))
+        return count
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all cached tool classes."""
+        cls._tools.clear()
@@ -0,0 +1,224 @@
+import asyncio
+import itertools
+import logging
+import time
+from bisect import bisect_left
+from typing import Any, ClassVar, Self
+
+from fastmcp import Client
+from fastmcp.mcp_config import MCPConfig
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+_LATENCY_BUCKETS = [0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0]
+
+
+class LatencyHistogram(BaseModel):
+    """Histogram of call durations with fixed bucket bounds."""
+
+    bounds: list[float] = Field(
+        default_factory=lambda: list(_LATENCY_BUCKETS), description="Bucket upper bounds in seconds"
+    )
+    counts: list[int] = Field(
+        default_factory=lambda: [0] * (len(_LATENCY_BUCKETS) + 1),
+        description="Calls per bucket, the last one counts calls above all bounds",
+    )
+    count: int = Field(default=0, description="Number of calls")
+    errors: int = Field(default=0, description="Number of failed, timed out or cancelled calls")
+    total_seconds: float = Field(default=0.0, description="Sum of call durations")
+
+    def observe(self, seconds: float, error: bool = False) -> None:
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.errors += error
+        self.total_seconds += seconds
+
+    def percentile(self, q: float) -> float | None:
+        """Estimate q-th percentile (0-100) as the upper bound of its
+        bucket, None without calls (inf above all bounds)."""
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for bound, count in zip([*self.bounds, float("inf")], self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+class _Session:
+    """Long-lived client session of a pool."""
+
+    def __init__(self, client: Client):
+        self.client = client
+        self.lock = asyncio.Lock()
+        # monotonic time of the last successful request or health check, -inf forces a check
+        self.checked_at = float("-inf")
+
+
+class MCPSessionPool:
+    """Warm MCP client sessions shared by all tools of an MCP config.
+
+    Connecting to an MCP server means a handshake and, for stdio servers,
+    spawning the server process, so sessions are opened once and kept:
+    tool calls are spread round-robin over `size` sessions (requests are
+    multiplexed, a session serves many concurrent calls). A session idle
+    for more than health_check_interval seconds, or one whose last
+    request failed, is pinged before use and reconnected with exponential
+    backoff if the ping fails.
+
+    At most max_concurrent_calls tool calls run at once, each limited to
+    call_timeout seconds including queueing. A cancelled or timed out
+    call is abandoned on the session, which notifies the server.
+    Durations of tool calls are kept in per-tool latency histograms.
+    """
+
+    _pools: ClassVar[dict[str, "MCPSessionPool"]] = {}
+
+    def __init__(
+        self,
+        config: MCPConfig,
+        size: int = 1,
+        health_check_interval: float = 30.0,
+        connect_retries: int = 3,
+        reconnect_backoff: float = 0.5,
+        max_concurrent_calls: int = 10,
+        call_timeout: float | None = 60.0,
+    ):
+        self.config = config
+        self.health_check_interval = health_check_interval
+        self.connect_retries = connect_retries
+        self.reconnect_backoff = reconnect_backoff
+        self.call_timeout = call_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrent_calls)
+        self.latency: dict[str, LatencyHistogram] = {}
+        client = Client(config)
+        self._sessions = [_Session(client if i == 0 else client.new()) for i in range(size)]
+        self._next = itertools.cycle(self._sessions)
+        self._closed = False
+
+    @classmethod
+    def get(cls, config: MCPConfig, **kwargs) -> Self:
+        """Get shared session pool of MCP config, creating it on first use.
+
+        Args:
+            config: MCP servers configuration
+            **kwargs: Pool settings used when the pool is created
+
+        Returns:
+            Shared MCPSessionPool
+        """
+        key = config.model_dump_json()
+        if (pool := cls._pools.get(key)) is None or pool._closed:
+            pool = cls._pools[key] = cls(config, **kwargs)
+            logger.info(f"Created MCP session pool for {list(config.mcpServers)} ({len(cls._pools)} pools)")
+        return pool
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close all shared pools and their sessions."""
+        pools, cls._pools = list(cls._pools.values()), {}
+        for pool in pools:
+            await pool.close()
+        if pools:
+            logger.info(f"Closed {len(pools)} MCP session pools")
+
+    async def _connect(self, session: _Session) -> None:
+        for attempt in range(self.connect_retries + 1):
+            try:
+                await session.client.__aenter__()
+                session.checked_at = time.monotonic()
+                return
+            except Exception as e:
+                if attempt == self.connect_retries:
+                    raise
+                delay = self.reconnect_backoff * 2**attempt
+                logger.warning(f"⚠️ MCP connection failed ({e}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    async def _disconnect(self, session: _Session) -> None:
+        try:
+            await session.client.close()
+        except Exception as e:
+            logger.warning(f"⚠️ Error closing MCP session: {e}")
+
+    async def _ready(self, session: _Session) -> Client:
+        """Get connected client of session, health checking idle and
+        failed sessions."""
+        if self._closed:
+            raise RuntimeError("MCP session pool is closed")
+        async with session.lock:
+            if session.client.is_connected() and time.monotonic() - session.checked_at > self.health_check_interval:
+                try:
+                    await session.client.ping()
+                    session.checked_at = time.monotonic()
+                except Exception as e:
+                    logger.warning(f"⚠️ MCP session health check failed ({e}), reconnecting")
+                    await self._disconnect(session)
+            if not session.client.is_connected():
+                await self._connect(session)
+        return session.client
+
+    async def _request(self, method: str, *args: Any) -> Any:
+        session = next(self._next)
+        client = await self._ready(session)
+        try:
+            result = await getattr(client, method)(*args)
+        except Exception:
+            # Tool errors leave the session usable, the health check on next use tells them apart
+            session.checked_at = float("-inf")
+            raise
+        session.checked_at = time.monotonic()
+        return result
+
+    async def list_tools(self) -> list:
+        """List tools of the MCP servers."""
+        return await self._request("list_tools")
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> Any:
+        """Call MCP tool on a warm session.
+
+        Raises:
+            TimeoutError: If the call did not finish within call_timeout
+            Exception: Tool errors and connection failures after retries
+        """
+        started = None
+        error = True
+        deadline = asyncio.timeout(self.call_timeout)
+        try:
+            async with deadline:
+                async with self._semaphore:
+                    started = time.perf_counter()
+                    result = await self._request("call_tool", name, arguments)
+            error = False
+            return result
+        except TimeoutError as e:
+            if deadline.expired():
+                raise TimeoutError(f"MCP tool '{name}' timed out after {self.call_timeout}s") from e
+            raise
+        finally:
+            if started is not None:
+                self.latency.setdefault(name, LatencyHistogram()).observe(time.perf_counter() - started, error)
+
+    @classmethod
+    def latency_stats(cls) -> dict[str, LatencyHistogram]:
+        """Get latency histograms of MCP tools merged over all pools."""
+        stats: dict[str, LatencyHistogram] = {}
+        for pool in cls._pools.values():
+            for name, histogram in pool.latency.items():
+                merged = stats.setdefault(name, LatencyHistogram())
+                merged.counts = [a + b for a, b in zip(merged.counts, histogram.counts)]
+                merged.count += histogram.count
+                merged.errors += histogram.errors
+                merged.total_seconds += histogram.total_seconds
+        return stats
+
+    async def close(self) -> None:
+        """Close all sessions of the pool."""
+        self._closed = True
+        for session in self._sessions:
+            async with session.lock:
+                if session.client.is_connected():
+                    await self._disconnect(session)
@@ -0,0 +1,215 @@
+import codecs
+import hashlib
+import logging
+import sqlite3
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from sgr_deep_research.core.content_store import ContentHandle, ContentStore
+from sgr_deep_research.core.models import SourceData
+
+if TYPE_CHECKING:
+    from sgr_deep_research.core.agent_config import PageCacheConfig
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "yclid")
+
+
+def canonicalize_url(url: str) -> str:
+    """Normalize URL so that addresses of the same page share a cache key.
+
+    Lowercases scheme and host, drops default ports, fragments and
+    tracking query parameters, and sorts the remaining parameters.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = (parts.hostname or "").lower()
+    if parts.port is not None and parts.port != _DEFAULT_PORTS.get(scheme):
+        netloc = f"{netloc}:{parts.port}"
+    if parts.username:
+        netloc = f"{parts.username}@{netloc}"
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.lower().startswith(_TRACKING_PARAMS)
+    )
+    return urlunsplit((scheme, netloc, parts.path or "/", urlencode(query), ""))
+
+
+class PageCache:
+    """Extracted page contents shared between agents.
+
+    Pages are keyed by canonical URL. Contents are stored zlib-compressed
+    in a SQLite database by their SHA-256 digest, so mirrors of the same
+    page are kept once; recently used pages are also held decompressed
+    (as ContentStore handles) in a hot tier. Without a database path
+    only the hot tier is used.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        max_pages: int = 5000,
+        hot_size: int = 200,
+        ttl: int | None = 86400,
+        enabled: bool = True,
+    ):
+        self.path = path
+        self.max_pages = max_pages
+        self.hot_size = hot_size
+        self.ttl = ttl
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        # canonical url -> (stored_at, page), least recently used first
+        self._hot: OrderedDict[str, tuple[float, SourceData]] = OrderedDict()
+        self._conn: sqlite3.Connection | None = None
+        if path is not None:
+            self._open(path)
+
+    def _open(self, path: str) -> None:
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                "url TEXT PRIMARY KEY, "
+                "title TEXT, "
+                "digest TEXT NOT NULL, "
+                "stored_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS pages_accessed ON pages (accessed_at)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS pages_digest ON pages (digest)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS contents (digest TEXT PRIMARY KEY, data BLOB NOT NULL)")
+
+    def configure(self, config: "PageCacheConfig") -> None:
+        """Replace storage and limits from configuration."""
+        self.close()
+        self._hot.clear()
+        self.path = config.sqlite_path if config.backend == "sqlite" else None
+        self.max_pages = config.max_pages
+        self.hot_size = config.hot_size
+        self.ttl = config.ttl
+        self.enabled = config.enabled
+        if self.path is not None:
+            self._open(self.path)
+        logger.info(f"Page cache configured with {config.backend} backend (enabled={config.enabled})")
+
+    def _min_stored_at(self) -> float:
+        return time.time() - self.ttl if self.ttl is not None else float("-inf")
+
+    def _remember(self, key: str, stored_at: float, page: SourceData) -> None:
+        self._hot[key] = (stored_at, page)
+        self._hot.move_to_end(key)
+        while len(self._hot) > self.hot_size:
+            self._hot.popitem(last=False)
+
+    def _load(self, key: str) -> SourceData | None:
+        if (item := self._hot.get(key)) is not None:
+            stored_at, page = item
+            if stored_at >= self._min_stored_at():
+                self._hot.move_to_end(key)
+                return page
+            del self._hot[key]
+        if self._conn is None:
+            return None
+        row = self._conn.execute(
+            "SELECT pages.title, pages.stored_at, contents.data FROM pages "
+            "JOIN contents ON contents.digest = pages.digest WHERE pages.url = ? AND pages.stored_at >= ?",
+            (key, self._min_stored_at()),
+        ).fetchone()
+        if row is None:
+            return None
+        title, stored_at, data = row
+        with self._conn:
+            self._conn.execute("UPDATE pages SET accessed_at = ? WHERE url = ?", (time.time(), key))
+        content = ContentStore.default().write(self._decompress(data))
+        page = SourceData(number=0, title=title, url=key, content=content, char_count=len(content))
+        self._remember(key, stored_at, page)
+        return page
+
+    @staticmethod
+    def _compress(content: ContentHandle) -> tuple[str, bytes]:
+        sha256, compressor, parts = hashlib.sha256(), zlib.compressobj(level=6), []
+        for chunk in content.chunks():
+            data = chunk.encode()
+            sha256.update(data)
+            parts.append(compressor.compress(data))
+        parts.append(compressor.flush())
+        return sha256.hexdigest(), b"".join(parts)
+
+    @staticmethod
+    def _decompress(data: bytes, chunk_size: int = 65536) -> Iterator[str]:
+        decompressor, decoder = zlib.decompressobj(), codecs.getincrementaldecoder("utf-8")()
+        for i in range(0, len(data), chunk_size):
+            yield decoder.decode(decompressor.decompress(data[i : i + chunk_size]))
+        yield decoder.decode(decompressor.flush(), final=True)
+
+    def get(self, url: str) -> SourceData | None:
+        """Get cached page content for URL, None on cache miss.
+
+        Returns:
+            New SourceData with the requested URL
+        """
+        if not self.enabled:
+            return None
+        if (page := self._load(canonicalize_url(url))) is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return page.model_copy(update={"url": url})
+
+    def set(self, source: SourceData) -> None:
+        """Cache extracted page content of a source (empty contents are not
+        cached)."""
+        if not self.enabled or source.content is None or not source.char_count:
+            return
+        key = canonicalize_url(source.url)
+        stored_at = time.time()
+        page = SourceData(number=0, title=source.title, url=key, content=source.content, char_count=source.char_count)
+        self._remember(key, stored_at, page)
+        if self._conn is None:
+            return
+        digest, data = self._compress(source.content)
+        with self._conn:
+            previous = self._conn.execute("SELECT digest FROM pages WHERE url = ?", (key,)).fetchone()
+            self._conn.execute("INSERT OR IGNORE INTO contents VALUES (?, ?)", (digest, data))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)", (key, source.title, digest, stored_at, stored_at)
+            )
+            removed = previous is not None and previous[0] != digest
+            removed += self._conn.execute("DELETE FROM pages WHERE stored_at < ?", (self._min_stored_at(),)).rowcount
+            removed += self._conn.execute(
+                "DELETE FROM pages WHERE url IN (SELECT url FROM pages ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_pages,),
+            ).rowcount
+            if removed:
+                self._conn.execute("DELETE FROM contents WHERE digest NOT IN (SELECT digest FROM pages)")
+
+    def __len__(self) -> int:
+        if self._conn is None:
+            return len(self._hot)
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM pages WHERE stored_at >= ?", (self._min_stored_at(),)
+        ).fetchone()[0]
+
+    def clear(self) -> None:
+        """Drop cached pages and reset counters."""
+        self._hot.clear()
+        self.hits = 0
+        self.misses = 0
+        if self._conn is not None:
+            with self._conn:
+                self._conn.execute("DELETE FROM pages")
+                self._conn.execute("DELETE FROM contents")
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
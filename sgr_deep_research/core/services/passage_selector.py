@@ -0,0 +1,150 @@
+import heapq
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any
+
+from pydantic import BaseModel
+
+_WORD = re.compile(r"\w+")
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def query_text(*parts: Any) -> str:
+    """Collect text of query parts (strings, models, dicts and lists).
+
+    Used to build a passage selection query from the task and reasoning
+    structures of an agent.
+    """
+    texts = []
+    for part in parts:
+        if isinstance(part, BaseModel):
+            part = part.model_dump()
+        if isinstance(part, str):
+            texts.append(part)
+        elif isinstance(part, dict):
+            texts.append(query_text(*part.values()))
+        elif isinstance(part, list | tuple):
+            texts.append(query_text(*part))
+    return " ".join(text for text in texts if text)
+
+
+class PassageSelector:
+    """Selection of page passages most relevant to a query.
+
+    Pages are split into passages of about passage_chars characters
+    (paragraphs, merged or split at sentence boundaries), scored with
+    Okapi BM25 against the query and the best ones are returned in page
+    order within a character budget. Pages without any query term fall
+    back to their beginning.
+    """
+
+    separator = "\n[...]\n"
+
+    def __init__(self, passage_chars: int = 500, k1: float = 1.5, b: float = 0.75):
+        self.passage_chars = passage_chars
+        self.k1 = k1
+        self.b = b
+
+    @staticmethod
+    def tokenize(text: str) -> list[str]:
+        return _WORD.findall(text.lower())
+
+    def _split_long(self, paragraph: str) -> Iterable[str]:
+        current = ""
+        for sentence in _SENTENCE_END.split(paragraph):
+            while len(sentence) > self.passage_chars:
+                cut = sentence.rfind(" ", 0, self.passage_chars)
+                cut = cut if cut > 0 else self.passage_chars
+                if current:
+                    yield current
+                    current = ""
+                yield sentence[:cut]
+                sentence = sentence[cut:].lstrip()
+            if current and len(current) + len(sentence) + 1 > self.passage_chars:
+                yield current
+                current = ""
+            current = f"{current} {sentence}" if current else sentence
+        if current:
+            yield current
+
+    def split(self, text: str) -> list[str]:
+        """Split text into passages of at most passage_chars
+        characters."""
+        passages = []
+        current = ""
+        for paragraph in _PARAGRAPH_BREAK.split(text):
+            if not (paragraph := paragraph.strip()):
+                continue
+            if len(paragraph) > self.passage_chars:
+                if current:
+                    passages.append(current)
+                    current = ""
+                passages.extend(self._split_long(paragraph))
+            elif current and len(current) + len(paragraph) + 2 > self.passage_chars:
+                passages.append(current)
+                current = paragraph
+            else:
+                current = f"{current}\n\n{paragraph}" if current else paragraph
+        if current:
+            passages.append(current)
+        return passages
+
+    def score(self, passages: list[str], query: str) -> list[float]:
+        """Score passages against query with BM25 (IDF over the
+        passages)."""
+        terms = set(self.tokenize(query))
+        counts = [Counter(self.tokenize(passage)) for passage in passages]
+        lengths = [sum(count.values()) for count in counts]
+        average_length = sum(lengths) / len(lengths) if lengths else 0.0
+        idf = {}
+        for term in terms:
+            df = sum(1 for count in counts if term in count)
+            if df:
+                idf[term] = math.log(1 + (len(passages) - df + 0.5) / (df + 0.5))
+
+        scores = []
+        for count, length in zip(counts, lengths):
+            norm = self.k1 * (1 - self.b + self.b * length / average_length) if average_length else self.k1
+            scores.append(
+                sum(
+                    weight * count[term] * (self.k1 + 1) / (count[term] + norm)
+                    for term, weight in idf.items()
+                    if term in count
+                )
+            )
+        return scores
+
+    def select(self, text: str, query: str, budget: int) -> str:
+        """Select passages of text most relevant to query.
+
+        Args:
+            text: Page text
+            query: Text to match passages against (task, reasoning)
+            budget: Maximum number of returned characters
+
+        Returns:
+            Relevant passages in page order joined with separator, or the
+            beginning of the text if it fits the budget or nothing matches
+        """
+        if len(text) <= budget:
+            return text
+        passages = self.split(text)
+        scores = self.score(passages, query)
+        if not any(scores):
+            return text[:budget]
+
+        selected = []
+        used = 0
+        for i in heapq.nlargest(len(passages), range(len(passages)), key=lambda i: (scores[i], -i)):
+            if scores[i] <= 0:
+                break
+            cost = len(passages[i]) + (len(self.separator) if selected else 0)
+            if used + cost <= budget:
+                selected.append(i)
+                used += cost
+        if not selected:
+            return text[:budget]
+        return self.separator.join(passages[i] for i in sorted(selected))
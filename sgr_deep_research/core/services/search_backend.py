@@ -0,0 +1,76 @@
+from abc import ABC, abstractmethod
+from typing import ClassVar, Self
+
+from sgr_deep_research.core.agent_definition import SearchConfig
+from sgr_deep_research.core.models import SourceData
+
+
+class SearchBackend(ABC):
+    """Search and page extraction service used by search tools.
+
+    Implementations register under their name and are selected by
+    SearchConfig.backend; use for_config() to get the shared service of
+    a search config.
+    """
+
+    name: ClassVar[str]
+    _backends: ClassVar[dict[str, type["SearchBackend"]]] = {}
+
+    config: SearchConfig
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        SearchBackend._backends[cls.name] = cls
+
+    @classmethod
+    def for_config(cls, config: SearchConfig) -> "SearchBackend":
+        """Get shared service of the backend selected by search config.
+
+        Raises:
+            ValueError: If the backend is unknown
+        """
+        if (backend := cls._backends.get(config.backend)) is None:
+            raise ValueError(f"Unknown search backend '{config.backend}', available: {list(cls._backends)}")
+        return backend.get(config)
+
+    @classmethod
+    @abstractmethod
+    def get(cls, config: SearchConfig) -> Self:
+        """Get shared service for search configuration, creating it on
+        first use."""
+
+    @abstractmethod
+    async def search(
+        self,
+        query: str,
+        max_results: int | None = None,
+        include_raw_content: bool = True,
+    ) -> list[SourceData]:
+        """Search for query.
+
+        Args:
+            query: Search query
+            max_results: Maximum number of results (default from config)
+            include_raw_content: Include full page content
+
+        Returns:
+            List of found sources, best first
+        """
+
+    @abstractmethod
+    async def extract(self, urls: list[str]) -> list[SourceData]:
+        """Extract full content of pages.
+
+        Args:
+            urls: List of URLs to extract content from
+
+        Returns:
+            List of SourceData with extracted content (failed URLs are
+            omitted)
+        """
+
+    @staticmethod
+    def rearrange_sources(sources: list[SourceData], starting_number=1) -> list[SourceData]:
+        for i, source in enumerate(sources, starting_number):
+            source.number = i
+        return sources
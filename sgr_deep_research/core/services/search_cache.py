@@ -0,0 +1,215 @@
+import json
+import logging
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel, Field, TypeAdapter
+
+from sgr_deep_research.core.models import SourceData
+
+if TYPE_CHECKING:
+    from sgr_deep_research.core.agent_config import SearchCacheConfig
+
+logger = logging.getLogger(__name__)
+
+_sources_adapter = TypeAdapter(list[SourceData])
+
+
+class SearchCacheStats(BaseModel):
+    """Search cache hit and miss counters."""
+
+    hits: int = Field(default=0, description="Searches served from cache")
+    misses: int = Field(default=0, description="Searches sent to the search API")
+    size: int = Field(default=0, description="Cached search results")
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class SearchCacheBackend(ABC):
+    """Storage of cached search results by cache key."""
+
+    @abstractmethod
+    def get(self, key: str) -> list[SourceData] | None:
+        """Get cached sources, None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, sources: list[SourceData]) -> None:
+        """Store sources, evicting least recently used entries over the
+        size limit."""
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all cached results."""
+
+    def close(self) -> None:
+        """Release backend resources."""
+
+
+class InMemorySearchCacheBackend(SearchCacheBackend):
+    """Search results in process memory with LRU eviction and TTL."""
+
+    def __init__(self, max_size: int = 1000, ttl: int | None = 3600):
+        self.max_size = max_size
+        self.ttl = ttl
+        # key -> (stored_at, sources), least recently used first
+        self._items: OrderedDict[str, tuple[float, list[SourceData]]] = OrderedDict()
+
+    def get(self, key: str) -> list[SourceData] | None:
+        if (item := self._items.get(key)) is None:
+            return None
+        stored_at, sources = item
+        if self.ttl is not None and stored_at < time.monotonic() - self.ttl:
+            del self._items[key]
+            return None
+        self._items.move_to_end(key)
+        return sources
+
+    def set(self, key: str, sources: list[SourceData]) -> None:
+        self._items[key] = (time.monotonic(), sources)
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+
+class SQLiteSearchCacheBackend(SearchCacheBackend):
+    """Search results persisted in a SQLite database, shared between
+    server restarts."""
+
+    def __init__(self, path: str = "search_cache.db", max_size: int = 1000, ttl: int | None = 3600):
+        self.path = path
+        self.max_size = max_size
+        self.ttl = ttl
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache ("
+                "key TEXT PRIMARY KEY, "
+                "stored_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL, "
+                "data TEXT NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS search_cache_accessed ON search_cache (accessed_at)")
+
+    def _min_stored_at(self) -> float:
+        return time.time() - self.ttl if self.ttl is not None else float("-inf")
+
+    @staticmethod
+    def _dump(sources: list[SourceData]) -> str:
+        # full_content lives in the content store and is not part of model dumps
+        return json.dumps(
+            [source.model_dump(mode="json") | {"full_content": source.full_content} for source in sources]
+        )
+
+    def get(self, key: str) -> list[SourceData] | None:
+        row = self._conn.execute(
+            "SELECT data FROM search_cache WHERE key = ? AND stored_at >= ?", (key, self._min_stored_at())
+        ).fetchone()
+        if row is None:
+            return None
+        with self._conn:
+            self._conn.execute("UPDATE search_cache SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        return _sources_adapter.validate_json(row[0])
+
+    def set(self, key: str, sources: list[SourceData]) -> None:
+        now = time.time()
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?, ?)",
+                (key, now, now, self._dump(sources)),
+            )
+            self._conn.execute("DELETE FROM search_cache WHERE stored_at < ?", (self._min_stored_at(),))
+            self._conn.execute(
+                "DELETE FROM search_cache WHERE key IN "
+                "(SELECT key FROM search_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_size,),
+            )
+
+    def __len__(self) -> int:
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM search_cache WHERE stored_at >= ?", (self._min_stored_at(),)
+        ).fetchone()[0]
+
+    def clear(self) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM search_cache")
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class SearchCache:
+    """Search results shared between agents.
+
+    Concurrent agents often issue the same queries; results are cached
+    by normalized query and search parameters so repeated searches skip
+    the search API round-trip. Callers get their own copies of cached
+    sources, as tools renumber them per agent.
+    """
+
+    def __init__(self, backend: SearchCacheBackend | None = None, enabled: bool = True):
+        self.backend = backend if backend is not None else InMemorySearchCacheBackend()
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def configure(self, config: "SearchCacheConfig") -> None:
+        """Replace cache backend and limits from configuration."""
+        self.backend.close()
+        if config.backend == "sqlite":
+            self.backend = SQLiteSearchCacheBackend(config.sqlite_path, max_size=config.max_size, ttl=config.ttl)
+        else:
+            self.backend = InMemorySearchCacheBackend(max_size=config.max_size, ttl=config.ttl)
+        self.enabled = config.enabled
+        logger.info(f"Search cache configured with {config.backend} backend (enabled={config.enabled})")
+
+    @staticmethod
+    def make_key(query: str, max_results: int, include_raw_content: bool) -> str:
+        """Build cache key from search parameters, ignoring case and
+        whitespace differences in the query."""
+        return json.dumps([" ".join(query.casefold().split()), max_results, include_raw_content])
+
+    def get(self, query: str, max_results: int, include_raw_content: bool) -> list[SourceData] | None:
+        """Get copy of cached search results, None on cache miss."""
+        if not self.enabled:
+            return None
+        sources = self.backend.get(self.make_key(query, max_results, include_raw_content))
+        if sources is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        logger.debug(f"Search cache hit for '{query}' ({self.hits} hits, {self.misses} misses)")
+        return [source.model_copy() for source in sources]
+
+    def set(self, query: str, max_results: int, include_raw_content: bool, sources: list[SourceData]) -> None:
+        """Cache copy of search results."""
+        if self.enabled:
+            key = self.make_key(query, max_results, include_raw_content)
+            self.backend.set(key, [source.model_copy() for source in sources])
+
+    def stats(self) -> SearchCacheStats:
+        """Get hit and miss counters."""
+        return SearchCacheStats(hits=self.hits, misses=self.misses, size=len(self.backend))
+
+    def clear(self) -> None:
+        """Drop cached results and reset counters."""
+        self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def close(self) -> None:
+        self.backend.close()
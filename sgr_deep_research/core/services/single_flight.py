@@ -0,0 +1,99 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from functools import partial
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """Deduplication of identical concurrent calls.
+
+    While a call for a key is in flight, other callers for the same key
+    await its result instead of starting their own. Calls run in their
+    own tasks: a cancelled caller only stops waiting, and the call itself
+    is cancelled once no caller is waiting for it anymore.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Future] = {}
+        # in-flight call -> its keys and number of callers waiting for it
+        self._keys: dict[asyncio.Future, list[Hashable]] = {}
+        self._waiters: dict[asyncio.Future, int] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Call func unless a call for key is already in flight, and
+        return its result.
+
+        Args:
+            key: Call identity
+            func: Coroutine function making the call
+
+        Returns:
+            Result of the call (shared between all callers of the key)
+        """
+        return (await self.do_many([key], partial(self._call_one, key, func)))[key]
+
+    async def do_many(
+        self,
+        keys: Iterable[Hashable],
+        func: Callable[[list[Hashable]], Awaitable[dict[Hashable, Any]]],
+    ) -> dict[Hashable, Any]:
+        """Batch variant of do(): keys not in flight are passed to a single
+        func call, the others are awaited from calls already in flight.
+
+        Args:
+            keys: Call identities
+            func: Coroutine function making the call for missing keys and
+                returning results by key
+
+        Returns:
+            Results by key (keys missing in func result map to None)
+        """
+        keys = list(dict.fromkeys(keys))
+        if missing := [key for key in keys if key not in self._calls]:
+            call = asyncio.ensure_future(func(missing))
+            self._keys[call] = missing
+            self._waiters[call] = 0
+            self._calls.update(dict.fromkeys(missing, call))
+            call.add_done_callback(self._forget)
+        if len(missing) < len(keys):
+            logger.debug(f"Joined {len(keys) - len(missing)} in-flight calls")
+
+        calls = {key: self._calls[key] for key in keys}
+        pending = set(calls.values())
+        for call in pending:
+            self._waiters[call] += 1
+        try:
+            # unlike gather(), wait() does not cancel the calls if we are cancelled
+            await asyncio.wait(pending)
+        finally:
+            for call in pending:
+                self._release(call)
+        return {key: call.result().get(key) for key, call in calls.items()}
+
+    @staticmethod
+    async def _call_one(key: Hashable, func: Callable[[], Awaitable[Any]], keys: list[Hashable]) -> dict:
+        return {key: await func()}
+
+    def _release(self, call: asyncio.Future) -> None:
+        if call not in self._waiters:
+            return
+        self._waiters[call] -= 1
+        if self._waiters[call] == 0 and not call.done():
+            # nobody waits for the result anymore, later callers start a new call
+            self._forget(call)
+            call.cancel()
+
+    def _forget(self, call: asyncio.Future) -> None:
+        self._waiters.pop(call, None)
+        for key in self._keys.pop(call, []):
+            if self._calls.get(key) is call:
+                del self._calls[key]
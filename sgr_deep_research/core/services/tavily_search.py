@@ -1,26 +1,81 @@
 import logging
+from functools import partial
+from typing import ClassVar, Self
+from urllib.parse import urlsplit, urlunsplit
 
+import httpx
 from tavily import AsyncTavilyClient
 
-from sgr_deep_research.core.agent_config import GlobalConfig
+from sgr_deep_research.core.agent_definition import SearchConfig
 from sgr_deep_research.core.models import SourceData
+from sgr_deep_research.core.services.page_cache import PageCache, canonicalize_url
+from sgr_deep_research.core.services.search_backend import SearchBackend
+from sgr_deep_research.core.services.search_cache import SearchCache
+from sgr_deep_research.core.services.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
 
-class TavilySearchService:
-    def __init__(self):
-        config = GlobalConfig()
+class TavilySearchService(SearchBackend):
+    """Tavily search client over a pooled keep-alive HTTP connection.
+
+    Services are shared between agents and tools: use get() to obtain
+    the one for a search config instead of creating a client per tool
+    call. Search results are shared by all services through cache, and
+    identical concurrent searches and extracts are sent only once.
+    Extracted pages are kept in page_cache for callers to reuse.
+    """
+
+    name = "tavily"
+    _instances: ClassVar[dict[str, "TavilySearchService"]] = {}
+    _in_flight: ClassVar[SingleFlight] = SingleFlight()
+    cache: ClassVar[SearchCache] = SearchCache()
+    page_cache: ClassVar[PageCache] = PageCache()
+
+    def __init__(self, config: SearchConfig):
+        self.config = config
+        self._http_client = httpx.AsyncClient(
+            base_url=config.tavily_api_base_url,
+            timeout=config.timeout,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+        )
         self._client = AsyncTavilyClient(
-            api_key=config.search.tavily_api_key, api_base_url=config.search.tavily_api_base_url
+            api_key=config.tavily_api_key,
+            api_base_url=config.tavily_api_base_url,
+            client=self._http_client,
         )
-        self._config = config
 
-    @staticmethod
-    def rearrange_sources(sources: list[SourceData], starting_number=1) -> list[SourceData]:
-        for i, source in enumerate(sources, starting_number):
-            source.number = i
-        return sources
+    @classmethod
+    def get(cls, config: SearchConfig) -> Self:
+        """Get shared service for search configuration, creating it on
+        first use.
+
+        Args:
+            config: Search configuration
+
+        Returns:
+            Shared TavilySearchService
+        """
+        key = config.model_dump_json()
+        if (service := cls._instances.get(key)) is None or service._http_client.is_closed:
+            service = cls._instances[key] = cls(config)
+            logger.info(
+                f"Created pooled Tavily client for {config.tavily_api_base_url} ({len(cls._instances)} in pool)"
+            )
+        return service
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close all shared services and their connection pools."""
+        services, cls._instances = list(cls._instances.values()), {}
+        for service in services:
+            await service._http_client.aclose()
+        if services:
+            logger.info(f"Closed {len(services)} pooled Tavily clients")
 
     async def search(
         self,
@@ -39,7 +94,18 @@ class TavilySearchService:
         Returns:
             Tuple with tavily answer and list of SourceData
         """
-        max_results = max_results or self._config.search.max_results
+        max_results = max_results or self.config.max_results
+        if (sources := self.cache.get(query, max_results, include_raw_content)) is not None:
+            logger.info(f"🔍 Tavily search (cached): '{query}' (max_results={max_results})")
+            return sources
+
+        key = ("search", self.cache.make_key(query, max_results, include_raw_content))
+        if key in self._in_flight:
+            logger.info(f"🔍 Tavily search (in flight): '{query}' (max_results={max_results})")
+        sources = await self._in_flight.do(key, partial(self._search, query, max_results, include_raw_content))
+        return [source.model_copy() for source in sources]
+
+    async def _search(self, query: str, max_results: int, include_raw_content: bool) -> list[SourceData]:
         logger.info(f"🔍 Tavily search: '{query}' (max_results={max_results})")
 
         # Execute search through Tavily
@@ -51,35 +117,44 @@ class TavilySearchService:
 
         # Convert results to SourceData
         sources = self._convert_to_source_data(response)
+        self.cache.set(query, max_results, include_raw_content, sources)
         return sources
 
     async def extract(self, urls: list[str]) -> list[SourceData]:
         """Extract full content from specific URLs using Tavily Extract API.
 
+        URLs already being extracted for another caller are awaited
+        instead of being requested again.
+
         Args:
             urls: List of URLs to extract content from
 
         Returns:
-            List of SourceData with extracted content
+            List of SourceData with extracted content, under the requested
+            URLs even if Tavily returned a page under another one
         """
-        logger.info(f"📄 Tavily extract: {len(urls)} URLs")
+        extracted = await self._in_flight.do_many((("extract", url) for url in urls), self._extract)
+        sources = [source.model_copy() for source in extracted.values() if source is not None]
+        return self.rearrange_sources(sources, starting_number=0)
 
-        response = await self._client.extract(urls=urls)
+    async def _extract(self, keys: list[tuple[str, str]]) -> dict[tuple[str, str], SourceData]:
+        logger.info(f"📄 Tavily extract: {len(keys)} URLs")
 
-        sources = []
-        for i, result in enumerate(response.get("results", [])):
-            if not result.get("url"):
-                continue
+        urls = [url for _, url in keys]
+        response = await self._client.extract(urls=urls)
+        results = [result for result in response.get("results", []) if result.get("url")]
 
+        sources = {}
+        for url, result in self._match_extract_results(urls, results).items():
             source = SourceData(
-                number=i,
+                number=0,
                 title=result.get("url", "").split("/")[-1] or "Extracted Content",
-                url=result.get("url", ""),
+                url=url,
                 snippet="",
                 full_content=result.get("raw_content", ""),
                 char_count=len(result.get("raw_content", "")),
             )
-            sources.append(source)
+            sources[("extract", url)] = source
 
         failed_urls = response.get("failed_results", [])
         if failed_urls:
@@ -87,6 +162,45 @@ class TavilySearchService:
 
         return sources
 
+    @staticmethod
+    def _match_extract_results(urls: list[str], results: list[dict]) -> dict[str, dict]:
+        """Map extract results to requested URLs.
+
+        Tavily may return a page under a different URL than requested
+        (trailing slash, redirect), so results are matched by exact URL,
+        then by canonical URL, then by position among the remaining ones
+        when every remaining URL got a result.
+        """
+
+        def canonical(url: str) -> str:
+            parts = urlsplit(canonicalize_url(url))
+            return urlunsplit(parts._replace(path=parts.path.rstrip("/") or "/"))
+
+        matched: dict[str, dict] = {}
+        remaining = []
+        for result in results:
+            if result["url"] in urls and result["url"] not in matched:
+                matched[result["url"]] = result
+            else:
+                remaining.append(result)
+
+        by_canonical = {canonical(url): url for url in urls if url not in matched}
+        unmatched = []
+        for result in remaining:
+            url = by_canonical.pop(canonical(result["url"]), None)
+            if url is not None:
+                matched[url] = result
+            else:
+                unmatched.append(result)
+
+        if unmatched:
+            missing = [url for url in urls if url not in matched]
+            if len(missing) == len(unmatched):
+                matched.update(zip(missing, unmatched))
+            else:
+                logger.warning(f"⚠️ Extract results not matching requested URLs: {[r['url'] for r in unmatched]}")
+        return matched
+
     def _convert_to_source_data(self, response: dict) -> list[SourceData]:
         """Convert Tavily response to SourceData list."""
         sources = []
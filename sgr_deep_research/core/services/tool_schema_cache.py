@@ -0,0 +1,59 @@
+import logging
+from typing import TYPE_CHECKING, ClassVar
+
+from openai import pydantic_function_tool
+from openai.types.chat import ChatCompletionFunctionToolParam
+
+if TYPE_CHECKING:
+    from sgr_deep_research.core.base_tool import BaseTool
+
+logger = logging.getLogger(__name__)
+
+
+class ToolSchemaCache:
+    """Process-wide cache of function tool definitions for native tool
+    calling.
+
+    Converting a tool class with pydantic_function_tool generates its
+    strict JSON schema, which is costly with many (e.g. MCP) tools and
+    was repeated on every LLM call. Definitions are static per tool
+    class, so they are built once and shared between agents.
+    """
+
+    _items: ClassVar[dict[tuple[type["BaseTool"], str], ChatCompletionFunctionToolParam]] = {}
+
+    def __init__(self):
+        raise TypeError(f"{self.__class__.__name__} is a static class and cannot be instantiated")
+
+    @classmethod
+    def get(cls, tool: type["BaseTool"], name: str | None = None) -> ChatCompletionFunctionToolParam:
+        """Get function tool definition for a tool class.
+
+        Args:
+            tool: Tool class to convert
+            name: Function name (tool_name of the class by default)
+
+        Returns:
+            Cached function tool definition (must not be mutated)
+        """
+        name = name or tool.tool_name
+        key = (tool, name)
+        if (definition := cls._items.get(key)) is None:
+            definition = cls._items[key] = pydantic_function_tool(tool, name=name, description="")
+        return definition
+
+    @classmethod
+    def invalidate(cls, base: type["BaseTool"] | None = None) -> None:
+        """Drop cached definitions.
+
+        Args:
+            base: Only drop definitions of subclasses of this class (all by default)
+        """
+        if base is None:
+            cls._items.clear()
+            return
+        stale = [key for key in cls._items if issubclass(key[0], base)]
+        for key in stale:
+            del cls._items[key]
+        if stale:
+            logger.debug(f"Invalidated {len(stale)} cached {base.__name__} schemas")
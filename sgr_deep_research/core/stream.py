@@ -1,100 +1,436 @@
 import asyncio
 import json
 import time
+from bisect import bisect_left, bisect_right
+from collections import deque
+from contextlib import aclosing
+from itertools import islice, pairwise
+from json.encoder import encode_basestring_ascii
+from operator import itemgetter
+from typing import AsyncIterator, Literal
 
 from openai.types.chat import ChatCompletionChunk
 
+OverflowPolicy = Literal["drop_oldest", "coalesce"]
+StreamData = str | bytes
+
+# number of oldest adjacent entry pairs coalesce considers per append
+_COALESCE_WINDOW = 16
+
+# placeholder of per-chunk values in precomputed SSE frame templates
+_SLOT = "\x00slot\x00"
+_SLOT_JSON = json.dumps(_SLOT)
+
+
+def _json_str(value: str | None) -> bytes:
+    """JSON-encode optional string, same output as json.dumps but faster."""
+    return b"null" if value is None else encode_basestring_ascii(value).encode()
+
+
+class _Subscription:
+    """Read position of a single stream consumer."""
+
+    def __init__(self, offset: int):
+        self.offset = offset  # sequence number of the next entry to read
+
 
 class StreamingGenerator:
-    def __init__(self):
-        self.queue = asyncio.Queue()
+    """Bounded broadcaster of stream data to any number of subscribers.
+
+    Data is kept in a ring buffer of (sequence number, data) entries, each
+    subscriber reads it at its own offset, so a disconnected client does
+    not block others and a reconnecting client can replay from a sequence
+    number. finish() ends the current segment: subscribers stop there and
+    the next default subscriber starts after it (e.g. after clarification).
 
-    def add(self, data: str):
-        self.queue.put_nowait(data)
+    When the buffer is full, the overflow policy makes room:
+    - drop_oldest: the oldest entry is discarded (lagging subscribers skip it)
+    - coalesce: two oldest adjacent entries no subscriber is positioned
+      between are merged, as long as the merged entry stays within
+      max_entry_bytes, falling back to drop_oldest if there are none
+
+    Independently of the policy, oldest entries are dropped while the
+    buffered data exceeds max_bytes.
+
+    release() marks the stream complete: once its last segment has been
+    read, the buffer is emptied and later subscribers end right away, so
+    finished streams kept around do not hold their replay data.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        overflow: OverflowPolicy = "drop_oldest",
+        max_bytes: int = 16 * 1024 * 1024,
+        max_entry_bytes: int = 64 * 1024,
+    ):
+        if max_size < 2:
+            raise ValueError("max_size must be at least 2")
+        self.max_size = max_size
+        self.overflow = overflow
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.dropped = 0
+        self._buffer: deque[tuple[int, StreamData | None]] = deque()
+        self._size = 0  # total length of buffered data
+        self._next_seq = 0
+        self._resume_seq = 0  # default start: after the last consumed segment
+        self._subscriptions: set[_Subscription] = set()
+        self._updated = asyncio.Event()
+        self.released = False
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the last added entry (-1 if none)."""
+        return self._next_seq - 1
+
+    def add(self, data: StreamData):
+        self._append(data)
 
     def finish(self):
-        self.queue.put_nowait(None)  # Завершающий сигнал
+        self._append(None)  # Завершающий сигнал
+
+    def close(self):
+        """End the stream of a generator replaced by another one.
+
+        Current subscribers stop after the data added so far and later
+        ones end right away.
+        """
+        self._append(None)
+        self.release()
+
+    def release(self):
+        """Mark the stream complete, nothing is added after this call."""
+        self.released = True
+        self._trim()
+        self._updated.set()
+        self._updated = asyncio.Event()
+
+    def _trim(self):
+        """Drop entries of a released stream no subscriber has left to
+        read."""
+        if not self.released:
+            return
+        keep_from = min((subscription.offset for subscription in self._subscriptions), default=self._resume_seq)
+        keep_from = min(keep_from, self._resume_seq)
+        while self._buffer and self._buffer[0][0] < keep_from:
+            _, data = self._buffer.popleft()
+            if data is not None:
+                self._size -= len(data)
 
-    async def stream(self):
-        while True:
-            data = await self.queue.get()
-            if data is None:  # Завершающий символ
-                break
-            yield data
+    def _append(self, data: StreamData | None):
+        if len(self._buffer) >= self.max_size:
+            self._make_room()
+        self._buffer.append((self._next_seq, data))
+        self._next_seq += 1
+        if data is not None:
+            self._size += len(data)
+            while self._size > self.max_bytes and len(self._buffer) > 1:
+                self._drop_oldest()
+        self._updated.set()
+        self._updated = asyncio.Event()
+
+    def _make_room(self):
+        if self.overflow == "coalesce" and self._coalesce():
+            return
+        self._drop_oldest()
+
+    def _drop_oldest(self):
+        _, data = self._buffer.popleft()
+        if data is not None:
+            self._size -= len(data)
+        self.dropped += 1
+
+    def _coalesce(self) -> bool:
+        # Only a few oldest pairs are considered and merged entries are
+        # bounded, so making room costs the same however long the stream is
+        offsets = sorted(subscription.offset for subscription in self._subscriptions)
+        for i, ((seq_a, data_a), (seq_b, data_b)) in enumerate(islice(pairwise(self._buffer), _COALESCE_WINDOW)):
+            if data_a is None or data_b is None or len(data_a) + len(data_b) > self.max_entry_bytes:
+                continue
+            j = bisect_right(offsets, seq_a)
+            if j < len(offsets) and offsets[j] <= seq_b:
+                continue  # subscriber has read data_a but not data_b
+            self._buffer[i + 1] = (seq_b, data_a + data_b)
+            del self._buffer[i]
+            return True
+        return False
+
+    def _next_entry(self, subscription: _Subscription) -> tuple[int, StreamData | None] | None:
+        if not self._buffer or self._buffer[-1][0] < subscription.offset:
+            return None
+        if self._buffer[0][0] >= subscription.offset:
+            return self._buffer[0]
+        return self._buffer[bisect_left(self._buffer, subscription.offset, key=itemgetter(0))]
+
+    async def subscribe(self, from_seq: int | None = None) -> AsyncIterator[tuple[int, StreamData]]:
+        """Read (sequence number, data) entries until the end of segment.
+
+        Args:
+            from_seq: Sequence number to replay from (start of the
+                unconsumed segment by default). Entries already dropped
+                from the buffer are skipped.
+        """
+        subscription = _Subscription(self._resume_seq if from_seq is None else from_seq)
+        self._subscriptions.add(subscription)
+        try:
+            while True:
+                if (entry := self._next_entry(subscription)) is None:
+                    if self.released:
+                        break
+                    await self._updated.wait()
+                    continue
+                seq, data = entry
+                subscription.offset = seq + 1
+                if data is None:  # Завершающий символ
+                    self._resume_seq = max(self._resume_seq, seq + 1)
+                    break
+                yield seq, data
+        finally:
+            self._subscriptions.discard(subscription)
+            self._trim()
+
+    async def stream(self, from_seq: int | None = None) -> AsyncIterator[StreamData]:
+        async with aclosing(self.subscribe(from_seq)) as entries:
+            async for _, data in entries:
+                yield data
 
 
 class OpenAIStreamingGenerator(StreamingGenerator):
-    def __init__(self, model="gpt-4o"):
-        super().__init__()
+    """Streams agent output as OpenAI chat.completion.chunk SSE frames.
+
+    Token deltas are the hottest path, so frames are assembled from
+    envelope bytes precomputed once per generator with only the delta
+    values JSON-encoded per call, and enqueued as bytes.
+
+    With coalesce_ms > 0 consecutive content deltas are batched into a
+    single frame, flushed after coalesce_ms or once coalesce_bytes of
+    content is pending, and immediately before any other frame (tool
+    calls, finish).
+    """
+
+    def __init__(
+        self,
+        model="gpt-4o",
+        max_size: int = 10000,
+        overflow: OverflowPolicy = "drop_oldest",
+        max_bytes: int = 16 * 1024 * 1024,
+        coalesce_ms: float = 0,
+        coalesce_bytes: int = 4096,
+    ):
+        super().__init__(max_size=max_size, overflow=overflow, max_bytes=max_bytes)
+        self.coalesce_ms = coalesce_ms
+        self.coalesce_bytes = coalesce_bytes
+        self._pending: list[bytes] = []  # JSON-escaped content without quotes
+        self._pending_key: tuple | None = None  # how pending content is framed
+        self._pending_size = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+
         self.model = model
         self.fingerprint = f"fp_{hex(hash(model))[-8:]}"
         self.id = f"chatcmpl-{int(time.time())}{hash(str(time.time()))}"[:29]
         self.created = int(time.time())
         self.choice_index = 0
 
-    def add_chunk(self, chunk: ChatCompletionChunk):
-        chunk.model = self.model
-        super().add(f"data: {chunk.model_dump_json()}\n\n")
+        self._content_frame = self._frame_template(
+            {
+                "delta": {"content": _SLOT, "role": "assistant", "tool_calls": None},
+                "index": self.choice_index,
+                "finish_reason": None,
+                "logprobs": None,
+            }
+        )
+        self._delta_frame = self._frame_template(
+            {"delta": _SLOT, "index": _SLOT, "finish_reason": _SLOT, "logprobs": None}
+        )
+        self._tool_call_frame = self._frame_template(
+            {
+                "delta": {
+                    "tool_calls": [
+                        {
+                            "index": 0,
+                            "id": _SLOT,
+                            "type": "function",
+                            "function": {"name": _SLOT, "arguments": _SLOT},
+                        }
+                    ]
+                },
+                "index": self.choice_index,
+                "logprobs": None,
+                "finish_reason": None,
+            }
+        )
+        self._finish_frame = self._frame_template(
+            {"index": self.choice_index, "delta": {}, "logprobs": None, "finish_reason": _SLOT},
+            usage=_SLOT,
+        )
 
-    def add_chunk_from_str(self, content: str):
+    def _frame_template(self, choice: dict, usage: dict | str | None = None) -> list[bytes]:
+        """Split SSE frame into constant byte parts around _SLOT values."""
         response = {
             "id": self.id,
             "object": "chat.completion.chunk",
             "created": self.created,
             "model": self.model,
             "system_fingerprint": self.fingerprint,
-            "choices": [
-                {
-                    "delta": {"content": content, "role": "assistant", "tool_calls": None},
-                    "index": self.choice_index,
-                    "finish_reason": None,
-                    "logprobs": None,
-                }
-            ],
-            "usage": None,
+            "choices": [choice],
+            "usage": usage,
         }
-        super().add(f"data: {json.dumps(response)}\n\n")
+        return [part.encode() for part in f"data: {json.dumps(response)}\n\n".split(_SLOT_JSON)]
+
+    @staticmethod
+    def _fill(template: list[bytes], *values: bytes) -> bytes:
+        parts = [template[0]]
+        for value, part in zip(values, template[1:]):
+            parts += (value, part)
+        return b"".join(parts)
+
+    @staticmethod
+    def _with_event_id(seq: int, data: bytes) -> bytes:
+        # coalesced entries hold several frames: the id goes to the last one,
+        # so a client resumes after everything it has received
+        last_frame = data.rfind(b"\n\n", 0, len(data) - 2)
+        last_frame = last_frame + 2 if last_frame >= 0 else 0
+        return b"%sid: %d\n%s" % (data[:last_frame], seq, data[last_frame:])
+
+    async def event_stream(self, last_event_id: int | None = None) -> AsyncIterator[bytes]:
+        """Stream SSE frames carrying event ids.
+
+        Args:
+            last_event_id: Last-Event-ID of a reconnecting client, the
+                stream resumes right after it from the replay buffer
+        """
+        from_seq = None if last_event_id is None else last_event_id + 1
+        async with aclosing(self.subscribe(from_seq)) as entries:
+            async for seq, data in entries:
+                yield self._with_event_id(seq, data)
+
+    def add(self, data: StreamData):
+        self.flush()
+        super().add(data)
+
+    def _add_content(self, key: tuple, content: str) -> None:
+        """Add content delta, batching it when coalescing is enabled."""
+        if not self.coalesce_ms:
+            super().add(self._content_frame_of(key, _json_str(content)))
+            return
+        if key != self._pending_key:
+            self.flush()
+            self._pending_key = key
+        escaped = _json_str(content)[1:-1]
+        self._pending.append(escaped)
+        self._pending_size += len(escaped)
+        if self._pending_size >= self.coalesce_bytes:
+            self.flush()
+        elif self._flush_handle is None:
+            try:
+                self._flush_handle = asyncio.get_running_loop().call_later(self.coalesce_ms / 1000, self.flush)
+            except RuntimeError:  # no event loop to schedule on
+                self.flush()
+
+    def _content_frame_of(self, key: tuple, content_json: bytes) -> bytes:
+        if key[0] == "str":
+            return self._fill(self._content_frame, content_json)
+        _, role, index = key
+        delta_json = b'{"content": %s, "role": %s}' % (content_json, _json_str(role))
+        return self._fill(self._delta_frame, delta_json, b"%d" % index, b"null")
+
+    def flush(self) -> None:
+        """Emit pending coalesced content deltas as a single frame."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        content_json = b'"%s"' % b"".join(self._pending)
+        self._pending.clear()
+        self._pending_size = 0
+        super().add(self._content_frame_of(self._pending_key, content_json))
+
+    def add_chunk(self, chunk: ChatCompletionChunk):
+        """Add LLM chunk, re-enveloped with this generator's id and model."""
+        if not chunk.choices:
+            return  # usage-only chunk, usage is accounted by the agent
+        if len(chunk.choices) != 1 or chunk.usage is not None or chunk.choices[0].logprobs is not None:
+            chunk.model = self.model
+            self.add(f"data: {chunk.model_dump_json()}\n\n".encode())
+            return
+
+        choice = chunk.choices[0]
+        delta = choice.delta
+        if delta.tool_calls is None and delta.function_call is None and delta.refusal is None and not delta.model_extra:
+            # plain token delta
+            if delta.content is not None and choice.finish_reason is None:
+                self._add_content(("chunk", delta.role, choice.index), delta.content)
+                return
+            delta_json = b'{"content": %s, "role": %s}' % (_json_str(delta.content), _json_str(delta.role))
+        else:
+            delta_json = delta.model_dump_json().encode()
+        self.add(
+            self._fill(
+                self._delta_frame,
+                delta_json,
+                b"%d" % choice.index,
+                _json_str(choice.finish_reason),
+            )
+        )
+
+    def add_chunk_from_str(self, content: str):
+        self._add_content(("str",), content)
 
     def add_tool_call(self, tool_call_id: str, function_name: str, arguments: str):
         """Добавляет tool call chunk."""
-        response = {
-            "id": self.id,
-            "object": "chat.completion.chunk",
-            "created": self.created,
-            "model": self.model,
-            "system_fingerprint": f"fp_{hex(hash(self.model))[-8:]}",
-            "choices": [
-                {
-                    "delta": {
-                        "tool_calls": [
-                            {
-                                "index": 0,
-                                "id": tool_call_id,
-                                "type": "function",
-                                "function": {"name": function_name, "arguments": arguments},
-                            }
-                        ]
-                    },
-                    "index": self.choice_index,
-                    "logprobs": None,
-                    "finish_reason": None,
-                }
-            ],
-            "usage": None,
-        }
-        super().add(f"data: {json.dumps(response)}\n\n")
+        self.add(
+            self._fill(
+                self._tool_call_frame,
+                _json_str(tool_call_id),
+                _json_str(function_name),
+                _json_str(arguments),
+            )
+        )
 
-    def finish(self, finish_reason: str = "stop"):
-        """Завершает stream с финальным chunk и usage."""
-        final_response = {
-            "id": self.id,
-            "object": "chat.completion.chunk",
-            "created": self.created,
-            "model": self.model,
-            "system_fingerprint": f"fp_{hex(hash(self.model))[-8:]}",
-            "choices": [{"index": self.choice_index, "delta": {}, "logprobs": None, "finish_reason": finish_reason}],
-            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
-        }
-        super().add(f"data: {json.dumps(final_response)}\n\n")
-        super().add("data: [DONE]\n\n")
+    def finish(self, finish_reason: str = "stop", usage: dict[str, int] | None = None):
+        """Завершает stream с финальным chunk и usage.
+
+        Args:
+            finish_reason: Finish reason of the final chunk
+            usage: Token usage reported in the final chunk (zeros by default)
+        """
+        usage = usage or {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        self.add(self._fill(self._finish_frame, _json_str(finish_reason), json.dumps(usage).encode()))
+        self.add(b"data: [DONE]\n\n")
         super().finish()
+
+    def close(self):
+        self.flush()
+        super().close()
+
+
+class SinkStreamingGenerator(OpenAIStreamingGenerator):
+    """No-op streaming generator for non-streaming completions.
+
+    Agent output is discarded without building any frames; finished is
+    set whenever the agent finishes streaming (completion or
+    clarification pause).
+    """
+
+    def __init__(self, model="gpt-4o"):
+        super().__init__(model=model, max_size=2)
+        self.finished = asyncio.Event()
+
+    def add(self, data: StreamData):
+        pass
+
+    def add_chunk(self, chunk: ChatCompletionChunk):
+        pass
+
+    def add_chunk_from_str(self, content: str):
+        pass
+
+    def add_tool_call(self, tool_call_id: str, function_name: str, arguments: str):
+        pass
+
+    def finish(self, finish_reason: str = "stop", usage: dict[str, int] | None = None):
+        # frames are not added, but the segment still ends for any subscriber
+        super().finish(finish_reason, usage)
+        self.finished.set()
@@ -12,6 +12,7 @@ from sgr_deep_research.core.tools.create_report_tool import CreateReportTool
 from sgr_deep_research.core.tools.extract_page_content_tool import ExtractPageContentTool
 from sgr_deep_research.core.tools.final_answer_tool import FinalAnswerTool
 from sgr_deep_research.core.tools.generate_plan_tool import GeneratePlanTool
+from sgr_deep_research.core.tools.multi_web_search_tool import MultiWebSearchTool
 from sgr_deep_research.core.tools.reasoning_tool import ReasoningTool
 from sgr_deep_research.core.tools.web_search_tool import WebSearchTool
 
@@ -40,6 +41,7 @@ __all__ = [
     "ClarificationTool",
     "GeneratePlanTool",
     "WebSearchTool",
+    "MultiWebSearchTool",
     "ExtractPageContentTool",
     "AdaptPlanTool",
     "CreateReportTool",
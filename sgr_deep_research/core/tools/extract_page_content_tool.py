@@ -7,6 +7,10 @@ from pydantic import Field
 
 from sgr_deep_research.core.agent_config import GlobalConfig
 from sgr_deep_research.core.base_tool import BaseTool
+from sgr_deep_research.core.services.content_normalizer import ContentNormalizer
+from sgr_deep_research.core.services.page_cache import PageCache
+from sgr_deep_research.core.services.passage_selector import PassageSelector, query_text
+from sgr_deep_research.core.services.search_backend import SearchBackend
 from sgr_deep_research.core.services.tavily_search import TavilySearchService
 
 if TYPE_CHECKING:
@@ -35,37 +39,69 @@ class ExtractPageContentTool(BaseTool):
     reasoning: str = Field(description="Why extract these specific pages")
     urls: list[str] = Field(description="List of URLs to extract full content from", min_length=1, max_length=5)
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self._search_service = TavilySearchService()
-
     async def __call__(self, context: ResearchContext) -> str:
         """Extract full content from specified URLs."""
 
         logger.info(f"📄 Extracting content from {len(self.urls)} URLs")
 
-        sources = await self._search_service.extract(urls=self.urls)
+        search_service = context.search_service or SearchBackend.for_config(GlobalConfig().search)
+        # Only pages missing in the shared page cache are extracted, results keep the requested order.
+        # Local backend documents are read from its index directly.
+        page_cache = (
+            TavilySearchService.page_cache if search_service.config.backend == "tavily" else PageCache(enabled=False)
+        )
+        urls = list(dict.fromkeys(self.urls))
+        pages = {url: page for url in urls if (page := page_cache.get(url)) is not None}
+        if missing := [url for url in urls if url not in pages]:
+            for source in await search_service.extract(urls=missing):
+                page_cache.set(source)
+                pages[source.url] = source
+        if len(missing) < len(urls):
+            logger.info(f"📄 {len(urls) - len(missing)} of {len(urls)} pages served from page cache")
+        sources = [pages.pop(url) for url in urls if url in pages] + list(pages.values())
+
+        config = search_service.config
+        # The page cache keeps raw contents, normalization depends on the agent search config
+        if config.content_normalization and (extracted := [source for source in sources if source.char_count]):
+            normalizer = ContentNormalizer(
+                boilerplate_min_pages=config.boilerplate_min_pages, duplicate_threshold=config.duplicate_threshold
+            )
+            for source, content in zip(
+                extracted,
+                normalizer.normalize(
+                    [source.full_content for source in extracted], [source.url for source in extracted]
+                ),
+                strict=True,
+            ):
+                source.full_content = content
 
         # Update existing sources instead of overwriting
         for source in sources:
             if source.url in context.sources:
                 # URL already exists, update with full content but keep original number
                 existing = context.sources[source.url]
-                existing.full_content = source.full_content
+                existing.content = source.content
                 existing.char_count = source.char_count
             else:
                 # New URL, add with next number
                 source.number = len(context.sources) + 1
                 context.sources[source.url] = source
 
+        # Pages over the content limit are reduced to passages relevant to the task and current reasoning
+        selector = PassageSelector(config.passage_chars) if config.passage_selection else None
+        query = query_text(context.task, self.reasoning, context.current_step_reasoning)
+
         formatted_result = "Extracted Page Content:\n\n"
 
         # Format results using sources from context (to get correct numbers)
         for url in self.urls:
             if url in context.sources:
                 source = context.sources[url]
-                if source.full_content:
-                    content_preview = source.full_content[: GlobalConfig().search.content_limit]
+                if source.char_count:
+                    if selector is not None and source.char_count > config.content_limit:
+                        content_preview = selector.select(source.full_content, query, config.content_limit)
+                    else:
+                        content_preview = source.read_content(0, config.content_limit)
                     formatted_result += (
                         f"{str(source)}\n\n**Full Content:**\n"
                         f"{content_preview}\n\n"
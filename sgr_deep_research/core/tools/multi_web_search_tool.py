@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from pydantic import Field
+
+from sgr_deep_research.core.agent_config import GlobalConfig
+from sgr_deep_research.core.base_tool import BaseTool
+from sgr_deep_research.core.models import SearchResult, SourceData
+from sgr_deep_research.core.services.search_backend import SearchBackend
+
+if TYPE_CHECKING:
+    from sgr_deep_research.core.models import ResearchContext
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class MultiWebSearchTool(BaseTool):
+    """Search the web for several queries at once.
+    Use this tool instead of WebSearchTool when a topic needs to be researched from several angles:
+    all queries are searched in parallel within a single step.
+    Returns: Page titles, URLs, and short snippets (100 characters) for each query
+    Best for: Covering different aspects, synonyms or languages of a question at once
+
+    Usage:
+        - Make each query cover a DIFFERENT angle, do not repeat the same query in other words
+        - Use SPECIFIC terms and context in queries
+        - Search queries in SAME LANGUAGE as user request
+        - For date/number questions, include specific year/context in query
+        - Each query counts as one search against the search limit
+        - Use ExtractPageContentTool to get full content from found URLs
+    """
+
+    reasoning: str = Field(description="Why these searches are needed and what to expect")
+    queries: list[str] = Field(
+        description="Distinct search queries in same language as user request", min_length=1, max_length=5
+    )
+    max_results: int = Field(
+        default_factory=lambda: min(GlobalConfig().search.max_results, 10),
+        description="Maximum results per query",
+        ge=1,
+        le=10,
+    )
+
+    async def _search(self, search_service: SearchBackend, query: str, context: ResearchContext) -> list[SourceData]:
+        async with context.search_semaphore or contextlib.nullcontext():
+            return await search_service.search(query=query, max_results=self.max_results, include_raw_content=False)
+
+    async def __call__(self, context: ResearchContext) -> str:
+        """Execute web searches concurrently using the configured search backend."""
+
+        queries = list(dict.fromkeys(self.queries))
+        reserved = context.reserve_searches(len(queries))
+        queries, skipped = queries[:reserved], queries[reserved:]
+        logger.info(f"🔍 Search queries: {queries}")
+
+        search_service = context.search_service or SearchBackend.for_config(GlobalConfig().search)
+        results = await asyncio.gather(
+            *(self._search(search_service, query, context) for query in queries), return_exceptions=True
+        )
+
+        formatted_result = ""
+        for query, sources in zip(queries, results):
+            formatted_result += f"Search Query: {query}\n\n"
+            if isinstance(sources, BaseException):
+                logger.error(f"Search '{query}' failed: {sources}")
+                context.release_searches(1)
+                formatted_result += f"Search failed: {sources}\n\n"
+                continue
+
+            # Merge into context sources, URLs found before keep their numbers
+            citations = []
+            for source in sources:
+                if source.url not in context.sources:
+                    source.number = len(context.sources) + 1
+                    context.sources[source.url] = source
+                citations.append(context.sources[source.url])
+            context.searches.append(
+                SearchResult(query=query, answer=None, citations=citations, timestamp=datetime.now())
+            )
+
+            formatted_result += "Search Results (titles, links, short snippets):\n\n"
+            for source in citations:
+                snippet = source.snippet[:100] + "..." if len(source.snippet) > 100 else source.snippet
+                formatted_result += f"{str(source)}\n{snippet}\n\n"
+
+        if skipped:
+            formatted_result += f"Search limit reached, queries not searched: {skipped}\n"
+
+        logger.debug(formatted_result)
+        return formatted_result
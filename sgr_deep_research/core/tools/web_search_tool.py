@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import logging
 from datetime import datetime
 from typing import TYPE_CHECKING
@@ -9,7 +10,7 @@ from pydantic import Field
 from sgr_deep_research.core.agent_config import GlobalConfig
 from sgr_deep_research.core.base_tool import BaseTool
 from sgr_deep_research.core.models import SearchResult
-from sgr_deep_research.core.services.tavily_search import TavilySearchService
+from sgr_deep_research.core.services.search_backend import SearchBackend
 
 if TYPE_CHECKING:
     from sgr_deep_research.core.models import ResearchContext
@@ -52,22 +53,26 @@ class WebSearchTool(BaseTool):
         le=10,
     )
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self._search_service = TavilySearchService()
-
     async def __call__(self, context: ResearchContext) -> str:
-        """Execute web search using TavilySearchService."""
+        """Execute web search using the configured search backend."""
 
+        if not context.reserve_searches(1):
+            return f"Search limit reached, query not searched: {self.query}\n"
         logger.info(f"🔍 Search query: '{self.query}'")
 
-        sources = await self._search_service.search(
-            query=self.query,
-            max_results=self.max_results,
-            include_raw_content=False,
-        )
+        search_service = context.search_service or SearchBackend.for_config(GlobalConfig().search)
+        try:
+            async with context.search_semaphore or contextlib.nullcontext():
+                sources = await search_service.search(
+                    query=self.query,
+                    max_results=self.max_results,
+                    include_raw_content=False,
+                )
+        except BaseException:
+            context.release_searches(1)
+            raise
 
-        sources = TavilySearchService.rearrange_sources(sources, starting_number=len(context.sources) + 1)
+        sources = SearchBackend.rearrange_sources(sources, starting_number=len(context.sources) + 1)
 
         for source in sources:
             context.sources[source.url] = source
@@ -87,6 +92,5 @@ class WebSearchTool(BaseTool):
             snippet = source.snippet[:100] + "..." if len(source.snippet) > 100 else source.snippet
             formatted_result += f"{str(source)}\n{snippet}\n\n"
 
-        context.searches_used += 1
         logger.debug(formatted_result)
         return formatted_result
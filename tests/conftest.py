@@ -67,6 +67,22 @@ def create_test_agent(
     )
 
 
+def pytest_addoption(parser):
+    """Add option enabling timing benchmarks."""
+    parser.addoption("--benchmark", action="store_true", default=False, help="Run tests marked as benchmark")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless requested, wall clock timings are unreliable
+    on shared runners."""
+    if config.getoption("--benchmark"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="benchmark, run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
 @pytest.fixture
 def mock_openai_client():
     """Create a mock OpenAI client."""
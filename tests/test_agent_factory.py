@@ -7,12 +7,14 @@ instantiation.
 from unittest.mock import Mock, patch
 
 import pytest
+from fastmcp.mcp_config import MCPConfig
 
 from sgr_deep_research.core.agent_definition import (
     AgentDefinition,
     ExecutionConfig,
     LLMConfig,
     PromptsConfig,
+    SearchConfig,
 )
 from sgr_deep_research.core.agent_factory import AgentFactory
 from sgr_deep_research.core.agents import (
@@ -23,6 +25,7 @@ from sgr_deep_research.core.agents import (
     ToolCallingAgent,
 )
 from sgr_deep_research.core.base_agent import BaseAgent
+from sgr_deep_research.core.services import MCP2ToolConverter, TavilySearchService
 from sgr_deep_research.core.tools import BaseTool, ReasoningTool
 
 
@@ -346,6 +349,106 @@ class TestAgentFactoryClientCreation:
         assert client._client is not None
 
 
+class TestAgentFactoryClientPool:
+    """Tests for pooled OpenAI clients in AgentFactory."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        AgentFactory._clients.clear()
+
+    def test_same_config_reuses_client(self):
+        """Test that agents with the same endpoint share one client."""
+        client1 = AgentFactory.get_client(LLMConfig(api_key="test-key", model="gpt-4o-mini"))
+        client2 = AgentFactory.get_client(LLMConfig(api_key="test-key", model="gpt-4o", temperature=0.1))
+
+        assert client1 is client2
+        assert len(AgentFactory._clients) == 1
+
+    def test_different_config_creates_new_client(self):
+        """Test that different api_key, base_url or proxy get separate
+        clients."""
+        base = AgentFactory.get_client(LLMConfig(api_key="test-key"))
+
+        assert AgentFactory.get_client(LLMConfig(api_key="other-key")) is not base
+        assert AgentFactory.get_client(LLMConfig(api_key="test-key", base_url="http://localhost:8000/v1")) is not base
+        assert AgentFactory.get_client(LLMConfig(api_key="test-key", proxy="http://127.0.0.1:8080")) is not base
+        assert len(AgentFactory._clients) == 4
+
+    def test_client_uses_connection_limits(self):
+        """Test that connection pool limits are taken from configuration."""
+        client = AgentFactory.get_client(
+            LLMConfig(api_key="test-key", max_connections=7, max_keepalive_connections=3, keepalive_expiry=5.0)
+        )
+        pool = client._client._transport._pool
+
+        assert pool._max_connections == 7
+        assert pool._max_keepalive_connections == 3
+        assert pool._keepalive_expiry == 5.0
+
+    @pytest.mark.asyncio
+    async def test_close_clients(self):
+        """Test that close_clients closes and empties the pool."""
+        client = AgentFactory.get_client(LLMConfig(api_key="test-key"))
+
+        await AgentFactory.close_clients()
+
+        assert client.is_closed()
+        assert AgentFactory._clients == {}
+        assert AgentFactory.get_client(LLMConfig(api_key="test-key")) is not client
+
+    @pytest.mark.asyncio
+    async def test_create_agents_share_client(self):
+        """Test that agents created by the factory share the pooled
+        client."""
+        with (
+            patch("sgr_deep_research.core.agent_factory.MCP2ToolConverter.build_tools_from_mcp", return_value=[]),
+            mock_global_config(),
+        ):
+            agent_def = AgentDefinition(
+                name="sgr_agent",
+                base_class=SGRAgent,
+                tools=[ReasoningTool],
+                llm={"api_key": "test-key", "base_url": "https://api.openai.com/v1"},
+                prompts={
+                    "system_prompt_str": "Test system prompt",
+                    "initial_user_request_str": "Test initial request",
+                    "clarification_response_str": "Test clarification response",
+                },
+                execution={},
+            )
+            agent1 = await AgentFactory.create(agent_def, task="Task 1")
+            agent2 = await AgentFactory.create(agent_def, task="Task 2")
+
+            assert agent1.openai_client is agent2.openai_client
+
+    @pytest.mark.asyncio
+    async def test_create_injects_shared_search_service(self):
+        """Test that agents get the shared search service of their search
+        config through the context."""
+        with (
+            patch("sgr_deep_research.core.agent_factory.MCP2ToolConverter.build_tools_from_mcp", return_value=[]),
+            mock_global_config(),
+        ):
+            agent_def = AgentDefinition(
+                name="sgr_agent",
+                base_class=SGRAgent,
+                tools=[ReasoningTool],
+                llm={"api_key": "test-key"},
+                prompts={
+                    "system_prompt_str": "Test system prompt",
+                    "initial_user_request_str": "Test initial request",
+                    "clarification_response_str": "Test clarification response",
+                },
+                execution={},
+            )
+            agent_def.search = SearchConfig(tavily_api_key="search-key")
+            agent1 = await AgentFactory.create(agent_def, task="Task 1")
+            agent2 = await AgentFactory.create(agent_def, task="Task 2")
+
+            assert agent1._context.search_service is TavilySearchService.get(agent_def.search)
+            assert agent1._context.search_service is agent2._context.search_service
+
+
 class TestAgentFactoryRegistryIntegration:
     """Tests for AgentFactory integration with registries."""
 
@@ -511,6 +614,14 @@ class TestAgentFactoryErrorHandling:
 class TestAgentFactoryMCPIntegration:
     """Tests for MCP tools integration in AgentFactory."""
 
+    def setup_method(self):
+        """Setup for each test method."""
+        MCP2ToolConverter.clear()
+
+    def teardown_method(self):
+        """Cleanup after each test method."""
+        MCP2ToolConverter.clear()
+
     @pytest.mark.asyncio
     async def test_create_agent_with_mcp_tools(self):
         """Test creating agent with MCP tools."""
@@ -586,6 +697,65 @@ class TestAgentFactoryMCPIntegration:
             assert ReasoningTool in agent.toolkit
             assert len(agent.toolkit) == 3
 
+    @pytest.mark.asyncio
+    async def test_mcp_tools_discovered_once(self):
+        """Test that agents of the same MCP config reuse discovered tools
+        until refresh."""
+
+        class MockMCPTool(BaseTool):
+            tool_name = "mcp_cached_tool"
+            description = "Mock MCP tool"
+
+        with (
+            patch(
+                "sgr_deep_research.core.agent_factory.MCP2ToolConverter.build_tools_from_mcp",
+                return_value=[MockMCPTool],
+            ) as build_tools,
+            mock_global_config(),
+        ):
+            agent_def = AgentDefinition(
+                name="sgr_agent",
+                base_class=SGRAgent,
+                tools=[ReasoningTool],
+                llm={"api_key": "test-key", "base_url": "https://api.openai.com/v1"},
+                prompts={
+                    "system_prompt_str": "Test system prompt",
+                    "initial_user_request_str": "Test initial request",
+                    "clarification_response_str": "Test clarification response",
+                },
+                execution={},
+            )
+            first = await AgentFactory.create(agent_def, task="Test task")
+            second = await AgentFactory.create(agent_def, task="Test task")
+            assert build_tools.await_count == 1
+
+            assert await MCP2ToolConverter.refresh() == 1
+            assert build_tools.await_count == 2
+
+        assert MockMCPTool in first.toolkit
+        assert MockMCPTool in second.toolkit
+
+    @pytest.mark.asyncio
+    async def test_mcp_tools_rediscovered_after_ttl(self):
+        """Test that cached MCP tools expire after mcp_tools_ttl."""
+        config = MCPConfig(mcpServers={"test": {"url": "http://localhost:9999/mcp"}})
+        global_config = Mock(execution=ExecutionConfig(mcp_tools_ttl=10))
+
+        with (
+            patch("sgr_deep_research.core.services.mcp_service.GlobalConfig", return_value=global_config),
+            patch.object(MCP2ToolConverter, "build_tools_from_mcp", return_value=[]) as build_tools,
+        ):
+            await MCP2ToolConverter.get_tools(config)
+            await MCP2ToolConverter.get_tools(config)
+            assert build_tools.await_count == 1
+
+            key = config.model_dump_json()
+            built_at, tools = MCP2ToolConverter._tools[key]
+            MCP2ToolConverter._tools[key] = (built_at - 11, tools)
+            await MCP2ToolConverter.get_tools(config)
+
+        assert build_tools.await_count == 2
+
 
 class TestAgentFactoryDefinitionsList:
     """Tests for getting agent definitions list."""
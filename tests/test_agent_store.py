@@ -0,0 +1,378 @@
+"""Tests for AgentStore and snapshot backends.
+
+This module contains tests for agent storage used by the API, including
+eviction of finished agents and snapshot persistence.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from sgr_deep_research.api.endpoints import agents_storage, get_agent_state, get_agents_list
+from sgr_deep_research.core.agent_config import AgentStoreConfig
+from sgr_deep_research.core.agents import SGRAgent
+from sgr_deep_research.core.models import AgentStatesEnum, SourceData
+from sgr_deep_research.core.services.agent_store import (
+    AgentFilter,
+    AgentSnapshot,
+    AgentStore,
+    InMemorySnapshotBackend,
+    SQLiteSnapshotBackend,
+)
+from tests.conftest import create_test_agent
+
+
+def create_finished_agent(task: str = "Test task", state: AgentStatesEnum = AgentStatesEnum.COMPLETED) -> SGRAgent:
+    """Create an agent that has finished its execution."""
+    agent = create_test_agent(SGRAgent, task=task)
+    agent._context.state = state
+    agent._context.execution_result = f"Result of {task}"
+    agent._context.sources = {"https://example.com": SourceData(number=1, url="https://example.com")}
+    agent.conversation.append({"role": "user", "content": task})
+    agent.log.append({"step_number": 1, "step_type": "reasoning"})
+    return agent
+
+
+def create_agents_timeline(store: AgentStore, count: int) -> list[SGRAgent]:
+    """Store agents created one minute apart, alternating completed and
+    failed states."""
+    start = datetime(2025, 1, 1)
+    agents = []
+    for i in range(count):
+        state = AgentStatesEnum.COMPLETED if i % 2 == 0 else AgentStatesEnum.FAILED
+        agent = create_finished_agent(f"Task {i}", state=state)
+        agent.creation_time = start + timedelta(minutes=i)
+        store[agent.id] = agent
+        agents.append(agent)
+    return agents
+
+
+class TestAgentSnapshot:
+    """Tests for AgentSnapshot serialization."""
+
+    def test_snapshot_from_agent(self):
+        """Test that snapshot captures context, conversation and log."""
+        agent = create_finished_agent()
+
+        snapshot = AgentSnapshot.from_agent(agent)
+
+        assert snapshot.agent_id == agent.id
+        assert snapshot.state == AgentStatesEnum.COMPLETED
+        assert snapshot.context["execution_result"] == "Result of Test task"
+        assert "https://example.com" in snapshot.context["sources"]
+        assert "clarification_received" not in snapshot.context
+        assert snapshot.conversation == agent.conversation
+        assert snapshot.log == agent.log
+
+    def test_snapshot_json_roundtrip(self):
+        """Test that snapshot survives JSON serialization."""
+        snapshot = AgentSnapshot.from_agent(create_finished_agent())
+
+        restored = AgentSnapshot.model_validate_json(snapshot.model_dump_json())
+
+        assert restored == snapshot
+
+
+class TestAgentStoreEviction:
+    """Tests for eviction of finished agents."""
+
+    def test_running_agents_are_never_evicted(self):
+        """Test that unfinished agents stay in memory."""
+        store = AgentStore(max_finished_agents=0)
+        agent = create_test_agent(SGRAgent)
+        agent._context.state = AgentStatesEnum.RESEARCHING
+
+        store[agent.id] = agent
+
+        assert store.get(agent.id) is agent
+        assert len(store.backend) == 0
+
+    def test_finished_agents_beyond_limit_are_evicted(self):
+        """Test that oldest finished agents are moved to the backend."""
+        store = AgentStore(max_finished_agents=1)
+        agents = [create_finished_agent(f"Task {i}") for i in range(3)]
+
+        for agent in agents:
+            store[agent.id] = agent
+
+        assert store.get(agents[0].id) is None
+        assert store.get(agents[1].id) is None
+        assert store.get(agents[2].id) is agents[2]
+        assert agents[0].id in store
+        assert len(store) == 3
+
+    def test_snapshot_of_evicted_agent(self):
+        """Test that evicted agent state is available through snapshot."""
+        store = AgentStore(max_finished_agents=0)
+        agent = create_finished_agent()
+        store[agent.id] = agent
+
+        snapshot = store.snapshot(agent.id)
+
+        assert store.get(agent.id) is None
+        assert snapshot.context["execution_result"] == "Result of Test task"
+
+    def test_summaries_include_live_and_evicted(self):
+        """Test that summaries list agents from memory and backend."""
+        store = AgentStore(max_finished_agents=0)
+        finished = create_finished_agent("Finished")
+        running = create_test_agent(SGRAgent, task="Running")
+        store[finished.id] = finished
+        store[running.id] = running
+
+        summaries = {summary.agent_id: summary for summary in store.list_agents().items}
+
+        assert summaries[finished.id].state == AgentStatesEnum.COMPLETED
+        assert summaries[running.id].task == "Running"
+
+    def test_close_snapshots_live_agents(self):
+        """Test that closing the store persists agents still in memory."""
+        backend = InMemorySnapshotBackend()
+        store = AgentStore(backend=backend)
+        agent = create_test_agent(SGRAgent)
+        store[agent.id] = agent
+
+        store.close()
+
+        assert backend.get(agent.id).agent_id == agent.id
+
+    @pytest.mark.parametrize("state", [AgentStatesEnum.RESEARCHING, AgentStatesEnum.WAITING_FOR_CLARIFICATION])
+    def test_close_marks_interrupted_agents_failed(self, tmp_path, state):
+        """Test that agents interrupted by shutdown are not stored as
+        running."""
+        store = AgentStore(backend=SQLiteSnapshotBackend(str(tmp_path / "agents.db")))
+        agent = create_finished_agent(state=state)
+        finished = create_finished_agent()
+        store[agent.id] = agent
+        store[finished.id] = finished
+
+        store.close()
+        reopened = SQLiteSnapshotBackend(str(tmp_path / "agents.db"))
+
+        assert reopened.get(agent.id).state == AgentStatesEnum.FAILED
+        assert reopened.get(agent.id).context["state"] == AgentStatesEnum.FAILED.value
+        assert reopened.get(finished.id).state == AgentStatesEnum.COMPLETED
+        assert reopened.count(AgentFilter(states={state})) == 0
+        reopened.close()
+
+    def test_configure_selects_backend(self, tmp_path):
+        """Test that configuration selects the snapshot backend."""
+        store = AgentStore()
+
+        store.configure(AgentStoreConfig(backend="sqlite", sqlite_path=str(tmp_path / "agents.db")))
+
+        assert isinstance(store.backend, SQLiteSnapshotBackend)
+        store.close()
+
+
+class TestAgentStoreListing:
+    """Tests for paginated and filtered agent listing."""
+
+    @pytest.fixture(params=["memory", "sqlite"])
+    def store(self, request, tmp_path):
+        """Store keeping two live agents with the selected backend."""
+        backend = (
+            InMemorySnapshotBackend() if request.param == "memory" else SQLiteSnapshotBackend(str(tmp_path / "a.db"))
+        )
+        store = AgentStore(backend=backend, max_finished_agents=2)
+        yield store
+        backend.close()
+
+    def test_pages_cover_all_agents_newest_first(self, store):
+        """Test that following cursors yields every agent once in creation
+        order."""
+        agents = create_agents_timeline(store, 7)
+
+        listed, cursor = [], None
+        while True:
+            page = store.list_agents(limit=3, cursor=cursor)
+            assert page.total == 7
+            listed.extend(summary.agent_id for summary in page.items)
+            if (cursor := page.next_cursor) is None:
+                break
+
+        assert listed == [agent.id for agent in reversed(agents)]
+
+    def test_filter_by_state(self, store):
+        """Test that only agents in requested states are listed."""
+        agents = create_agents_timeline(store, 7)
+
+        page = store.list_agents(AgentFilter(states={AgentStatesEnum.FAILED}), limit=2)
+
+        assert page.total == 3
+        assert [summary.agent_id for summary in page.items] == [agents[5].id, agents[3].id]
+        assert page.next_cursor is not None
+
+    def test_filter_by_creation_time(self, store):
+        """Test that created_after is inclusive and created_before is
+        exclusive."""
+        agents = create_agents_timeline(store, 7)
+
+        page = store.list_agents(
+            AgentFilter(created_after=agents[2].creation_time, created_before=agents[5].creation_time)
+        )
+
+        assert page.total == 3
+        assert [summary.agent_id for summary in page.items] == [agents[4].id, agents[3].id, agents[2].id]
+        assert page.next_cursor is None
+
+    def test_invalid_cursor(self, store):
+        """Test that malformed cursor is rejected."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            store.list_agents(cursor="not-a-cursor")
+
+    def test_memory_index_follows_replaced_and_evicted_snapshots(self):
+        """Test that state index drops snapshots removed by LRU and
+        replacement."""
+        backend = InMemorySnapshotBackend(max_size=2)
+        snapshots = [AgentSnapshot.from_agent(create_finished_agent(f"Task {i}")) for i in range(3)]
+
+        for snapshot in snapshots:
+            backend.save(snapshot)
+        backend.save(snapshots[2].model_copy(update={"state": AgentStatesEnum.FAILED}))
+
+        assert backend.count(AgentFilter()) == 2
+        assert backend.count(AgentFilter(states={AgentStatesEnum.FAILED})) == 1
+        assert [summary.agent_id for summary in backend.query(AgentFilter(), None, 10)] == [
+            snapshots[2].agent_id,
+            snapshots[1].agent_id,
+        ]
+
+
+class TestInMemorySnapshotBackend:
+    """Tests for in-memory snapshot backend."""
+
+    def test_lru_eviction(self):
+        """Test that least recently used snapshots are dropped beyond
+        max_size."""
+        backend = InMemorySnapshotBackend(max_size=2)
+        snapshots = [AgentSnapshot.from_agent(create_finished_agent(f"Task {i}")) for i in range(3)]
+
+        backend.save(snapshots[0])
+        backend.save(snapshots[1])
+        backend.get(snapshots[0].agent_id)  # refresh first snapshot
+        backend.save(snapshots[2])
+
+        assert snapshots[0].agent_id in backend
+        assert snapshots[1].agent_id not in backend
+        assert len(backend) == 2
+
+    def test_ttl_expiration(self):
+        """Test that snapshots older than ttl are dropped."""
+        backend = InMemorySnapshotBackend(ttl=10)
+        snapshot = AgentSnapshot.from_agent(create_finished_agent())
+
+        with patch("sgr_deep_research.core.services.agent_store.time.monotonic", return_value=100.0):
+            backend.save(snapshot)
+        with patch("sgr_deep_research.core.services.agent_store.time.monotonic", return_value=105.0):
+            assert backend.get(snapshot.agent_id) is not None
+        with patch("sgr_deep_research.core.services.agent_store.time.monotonic", return_value=111.0):
+            assert backend.get(snapshot.agent_id) is None
+            assert len(backend) == 0
+
+
+class TestSQLiteSnapshotBackend:
+    """Tests for SQLite snapshot backend."""
+
+    def test_save_and_get(self, tmp_path):
+        """Test storing and loading a snapshot."""
+        backend = SQLiteSnapshotBackend(str(tmp_path / "agents.db"))
+        snapshot = AgentSnapshot.from_agent(create_finished_agent())
+
+        backend.save(snapshot)
+
+        assert backend.get(snapshot.agent_id) == snapshot
+        assert backend.get("missing") is None
+        assert len(backend) == 1
+        backend.close()
+
+    def test_snapshots_survive_reopen(self, tmp_path):
+        """Test that snapshots persist across backend instances
+        (restarts)."""
+        path = str(tmp_path / "agents.db")
+        snapshot = AgentSnapshot.from_agent(create_finished_agent())
+        backend = SQLiteSnapshotBackend(path)
+        backend.save(snapshot)
+        backend.close()
+
+        reopened = SQLiteSnapshotBackend(path)
+
+        assert snapshot.agent_id in reopened
+        assert reopened.query(AgentFilter(), None, 10)[0].creation_time == snapshot.creation_time
+        reopened.close()
+
+    def test_ttl_expiration(self, tmp_path):
+        """Test that expired snapshots are not returned."""
+        backend = SQLiteSnapshotBackend(str(tmp_path / "agents.db"), ttl=10)
+        snapshot = AgentSnapshot.from_agent(create_finished_agent())
+
+        with patch("sgr_deep_research.core.services.agent_store.time.time", return_value=1000.0):
+            backend.save(snapshot)
+        with patch("sgr_deep_research.core.services.agent_store.time.time", return_value=1011.0):
+            assert backend.get(snapshot.agent_id) is None
+            assert backend.query(AgentFilter(), None, 10) == []
+            assert backend.count(AgentFilter()) == 0
+        backend.close()
+
+
+class TestEndpointsWithEvictedAgents:
+    """Tests for API endpoints serving evicted agents."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        agents_storage.clear()
+        self._max_finished_agents = agents_storage.max_finished_agents
+        agents_storage.max_finished_agents = 0
+
+    def teardown_method(self):
+        """Teardown for each test method."""
+        agents_storage.max_finished_agents = self._max_finished_agents
+        agents_storage.clear()
+
+    @pytest.mark.asyncio
+    async def test_get_state_of_evicted_agent(self):
+        """Test that state endpoint works after agent eviction."""
+        agent = create_finished_agent()
+        agents_storage[agent.id] = agent
+        assert agents_storage.get(agent.id) is None
+
+        response = await get_agent_state(agent.id)
+
+        assert response.agent_id == agent.id
+        assert response.state == AgentStatesEnum.COMPLETED.value
+        assert response.execution_result == "Result of Test task"
+        assert response.sources_count == 1
+
+    @pytest.mark.asyncio
+    async def test_list_includes_evicted_agent(self):
+        """Test that agents list includes evicted agents."""
+        agent = create_finished_agent()
+        agents_storage[agent.id] = agent
+
+        response = await get_agents_list()
+
+        assert response.total == 1
+        assert response.agents[0].agent_id == agent.id
+
+    @pytest.mark.asyncio
+    async def test_list_pagination_and_filters(self):
+        """Test agents list endpoint pagination and state filter."""
+        agents = create_agents_timeline(agents_storage, 5)
+
+        first = await get_agents_list(state=[AgentStatesEnum.COMPLETED], limit=2)
+        second = await get_agents_list(state=[AgentStatesEnum.COMPLETED], limit=2, cursor=first.next_cursor)
+
+        assert first.total == 3
+        assert [item.agent_id for item in first.agents] == [agents[4].id, agents[2].id]
+        assert [item.agent_id for item in second.agents] == [agents[0].id]
+        assert second.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_list_invalid_cursor(self):
+        """Test that invalid cursor results in 400 error."""
+        with pytest.raises(HTTPException) as exc_info:
+            await get_agents_list(cursor="broken")
+
+        assert exc_info.value.status_code == 400
@@ -17,11 +17,21 @@ from sgr_deep_research.api.endpoints import (
     extract_user_content_from_messages,
     get_agent_state,
     get_agents_list,
+    get_mcp_stats,
     provide_clarification,
+    refresh_mcp_tools,
+    resume_agent_stream,
+)
+from sgr_deep_research.api.models import (
+    ChatCompletionRequest,
+    ChatCompletionResponse,
+    ChatMessage,
+    ClarificationRequest,
 )
-from sgr_deep_research.api.models import ChatCompletionRequest, ChatMessage, ClarificationRequest
 from sgr_deep_research.core.agents import SGRAgent
 from sgr_deep_research.core.models import AgentStatesEnum
+from sgr_deep_research.core.services.mcp_session_pool import LatencyHistogram
+from sgr_deep_research.core.stream import SinkStreamingGenerator
 from tests.conftest import create_test_agent
 
 
@@ -123,7 +133,7 @@ class TestChatCompletionEndpoint:
         """Test successful creation of new agent."""
         mock_agent = Mock()
         mock_agent.id = "test_agent_12345678-1234-1234-1234-123456789012"
-        mock_agent.streaming_generator.stream.return_value = iter(["chunk1", "chunk2"])
+        mock_agent.streaming_generator.event_stream.return_value = iter(["chunk1", "chunk2"])
 
         # Use actual async function instead of AsyncMock to avoid warnings
         async def mock_execute():
@@ -161,9 +171,53 @@ class TestChatCompletionEndpoint:
             # Verify execute task was created
             mock_create_task.assert_called_once()
 
+    @staticmethod
+    def create_finishing_agent(state: AgentStatesEnum = AgentStatesEnum.COMPLETED) -> SGRAgent:
+        """Create agent whose execution streams output and finishes with
+        given state."""
+        agent = create_test_agent(SGRAgent, task="Test task")
+
+        async def mock_execute():
+            agent.streaming_generator.add_chunk_from_str("token")
+            agent._context.usage.add(Mock(prompt_tokens=10, completion_tokens=5, total_tokens=15))
+            agent._context.execution_result = "Final answer"
+            agent._context.state = state
+            agent.streaming_generator.finish()
+
+        agent.execute = mock_execute
+        return agent
+
+    @patch("sgr_deep_research.api.endpoints.AgentFactory")
     @pytest.mark.asyncio
-    async def test_non_streaming_request_raises_error(self):
-        """Test that non-streaming request raises HTTPException."""
+    async def test_non_streaming_completion(self, mock_factory):
+        """Test that non-streaming request returns final result and usage."""
+        agent = self.create_finishing_agent()
+        mock_agent_def = Mock()
+        mock_agent_def.name = "sgr_agent"
+        mock_factory.get_definitions_list.return_value = [mock_agent_def]
+        mock_factory.create = AsyncMock(return_value=agent)
+        request = ChatCompletionRequest(
+            model="sgr_agent", messages=[ChatMessage(role="user", content="Test task")], stream=False
+        )
+
+        response = await create_chat_completion(request)
+
+        assert isinstance(response, ChatCompletionResponse)
+        assert response.model == agent.id
+        assert response.choices[0].message.content == "Final answer"
+        assert response.choices[0].finish_reason == "stop"
+        assert response.usage == {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+        assert isinstance(agent.streaming_generator, SinkStreamingGenerator)
+        assert list(agent.streaming_generator._buffer) == [(0, None)]  # no frames, only the end of segment
+
+    @patch("sgr_deep_research.api.endpoints.AgentFactory")
+    @pytest.mark.asyncio
+    async def test_non_streaming_failed_agent(self, mock_factory):
+        """Test that failed agent results in 500 error."""
+        mock_agent_def = Mock()
+        mock_agent_def.name = "sgr_agent"
+        mock_factory.get_definitions_list.return_value = [mock_agent_def]
+        mock_factory.create = AsyncMock(return_value=self.create_finishing_agent(AgentStatesEnum.FAILED))
         request = ChatCompletionRequest(
             model="sgr_agent", messages=[ChatMessage(role="user", content="Test task")], stream=False
         )
@@ -171,8 +225,105 @@ class TestChatCompletionEndpoint:
         with pytest.raises(HTTPException) as exc_info:
             await create_chat_completion(request)
 
-        assert exc_info.value.status_code == 501
-        assert "Only streaming responses are supported" in str(exc_info.value.detail)
+        assert exc_info.value.status_code == 500
+
+    @pytest.mark.asyncio
+    async def test_non_streaming_clarification(self):
+        """Test non-streaming clarification returns the resumed result."""
+        agent = create_test_agent(SGRAgent, task="Test task")
+        agent._context.state = AgentStatesEnum.WAITING_FOR_CLARIFICATION
+        agents_storage[agent.id] = agent
+
+        async def mock_provide_clarification(clarifications):
+            agent._context.execution_result = f"Answer for {clarifications}"
+            agent._context.state = AgentStatesEnum.COMPLETED
+            asyncio.get_running_loop().call_soon(agent.streaming_generator.finish)
+
+        agent.provide_clarification = mock_provide_clarification
+        request = ChatCompletionRequest(
+            model=agent.id, messages=[ChatMessage(role="user", content="details")], stream=False
+        )
+
+        response = await create_chat_completion(request)
+
+        assert response.choices[0].message.content == "Answer for details"
+
+    @staticmethod
+    def create_clarifying_agent() -> SGRAgent:
+        """Create agent whose execution asks for clarification, then
+        answers."""
+        agent = create_test_agent(SGRAgent, task="Test task")
+
+        async def mock_execute():
+            agent.streaming_generator.add_chunk_from_str("question")
+            agent.conversation.append({"role": "tool", "content": "question"})
+            agent._context.state = AgentStatesEnum.WAITING_FOR_CLARIFICATION
+            agent.streaming_generator.finish()
+            await agent._context.clarification_received.wait()
+            agent.streaming_generator.add_chunk_from_str("answer")
+            agent._context.state = AgentStatesEnum.COMPLETED
+            agent.streaming_generator.finish()
+            agent.streaming_generator.release()
+
+        agent.execute = mock_execute
+        return agent
+
+    @staticmethod
+    async def read_body(response) -> bytes:
+        """Read streaming response body, failing if it does not end."""
+
+        async def read():
+            return b"".join([chunk async for chunk in response.body_iterator])
+
+        return await asyncio.wait_for(read(), 1)
+
+    @patch("sgr_deep_research.api.endpoints.AgentFactory")
+    @pytest.mark.asyncio
+    async def test_streaming_clarification_after_non_streaming_start(self, mock_factory):
+        """Test that an agent created with stream=false streams the answer
+        to a streaming clarification."""
+        agent = self.create_clarifying_agent()
+        mock_agent_def = Mock()
+        mock_agent_def.name = "sgr_agent"
+        mock_factory.get_definitions_list.return_value = [mock_agent_def]
+        mock_factory.create = AsyncMock(return_value=agent)
+
+        response = await create_chat_completion(
+            ChatCompletionRequest(
+                model="sgr_agent", messages=[ChatMessage(role="user", content="Test task")], stream=False
+            )
+        )
+        assert response.choices[0].message.content == "question"
+
+        response = await create_chat_completion(
+            ChatCompletionRequest(model=agent.id, messages=[ChatMessage(role="user", content="details")], stream=True)
+        )
+        body = await self.read_body(response)
+
+        assert not isinstance(agent.streaming_generator, SinkStreamingGenerator)
+        assert b'"answer"' in body and b"[DONE]" in body
+
+    @patch("sgr_deep_research.api.endpoints.AgentFactory")
+    @pytest.mark.asyncio
+    async def test_resume_stream_after_non_streaming_start(self, mock_factory):
+        """Test that reconnecting to an agent paused in a non-streaming
+        request receives its later output."""
+        agent = self.create_clarifying_agent()
+        mock_agent_def = Mock()
+        mock_agent_def.name = "sgr_agent"
+        mock_factory.get_definitions_list.return_value = [mock_agent_def]
+        mock_factory.create = AsyncMock(return_value=agent)
+        await create_chat_completion(
+            ChatCompletionRequest(
+                model="sgr_agent", messages=[ChatMessage(role="user", content="Test task")], stream=False
+            )
+        )
+
+        response = await resume_agent_stream(agent.id)
+        await agent.provide_clarification("details")
+        body = await self.read_body(response)
+
+        assert b'"answer"' in body
 
     @pytest.mark.asyncio
     async def test_invalid_model_raises_error(self):
@@ -200,7 +351,7 @@ class TestChatCompletionEndpoint:
             pass
 
         agent.provide_clarification = Mock(side_effect=mock_provide_clarification)
-        agent.streaming_generator.stream = Mock(return_value=iter(["clarification response"]))
+        agent.streaming_generator.event_stream = Mock(return_value=iter(["clarification response"]))
 
         request = ChatCompletionRequest(
             model=agent.id, messages=[ChatMessage(role="user", content="Here is my clarification")], stream=True
@@ -238,6 +389,18 @@ class TestAgentStateEndpoint:
         assert response.task == "Test task"
         assert response.sources_count == 2
 
+    @pytest.mark.asyncio
+    async def test_get_agent_state_usage(self):
+        """Test that agent state exposes total and per-phase token usage."""
+        agent = create_test_agent(SGRAgent, task="Test task")
+        agent._context.add_usage(Mock(prompt_tokens=10, completion_tokens=5, total_tokens=15), "reasoning")
+        agents_storage[agent.id] = agent
+
+        response = await get_agent_state(agent.id)
+
+        assert response.usage == {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+        assert response.phase_usage["reasoning"]["total_tokens"] == 15
+
     @pytest.mark.asyncio
     async def test_get_agent_state_not_found(self):
         """Test agent state retrieval for non-existent agent."""
@@ -304,7 +467,7 @@ class TestProvideClarificationEndpoint:
             pass
 
         agent.provide_clarification = Mock(side_effect=mock_provide_clarification)
-        agent.streaming_generator.stream = Mock(return_value=iter(["clarification response"]))
+        agent.streaming_generator.event_stream = Mock(return_value=iter(["clarification response"]))
         agents_storage[agent.id] = agent
 
         request = ClarificationRequest(clarifications="This is my clarification")
@@ -351,6 +514,92 @@ class TestProvideClarificationEndpoint:
         assert "Test error" in str(exc_info.value.detail)
 
 
+class TestResumeAgentStreamEndpoint:
+    """Tests for resume_agent_stream endpoint."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        agents_storage.clear()
+
+    @staticmethod
+    async def read_body(response) -> list[str]:
+        return [frame.decode() async for frame in response.body_iterator]
+
+    @pytest.mark.asyncio
+    async def test_resume_after_last_event_id(self):
+        """Test that reconnect replays only events after Last-Event-ID."""
+        agent = create_test_agent(SGRAgent, task="Test task")
+        agents_storage[agent.id] = agent
+        for content in ["one", "two", "three"]:
+            agent.streaming_generator.add_chunk_from_str(content)
+        agent.streaming_generator.finish()
+
+        response = await resume_agent_stream(agent.id, last_event_id=0)
+        frames = await self.read_body(response)
+
+        assert response.media_type == "text/event-stream"
+        assert [frame.split("\n", 1)[0] for frame in frames] == ["id: 1", "id: 2", "id: 3", "id: 4"]
+        assert '"content": "two"' in frames[0]
+        assert frames[-1] == "id: 4\ndata: [DONE]\n\n"
+
+    @pytest.mark.asyncio
+    async def test_resume_agent_not_found(self):
+        """Test that resuming stream of unknown agent returns 404."""
+        with pytest.raises(HTTPException) as exc_info:
+            await resume_agent_stream("non_existent_agent_id")
+
+        assert exc_info.value.status_code == 404
+
+
+class TestRefreshMCPToolsEndpoint:
+    """Tests for refresh_mcp_tools endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_rediscovers_tools(self):
+        """Test that refresh rediscovers tools of all definitions."""
+        with patch(
+            "sgr_deep_research.api.endpoints.AgentFactory.load_mcp_tools", new=AsyncMock(return_value=3)
+        ) as load_mcp_tools:
+            response = await refresh_mcp_tools()
+
+        load_mcp_tools.assert_awaited_once_with(refresh=True)
+        assert response.tools_count == 3
+
+    @pytest.mark.asyncio
+    async def test_refresh_failure_returns_502(self):
+        """Test that unreachable MCP servers return 502."""
+        with patch(
+            "sgr_deep_research.api.endpoints.AgentFactory.load_mcp_tools",
+            new=AsyncMock(side_effect=ConnectionError("server down")),
+        ):
+            with pytest.raises(HTTPException) as exc_info:
+                await refresh_mcp_tools()
+
+        assert exc_info.value.status_code == 502
+
+
+class TestMCPStatsEndpoint:
+    """Tests for get_mcp_stats endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_stats_by_tool(self):
+        """Test that latency histograms are summarized by tool."""
+        histogram = LatencyHistogram()
+        histogram.observe(0.02)
+        histogram.observe(0.2, error=True)
+
+        with patch("sgr_deep_research.api.endpoints.MCPSessionPool.latency_stats", return_value={"search": histogram}):
+            response = await get_mcp_stats()
+
+        stats = response.tools["search"]
+        assert stats.calls == 2
+        assert stats.errors == 1
+        assert stats.mean_seconds == pytest.approx(0.11)
+        assert stats.p50_seconds == 0.025
+        assert stats.histogram["0.025"] == 1
+        assert stats.histogram["0.25"] == 1
+
+
 class TestAgentStorageIntegration:
     """Tests for agent storage integration across endpoints."""
 
@@ -7,9 +7,10 @@ flow.
 
 import uuid
 from datetime import datetime
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
+from openai.types import CompletionUsage
 
 from sgr_deep_research.core.base_agent import BaseAgent
 from sgr_deep_research.core.models import AgentStatesEnum, ResearchContext
@@ -243,6 +244,59 @@ class TestBaseAgentLogging:
         assert log_entry["agent_tool_execution_result"] == result
 
 
+class TestBaseAgentUsageAccounting:
+    """Tests for LLM token usage accounting."""
+
+    @pytest.mark.asyncio
+    async def test_final_completion_accounts_usage(self):
+        """Test that final completion usage is added to context and log."""
+        agent = create_test_agent(BaseAgent, task="Test")
+        agent._context.iteration = 2
+        completion = Mock(usage=CompletionUsage(prompt_tokens=100, completion_tokens=20, total_tokens=120))
+        stream = Mock(get_final_completion=AsyncMock(return_value=completion))
+
+        result = await agent._final_completion(stream, "reasoning")
+
+        assert result is completion
+        assert agent._context.usage.total_tokens == 120
+        assert agent._context.phase_usage["reasoning"].prompt_tokens == 100
+        assert agent.log[-1]["step_type"] == "llm_usage"
+        assert agent.log[-1]["step_number"] == 2
+        assert agent.log[-1]["usage"] == {"prompt_tokens": 100, "completion_tokens": 20, "total_tokens": 120}
+
+    @pytest.mark.asyncio
+    async def test_final_completion_without_usage(self):
+        """Test that providers not reporting usage are tolerated."""
+        agent = create_test_agent(BaseAgent, task="Test")
+        stream = Mock(get_final_completion=AsyncMock(return_value=Mock(usage=None)))
+
+        await agent._final_completion(stream, "action_selection")
+
+        assert agent._context.usage.total_tokens == 0
+        assert agent.log == []
+
+
+class TestBaseAgentStreamRelease:
+    """Tests for releasing stream replay data of finished agents."""
+
+    @pytest.mark.asyncio
+    async def test_finished_agent_releases_stream(self):
+        """Test that the replay buffer is emptied once output of a finished
+        agent is read."""
+        agent = create_test_agent(BaseAgent, task="Test")
+        agent._reasoning_phase = AsyncMock(side_effect=RuntimeError("LLM error"))
+        agent._save_agent_log = Mock()
+        agent.streaming_generator.add_chunk_from_str("partial output")
+
+        await agent.execute()
+        frames = [frame async for frame in agent.streaming_generator.event_stream()]
+
+        assert agent._context.state == AgentStatesEnum.FAILED
+        assert frames
+        assert agent.streaming_generator.released
+        assert len(agent.streaming_generator._buffer) == 0
+
+
 class TestBaseAgentAbstractMethods:
     """Tests for abstract methods that must be implemented by subclasses."""
 
@@ -0,0 +1,182 @@
+"""Tests for ContentNormalizer.
+
+This module contains tests for whitespace collapsing, boilerplate and
+near-duplicate removal, and their use by ExtractPageContentTool.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from sgr_deep_research.core.agent_definition import SearchConfig
+from sgr_deep_research.core.models import ResearchContext, SourceData
+from sgr_deep_research.core.services.content_normalizer import ContentNormalizer
+from sgr_deep_research.core.services.tavily_search import TavilySearchService
+from sgr_deep_research.core.tools import ExtractPageContentTool
+
+MENU = "Home | News | Sport | Weather"
+COOKIES = "We use cookies to improve your experience. Accept all"
+
+
+def create_page(body: str) -> str:
+    """Create page content surrounded by site boilerplate."""
+    return f"{MENU}\n\n{COOKIES}\n\n{body}\n\n© 2024 Example News"
+
+
+class TestContentNormalizer:
+    """Tests for ContentNormalizer passes."""
+
+    def test_whitespace_collapsed(self):
+        """Test that spaces are squeezed and blank lines merged."""
+        normalizer = ContentNormalizer()
+
+        result = normalizer.normalize(["  first\t\t line  \n\n\n\n second  line \n\n"])
+
+        assert result == ["first line\n\nsecond line"]
+
+    def test_boilerplate_lines_removed_across_pages(self):
+        """Test that short lines found on several pages are removed from
+        all of them."""
+        normalizer = ContentNormalizer()
+
+        result = normalizer.normalize([create_page("First article text."), create_page("Second article text.")])
+
+        assert result == ["First article text.", "Second article text."]
+
+    def test_single_page_keeps_lines(self):
+        """Test that boilerplate detection needs several pages."""
+        normalizer = ContentNormalizer()
+
+        result = normalizer.normalize([create_page("Article text.")])
+
+        assert MENU in result[0]
+        assert "Article text." in result[0]
+
+    def test_long_lines_are_not_boilerplate(self):
+        """Test that long lines shared by pages are kept."""
+        quote = "A long quoted paragraph " * 10
+        normalizer = ContentNormalizer(boilerplate_max_chars=100)
+
+        result = normalizer.normalize([quote, quote])
+
+        assert result == [quote.strip(), quote.strip()]
+
+    def test_shared_fact_on_other_sites_kept(self):
+        """Test that a sentence quoted by articles of different sites is
+        not boilerplate."""
+        fact = "Apple reported revenue of $94.8 billion for the quarter."
+        normalizer = ContentNormalizer()
+
+        result = normalizer.normalize(
+            [f"Markets rallied.\n\n{fact}", f"{fact}\n\nAnalysts expected less."],
+            ["https://news.example.com/apple", "https://www.finance.example.org/q2"],
+        )
+
+        assert result == [f"Markets rallied.\n\n{fact}", f"{fact}\n\nAnalysts expected less."]
+
+    def test_boilerplate_removed_per_site(self):
+        """Test that boilerplate is found among pages of the same site."""
+        normalizer = ContentNormalizer()
+
+        result = normalizer.normalize(
+            [create_page("First article text."), create_page("Second article text."), create_page("Other site.")],
+            ["https://a.com/1", "https://www.a.com/2", "https://b.com/1"],
+        )
+
+        assert result[:2] == ["First article text.", "Second article text."]
+        assert MENU in result[2]
+
+    def test_identical_pages_kept(self):
+        """Test that copies of one page (URL variants, mirrors) keep their
+        content."""
+        page = create_page("The only article text.")
+        normalizer = ContentNormalizer()
+
+        result = normalizer.normalize([page, page], ["https://a.com/1", "https://a.com/1/"])
+
+        assert result == [page] * 2
+
+    def test_line_making_up_most_of_page_kept(self):
+        """Test that a page is not emptied by lines it shares with
+        others."""
+        normalizer = ContentNormalizer()
+
+        result = normalizer.normalize(["Short shared paragraph.", f"Short shared paragraph.\n\n{'Long text. ' * 5}"])
+
+        assert result[0] == "Short shared paragraph."
+        assert result[1] == ("Long text. " * 5).strip()
+
+    def test_near_duplicate_paragraphs_removed(self):
+        """Test that nearly identical paragraphs are kept once."""
+        normalizer = ContentNormalizer(duplicate_threshold=0.7)
+        paragraph = "The quick brown fox jumps over the lazy dog near the river bank today"
+
+        result = normalizer.normalize([f"{paragraph}\n\nOther text here.\n\n{paragraph}!\n\n{paragraph} again"])
+
+        assert result == [f"{paragraph}\n\nOther text here."]
+
+    def test_different_paragraphs_kept(self):
+        """Test that paragraphs sharing a few words are not removed."""
+        normalizer = ContentNormalizer()
+        text = "The tower is 330 metres tall.\n\nThe tower was opened in 1889 for the fair."
+
+        assert normalizer.normalize([text]) == [text]
+
+    def test_character_counts_logged(self, caplog):
+        """Test that characters before and after normalization are
+        logged."""
+        normalizer = ContentNormalizer()
+
+        with caplog.at_level("INFO", logger="sgr_deep_research.core.services.content_normalizer"):
+            normalizer.normalize(["a    b"])
+
+        assert "6 -> 3 characters" in caplog.text
+
+
+class TestExtractNormalization:
+    """Tests for content normalization in ExtractPageContentTool."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        TavilySearchService.page_cache.clear()
+
+    def teardown_method(self):
+        """Cleanup after each test method."""
+        TavilySearchService.page_cache.clear()
+
+    def create_context(self, content_normalization: bool) -> ResearchContext:
+        """Create context with a mocked search service returning two pages
+        of one site."""
+        config = SearchConfig(tavily_api_key="key", content_normalization=content_normalization)
+        search_service = Mock(config=config)
+        search_service.extract = AsyncMock(
+            return_value=[
+                SourceData(number=0, url="https://a.com/1", full_content=create_page("First article.")),
+                SourceData(number=1, url="https://a.com/2", full_content=create_page("Second article.")),
+            ]
+        )
+        return ResearchContext(search_service=search_service)
+
+    @pytest.mark.asyncio
+    async def test_extract_strips_boilerplate(self):
+        """Test that extracted sources keep normalized contents while the
+        page cache keeps raw ones."""
+        context = self.create_context(content_normalization=True)
+        tool = ExtractPageContentTool(reasoning="Test", urls=["https://a.com/1", "https://a.com/2"])
+
+        result = await tool(context)
+
+        assert COOKIES not in result
+        assert context.sources["https://a.com/1"].full_content == "First article."
+        assert context.sources["https://a.com/1"].char_count == len("First article.")
+        assert COOKIES in TavilySearchService.page_cache.get("https://a.com/1").full_content
+
+    @pytest.mark.asyncio
+    async def test_extract_without_normalization_keeps_raw_content(self):
+        """Test that disabled normalization keeps raw page contents."""
+        context = self.create_context(content_normalization=False)
+        tool = ExtractPageContentTool(reasoning="Test", urls=["https://a.com/1", "https://a.com/2"])
+
+        result = await tool(context)
+
+        assert COOKIES in result
@@ -0,0 +1,121 @@
+"""Tests for ContentStore.
+
+This module contains tests for the chunked on-disk spool of page
+contents and SourceData content handles.
+"""
+
+import gc
+
+import pytest
+
+from sgr_deep_research.core.content_store import ContentStore
+from sgr_deep_research.core.models import SourceData
+from sgr_deep_research.core.services.search_cache import SQLiteSearchCacheBackend
+
+TEXT = "Цена BMW X6 — 100 000 € " * 50
+
+
+class TestContentStore:
+    """Tests for storing and slicing contents."""
+
+    @pytest.fixture
+    def store(self):
+        """Store with small chunks to exercise chunk boundaries."""
+        store = ContentStore(chunk_chars=7)
+        yield store
+        store.close()
+
+    def test_put_and_read(self, store):
+        """Test that the whole text is read back."""
+        handle = store.put(TEXT)
+
+        assert handle.read() == TEXT
+        assert len(handle) == len(TEXT)
+        assert "".join(handle.chunks()) == TEXT
+
+    @pytest.mark.parametrize("start, stop", [(0, 1), (0, 7), (3, 20), (6, 8), (100, 1000), (0, 10**6), (5, 5)])
+    def test_slices_match_string_slices(self, store, start, stop):
+        """Test that slices across multibyte chunk boundaries are exact."""
+        handle = store.put(TEXT)
+
+        assert handle.read(start, stop) == TEXT[start:stop]
+
+    def test_write_streamed_chunks(self, store):
+        """Test that text streamed in uneven parts is stored whole."""
+        handle = store.write(TEXT[i : i + 11] for i in range(0, len(TEXT), 11))
+
+        assert handle.read() == TEXT
+        assert handle.read(10, 40) == TEXT[10:40]
+
+    def test_empty_text(self, store):
+        """Test that empty text can be stored."""
+        handle = store.put("")
+
+        assert handle.read() == ""
+        assert len(handle) == 0
+
+    def test_handles_are_independent(self, store):
+        """Test that handles in one segment read their own text."""
+        first = store.put("first text")
+        second = store.put("second")
+
+        assert first.read() == "first text"
+        assert second.read(0, 3) == "sec"
+
+    def test_retired_segment_closed_when_unreferenced(self):
+        """Test that disk space of a full segment is released once its
+        handles are gone."""
+        store = ContentStore(segment_size=10)
+        handle = store.put("x" * 20)
+        segment = handle._segment
+        store.put("next segment")
+
+        assert store._segment is not segment
+        assert not segment.file.closed
+        assert handle.read(0, 3) == "xxx"
+        del handle
+        gc.collect()
+        assert segment.file.closed
+        store.close()
+
+
+class TestSourceDataContent:
+    """Tests for SourceData contents kept in the content store."""
+
+    def test_full_content_is_stored_as_handle(self):
+        """Test that full_content is spooled and sliced on demand."""
+        source = SourceData(number=1, url="https://example.com", full_content=TEXT)
+
+        assert source.content is not None
+        assert "full_content" not in source.__dict__
+        assert source.char_count == len(TEXT)
+        assert source.full_content == TEXT
+        assert source.read_content(0, 10) == TEXT[:10]
+
+    def test_assign_full_content(self):
+        """Test that assigning full_content replaces the stored content."""
+        source = SourceData(number=1, url="https://example.com")
+        source.full_content = "new content"
+
+        assert source.read_content() == "new content"
+        assert source.char_count == len("new content")
+        source.full_content = ""
+        assert source.content is None
+
+    def test_content_not_dumped_and_shared_by_copies(self):
+        """Test that dumps skip contents and copies share the handle."""
+        source = SourceData(number=1, url="https://example.com", full_content=TEXT)
+
+        assert "content" not in source.model_dump()
+        assert source.model_copy().content is source.content
+        assert source.model_copy(deep=True).content is source.content
+
+    def test_search_cache_keeps_content(self, tmp_path):
+        """Test that SQLite search cache round-trips stored contents."""
+        backend = SQLiteSearchCacheBackend(str(tmp_path / "cache.db"))
+        backend.set("key", [SourceData(number=1, url="https://example.com", full_content=TEXT)])
+
+        (source,) = backend.get("key")
+
+        assert source.full_content == TEXT
+        backend.close()
@@ -0,0 +1,153 @@
+"""Tests for search backends.
+
+This module contains tests for search backend selection and the offline
+full-text LocalSearchService.
+"""
+
+import os
+
+import pytest
+
+from sgr_deep_research.core.agent_definition import SearchConfig
+from sgr_deep_research.core.models import ResearchContext
+from sgr_deep_research.core.services import LocalSearchService, SearchBackend, TavilySearchService
+from sgr_deep_research.core.tools import ExtractPageContentTool, WebSearchTool
+
+
+@pytest.fixture
+def documents_dir(tmp_path):
+    """Directory of test documents."""
+    documents = tmp_path / "documents"
+    (documents / "cars").mkdir(parents=True)
+    (documents / "cars" / "bmw.md").write_text("# BMW X6 prices\n\nThe BMW X6 2025 costs 100 000 EUR in Germany.")
+    (documents / "cars" / "audi.md").write_text("# Audi Q8\n\nThe Audi Q8 is a competitor of the BMW X6.")
+    (documents / "weather.txt").write_text("Weather in Berlin is rainy in autumn.")
+    (documents / "ignored.pdf").write_text("BMW binary")
+    return documents
+
+
+class TestSearchBackendSelection:
+    """Tests for SearchBackend.for_config."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        TavilySearchService._instances.clear()
+        LocalSearchService._instances.clear()
+
+    def test_selects_backend_by_config(self, documents_dir):
+        """Test that the configured backend's shared service is returned."""
+        tavily = SearchBackend.for_config(SearchConfig(tavily_api_key="key"))
+        local = SearchBackend.for_config(SearchConfig(backend="local", local_documents_dir=str(documents_dir)))
+
+        assert isinstance(tavily, TavilySearchService)
+        assert isinstance(local, LocalSearchService)
+        assert SearchBackend.for_config(SearchConfig(backend="local", local_documents_dir=str(documents_dir))) is local
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend raises ValueError."""
+        config = SearchConfig.model_construct(backend="unknown")
+
+        with pytest.raises(ValueError, match="Unknown search backend"):
+            SearchBackend.for_config(config)
+
+    def test_local_backend_requires_directory(self):
+        """Test that the local backend needs a documents directory."""
+        with pytest.raises(ValueError, match="local_documents_dir"):
+            LocalSearchService(SearchConfig(backend="local"))
+
+
+class TestLocalSearchService:
+    """Tests for the offline full-text search backend."""
+
+    @pytest.fixture
+    def service(self, documents_dir):
+        """Local search service over test documents."""
+        service = LocalSearchService(SearchConfig(backend="local", local_documents_dir=str(documents_dir)))
+        yield service
+        service._conn.close()
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_relevant_documents(self, service):
+        """Test that results are ranked by relevance and only indexed suffixes
+        are searched."""
+        sources = await service.search("BMW X6 price", max_results=5, include_raw_content=False)
+
+        assert [source.title for source in sources] == ["BMW X6 prices", "Audi Q8"]
+        assert sources[0].url.startswith("file://") and sources[0].url.endswith("bmw.md")
+        assert "100 000 EUR" in sources[0].snippet
+        assert sources[0].full_content == ""
+
+    @pytest.mark.asyncio
+    async def test_search_is_deterministic_and_bounded(self, service):
+        """Test that repeated searches return the same results and respect
+        max_results."""
+        first = await service.search("BMW", max_results=1)
+        second = await service.search("BMW", max_results=1)
+
+        assert len(first) == 1
+        assert [s.model_dump() for s in first] == [s.model_dump() for s in second]
+        assert first[0].full_content == second[0].full_content
+        assert first[0].full_content.startswith("# BMW X6")
+
+    @pytest.mark.asyncio
+    async def test_query_syntax_is_literal(self, service):
+        """Test that FTS5 operators and quotes in queries do not fail."""
+        assert await service.search('weather" AND NOT (berlin') != []
+        assert await service.search("!!!") == []
+
+    @pytest.mark.asyncio
+    async def test_extract_by_url(self, service):
+        """Test that extract returns indexed documents and skips unknown
+        URLs."""
+        (url,) = [source.url for source in await service.search("weather")]
+
+        sources = await service.extract([url, "https://example.com/"])
+
+        assert [source.url for source in sources] == [url]
+        assert sources[0].full_content == "Weather in Berlin is rainy in autumn."
+
+    @pytest.mark.asyncio
+    async def test_reindex_tracks_changes(self, service, documents_dir):
+        """Test that reindexing picks up new, changed and removed
+        documents."""
+        (documents_dir / "new.txt").write_text("Zeppelin flights")
+        (documents_dir / "weather.txt").write_text("Weather in Munich is sunny.")
+        os.utime(documents_dir / "weather.txt", (0, 1))
+        (documents_dir / "cars" / "audi.md").unlink()
+
+        assert service.reindex() == 2
+        assert [s.title for s in await service.search("zeppelin")] == ["Zeppelin flights"]
+        assert await service.search("rainy") == []
+        assert await service.search("Audi") == []
+        assert service.reindex() == 0
+
+    def test_persistent_index_reused(self, documents_dir, tmp_path):
+        """Test that unchanged documents are not reindexed with a persistent
+        index."""
+        config = SearchConfig(
+            backend="local", local_documents_dir=str(documents_dir), local_index_path=str(tmp_path / "index.db")
+        )
+        LocalSearchService(config)._conn.close()
+
+        service = LocalSearchService(config)
+
+        assert service.reindex() == 0
+        assert service._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0] == 3
+
+
+class TestLocalSearchTools:
+    """Tests for search tools running on the local backend."""
+
+    @pytest.mark.asyncio
+    async def test_search_and_extract(self, documents_dir):
+        """Test that WebSearchTool and ExtractPageContentTool work offline."""
+        service = LocalSearchService(SearchConfig(backend="local", local_documents_dir=str(documents_dir)))
+        context = ResearchContext(search_service=service)
+
+        await WebSearchTool(reasoning="Test", query="BMW X6", max_results=5)(context)
+        url = next(iter(context.sources))
+        result = await ExtractPageContentTool(reasoning="Test", urls=[url])(context)
+
+        assert context.sources[url].number == 1
+        assert "100 000 EUR" in result
+        assert len(TavilySearchService.page_cache._hot) == 0
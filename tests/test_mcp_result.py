@@ -0,0 +1,147 @@
+"""Tests for MCP result serialization.
+
+This module contains tests for budget-aware serialization of MCP tool
+results, spill files of truncated results and their use by MCPBaseTool.
+"""
+
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from mcp.types import ImageContent, TextContent
+
+from sgr_deep_research.core.agent_definition import ExecutionConfig
+from sgr_deep_research.core.agents import SGRAgent
+from sgr_deep_research.core.base_tool import MCPBaseTool
+from sgr_deep_research.core.services.mcp_result import serialize_mcp_content, spill_mcp_content
+from tests.conftest import create_test_agent
+
+ITEMS = [
+    TextContent(type="text", text='Line with "quotes"\nand ünïcode'),
+    ImageContent(type="image", data="QUJD" * 50, mimeType="image/png"),
+    TextContent(type="text", text="tail"),
+]
+
+
+def full_serialization(items) -> str:
+    """Serialize result the way MCP results were serialized before
+    truncation."""
+    return json.dumps([item.model_dump_json() for item in items], ensure_ascii=False)
+
+
+class TestSerializeMCPContent:
+    """Tests for serialize_mcp_content."""
+
+    @pytest.mark.parametrize("limit", [1, 2, 5, 40, 60, 61, 100, 300, 350, 1000])
+    def test_matches_truncated_full_serialization(self, limit):
+        """Test that output equals the prefix of the full serialization."""
+        expected = full_serialization(ITEMS)
+
+        content, truncated = serialize_mcp_content(ITEMS, limit)
+
+        assert content == expected[:limit]
+        assert truncated == (len(expected) > limit)
+
+    def test_exact_fit_not_truncated(self):
+        """Test that a result of exactly the budget is not truncated."""
+        expected = full_serialization(ITEMS)
+
+        assert serialize_mcp_content(ITEMS, len(expected)) == (expected, False)
+
+    def test_empty_result(self):
+        """Test that empty results serialize to an empty list."""
+        assert serialize_mcp_content([], 100) == ("[]", False)
+
+    def test_items_over_budget_not_serialized(self):
+        """Test that items after the budget is reached are skipped."""
+        skipped = Mock()
+
+        content, truncated = serialize_mcp_content([TextContent(type="text", text="x" * 100), skipped], 50)
+
+        assert truncated
+        assert len(content) == 50
+        skipped.model_dump.assert_not_called()
+
+    def test_large_strings_cut_before_encoding(self):
+        """Test that long strings are encoded only up to the budget."""
+        item = TextContent(type="text", text="y" * 1_000_000)
+
+        with patch("sgr_deep_research.core.services.mcp_result.json.dumps", wraps=json.dumps) as dumps:
+            content, truncated = serialize_mcp_content([item], 100)
+
+        assert truncated
+        assert content == full_serialization([item])[:100]
+        assert all(len(call.args[0]) < 300 for call in dumps.call_args_list if isinstance(call.args[0], str))
+
+
+class TestSpillMCPContent:
+    """Tests for spill files of MCP results."""
+
+    def test_full_content_written(self, tmp_path):
+        """Test that every item is written as a JSON line."""
+        path = spill_mcp_content(ITEMS, str(tmp_path / "mcp_results"), "search")
+
+        lines = open(path, encoding="utf-8").read().splitlines()
+        assert path.endswith(".jsonl") and "-search-" in path
+        assert lines == [item.model_dump_json() for item in ITEMS]
+
+
+class TestMCPBaseToolResult:
+    """Tests for MCPBaseTool result truncation."""
+
+    @staticmethod
+    def create_tool(items) -> MCPBaseTool:
+        """Create MCP tool whose session pool returns items."""
+
+        class MCPSpillTool(MCPBaseTool):
+            query: str
+
+        MCPSpillTool._sessions = Mock(call_tool=AsyncMock(return_value=Mock(content=items)))
+        return MCPSpillTool(query="test")
+
+    @staticmethod
+    def global_config(tmp_path, **kwargs) -> Mock:
+        """Create global config with given execution settings."""
+        return Mock(execution=ExecutionConfig(logs_dir=str(tmp_path), **kwargs))
+
+    @pytest.mark.asyncio
+    async def test_truncated_result_spilled_and_logged(self, tmp_path):
+        """Test that truncated results are saved and referenced from the
+        agent log."""
+        tool = self.create_tool(ITEMS)
+        agent = create_test_agent(SGRAgent)
+
+        with patch(
+            "sgr_deep_research.core.base_tool.GlobalConfig",
+            return_value=self.global_config(tmp_path, mcp_context_limit=50),
+        ):
+            result = await tool(None)
+        agent._log_tool_execution(tool, result)
+
+        assert result == full_serialization(ITEMS)[:50]
+        assert tool.spill_file.startswith(str(tmp_path / "mcp_results"))
+        assert open(tool.spill_file, encoding="utf-8").read().count("\n") == len(ITEMS)
+        assert agent.log[-1]["agent_tool_result_file"] == tool.spill_file
+
+    @pytest.mark.asyncio
+    async def test_short_result_not_spilled(self, tmp_path):
+        """Test that results within the limit are not saved."""
+        tool = self.create_tool(ITEMS[:1])
+
+        with patch("sgr_deep_research.core.base_tool.GlobalConfig", return_value=self.global_config(tmp_path)):
+            result = await tool(None)
+
+        assert result == full_serialization(ITEMS[:1])
+        assert tool.spill_file is None
+        assert not (tmp_path / "mcp_results").exists()
+
+    @pytest.mark.asyncio
+    async def test_spill_disabled(self, tmp_path):
+        """Test that spilling can be turned off."""
+        tool = self.create_tool(ITEMS)
+        config = self.global_config(tmp_path, mcp_context_limit=50, mcp_spill_results=False)
+
+        with patch("sgr_deep_research.core.base_tool.GlobalConfig", return_value=config):
+            await tool(None)
+
+        assert tool.spill_file is None
@@ -0,0 +1,290 @@
+"""Tests for MCPSessionPool.
+
+This module contains tests for warm MCP session reuse, health checks,
+reconnection with backoff and shutdown of shared pools.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastmcp.mcp_config import MCPConfig
+
+from sgr_deep_research.core.base_tool import MCPBaseTool
+from sgr_deep_research.core.services.mcp_session_pool import LatencyHistogram, MCPSessionPool
+
+MCP_CONFIG = MCPConfig(mcpServers={"test": {"url": "http://localhost:9999/mcp"}})
+
+
+class FakeClient:
+    """MCP client double counting connections and requests."""
+
+    instances: list["FakeClient"] = []
+
+    def __init__(self, config=None):
+        self.connected = False
+        self.connects = 0
+        self.connect_failures = 0
+        self.ping_fails = False
+        self.calls = []
+        self.delay = 0.0
+        self.running = 0
+        self.max_running = 0
+        self.cancelled = 0
+        FakeClient.instances.append(self)
+
+    def new(self) -> "FakeClient":
+        return FakeClient()
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def __aenter__(self):
+        if self.connect_failures:
+            self.connect_failures -= 1
+            raise ConnectionError("server unavailable")
+        self.connected = True
+        self.connects += 1
+        return self
+
+    async def close(self):
+        self.connected = False
+
+    async def ping(self) -> bool:
+        if self.ping_fails:
+            self.ping_fails = False
+            raise ConnectionError("broken pipe")
+        return True
+
+    async def list_tools(self) -> list:
+        return ["tool"]
+
+    async def call_tool(self, name: str, arguments: dict):
+        if name == "failing":
+            raise RuntimeError("tool failed")
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.running -= 1
+        self.calls.append((name, arguments))
+        return f"{name} result"
+
+
+@pytest.fixture(autouse=True)
+def fake_client():
+    """Replace fastmcp Client with FakeClient."""
+    FakeClient.instances = []
+    with patch("sgr_deep_research.core.services.mcp_session_pool.Client", FakeClient):
+        yield
+    MCPSessionPool._pools.clear()
+
+
+class TestMCPSessionPool:
+    """Tests for MCPSessionPool sessions."""
+
+    @pytest.mark.asyncio
+    async def test_session_reused_between_calls(self):
+        """Test that consecutive calls use one connection."""
+        pool = MCPSessionPool(MCP_CONFIG)
+
+        assert await pool.list_tools() == ["tool"]
+        assert await pool.call_tool("search", {"q": "a"}) == "search result"
+        assert await pool.call_tool("search", {"q": "b"}) == "search result"
+
+        assert len(FakeClient.instances) == 1
+        assert FakeClient.instances[0].connects == 1
+
+    @pytest.mark.asyncio
+    async def test_calls_spread_over_sessions(self):
+        """Test that a pool of several sessions uses all of them."""
+        pool = MCPSessionPool(MCP_CONFIG, size=2)
+
+        for _ in range(4):
+            await pool.call_tool("search", {})
+
+        assert [len(client.calls) for client in FakeClient.instances] == [2, 2]
+
+    @pytest.mark.asyncio
+    async def test_idle_session_reconnected_after_failed_ping(self):
+        """Test that an idle session failing its health check is
+        reconnected."""
+        pool = MCPSessionPool(MCP_CONFIG, health_check_interval=0)
+        await pool.call_tool("search", {})
+        client = FakeClient.instances[0]
+        client.ping_fails = True
+
+        assert await pool.call_tool("search", {}) == "search result"
+        assert client.connects == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_call_triggers_health_check(self):
+        """Test that a session is pinged after a failed request and kept if
+        healthy."""
+        pool = MCPSessionPool(MCP_CONFIG, health_check_interval=3600)
+        await pool.call_tool("search", {})
+        client = FakeClient.instances[0]
+
+        with pytest.raises(RuntimeError):
+            await pool.call_tool("failing", {})
+        with patch.object(client, "ping", wraps=client.ping) as ping:
+            await pool.call_tool("search", {})
+
+        ping.assert_awaited_once()
+        assert client.connects == 1
+
+    @pytest.mark.asyncio
+    async def test_connect_retried_with_backoff(self):
+        """Test that connection failures are retried with doubling
+        delays."""
+        pool = MCPSessionPool(MCP_CONFIG, connect_retries=3, reconnect_backoff=0.5)
+        FakeClient.instances[0].connect_failures = 2
+
+        with patch("sgr_deep_research.core.services.mcp_session_pool.asyncio.sleep") as sleep:
+            assert await pool.call_tool("search", {}) == "search result"
+
+        assert [call.args[0] for call in sleep.await_args_list] == [0.5, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_connect_gives_up_after_retries(self):
+        """Test that the connection error is raised after all retries."""
+        pool = MCPSessionPool(MCP_CONFIG, connect_retries=1, reconnect_backoff=0)
+        FakeClient.instances[0].connect_failures = 5
+
+        with pytest.raises(ConnectionError):
+            await pool.call_tool("search", {})
+
+    @pytest.mark.asyncio
+    async def test_close_disconnects_sessions(self):
+        """Test that closed pools disconnect and refuse calls."""
+        pool = MCPSessionPool(MCP_CONFIG)
+        await pool.call_tool("search", {})
+
+        await pool.close()
+
+        assert not FakeClient.instances[0].connected
+        with pytest.raises(RuntimeError):
+            await pool.call_tool("search", {})
+
+
+class TestMCPCallScheduling:
+    """Tests for concurrency limits, timeouts and latency of tool calls."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_limited(self):
+        """Test that concurrent calls share one session up to the limit."""
+        pool = MCPSessionPool(MCP_CONFIG, max_concurrent_calls=2)
+        client = FakeClient.instances[0]
+        client.delay = 0.01
+
+        results = await asyncio.gather(*(pool.call_tool("search", {"i": i}) for i in range(5)))
+
+        assert results == ["search result"] * 5
+        assert client.max_running == 2
+        assert client.connects == 1
+
+    @pytest.mark.asyncio
+    async def test_call_timeout(self):
+        """Test that slow calls time out, are cancelled on the session and
+        counted as errors."""
+        pool = MCPSessionPool(MCP_CONFIG, call_timeout=0.01)
+        client = FakeClient.instances[0]
+        client.delay = 1
+
+        with pytest.raises(TimeoutError, match="'search' timed out after 0.01s"):
+            await pool.call_tool("search", {})
+
+        assert client.cancelled == 1
+        assert pool.latency["search"].errors == 1
+
+    @pytest.mark.asyncio
+    async def test_cancellation_propagated(self):
+        """Test that cancelling the caller cancels the session request."""
+        pool = MCPSessionPool(MCP_CONFIG)
+        client = FakeClient.instances[0]
+        client.delay = 1
+
+        task = asyncio.create_task(pool.call_tool("search", {}))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert client.cancelled == 1
+        assert client.running == 0
+
+    @pytest.mark.asyncio
+    async def test_latency_recorded_per_tool(self):
+        """Test that call durations and errors are recorded by tool name."""
+        pool = MCPSessionPool(MCP_CONFIG)
+
+        await pool.call_tool("search", {})
+        await pool.call_tool("search", {})
+        with pytest.raises(RuntimeError):
+            await pool.call_tool("failing", {})
+
+        assert pool.latency["search"].count == 2
+        assert pool.latency["search"].errors == 0
+        assert pool.latency["failing"].errors == 1
+
+    def test_histogram_percentiles(self):
+        """Test that percentiles are estimated by bucket upper bounds."""
+        histogram = LatencyHistogram()
+        for seconds in [0.005] * 90 + [0.3] * 9 + [100]:
+            histogram.observe(seconds)
+
+        assert histogram.percentile(50) == 0.01
+        assert histogram.percentile(95) == 0.5
+        assert histogram.percentile(100) == float("inf")
+        assert LatencyHistogram().percentile(50) is None
+
+    @pytest.mark.asyncio
+    async def test_latency_stats_merged_over_pools(self):
+        """Test that shared pools latency is merged by tool name."""
+        await MCPSessionPool.get(MCP_CONFIG).call_tool("search", {})
+        other = MCPSessionPool.get(MCPConfig(mcpServers={"other": {"url": "http://localhost:9998/mcp"}}))
+        await other.call_tool("search", {})
+
+        stats = MCPSessionPool.latency_stats()
+
+        assert stats["search"].count == 2
+        assert sum(stats["search"].counts) == 2
+
+
+class TestSharedPools:
+    """Tests for pools shared by MCP configuration."""
+
+    @pytest.mark.asyncio
+    async def test_get_shares_pool_by_config(self):
+        """Test that the same config gets the same pool until closed."""
+        pool = MCPSessionPool.get(MCP_CONFIG)
+        other = MCPSessionPool.get(MCPConfig(mcpServers={"other": {"url": "http://localhost:9998/mcp"}}))
+
+        assert MCPSessionPool.get(MCP_CONFIG) is pool
+        assert other is not pool
+
+        await MCPSessionPool.close_all()
+
+        assert MCPSessionPool._pools == {}
+        assert MCPSessionPool.get(MCP_CONFIG) is not pool
+
+    @pytest.mark.asyncio
+    async def test_mcp_tool_calls_pool(self):
+        """Test that MCP tools call their shared pool."""
+
+        class MCPSearchTool(MCPBaseTool):
+            query: str
+
+        MCPSearchTool._sessions = MCPSessionPool.get(MCP_CONFIG)
+
+        result_type = type("Result", (), {"content": []})
+        with patch.object(MCPSearchTool._sessions, "call_tool", return_value=result_type()) as call_tool:
+            result = await MCPSearchTool(query="test")(None)
+
+        call_tool.assert_awaited_once_with(MCPSearchTool.tool_name, {"query": "test"})
+        assert result == "[]"
@@ -8,6 +8,7 @@ import asyncio
 from datetime import datetime
 
 import pytest
+from openai.types import CompletionUsage
 from pydantic import ValidationError
 
 from sgr_deep_research.core.models import (
@@ -15,6 +16,7 @@ from sgr_deep_research.core.models import (
     ResearchContext,
     SearchResult,
     SourceData,
+    TokenUsage,
 )
 
 
@@ -311,3 +313,17 @@ class TestResearchContext:
         reasoning_data = {"step": 1, "action": "search"}
         context.current_step_reasoning = reasoning_data
         assert context.current_step_reasoning == reasoning_data
+
+    def test_research_context_add_usage_by_phase(self):
+        """Test that token usage is aggregated in total and by phase."""
+        context = ResearchContext()
+
+        context.add_usage(CompletionUsage(prompt_tokens=100, completion_tokens=20, total_tokens=120), "reasoning")
+        context.add_usage(CompletionUsage(prompt_tokens=50, completion_tokens=5, total_tokens=55), "reasoning")
+        context.add_usage(CompletionUsage(prompt_tokens=10, completion_tokens=1, total_tokens=11), "action_selection")
+        context.add_usage(None, "tool")
+
+        assert context.usage == TokenUsage(prompt_tokens=160, completion_tokens=26, total_tokens=186)
+        assert context.phase_usage["reasoning"].total_tokens == 175
+        assert context.phase_usage["action_selection"].total_tokens == 11
+        assert context.phase_usage["tool"].total_tokens == 0
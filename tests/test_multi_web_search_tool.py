@@ -0,0 +1,103 @@
+"""Tests for MultiWebSearchTool.
+
+This module contains tests for concurrent multi-query search, merging
+of results into context sources and the search budget.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from sgr_deep_research.core.agent_definition import SearchConfig
+from sgr_deep_research.core.models import ResearchContext, SourceData
+from sgr_deep_research.core.tools import MultiWebSearchTool
+
+RESULTS = {
+    "q1": ["https://a.com", "https://b.com"],
+    "q2": ["https://b.com", "https://c.com"],
+    "q3": ["https://d.com"],
+}
+
+
+class TestMultiWebSearchTool:
+    """Tests for MultiWebSearchTool execution."""
+
+    def create_context(self, max_searches: int | None = None, concurrency: int = 3) -> ResearchContext:
+        """Create context with a mocked search service tracking
+        concurrency."""
+        search_service = Mock(config=SearchConfig(tavily_api_key="key"))
+        search_service.running = search_service.peak = 0
+
+        async def search(query, max_results, include_raw_content):
+            search_service.running += 1
+            search_service.peak = max(search_service.peak, search_service.running)
+            await asyncio.sleep(0.01)
+            search_service.running -= 1
+            if query == "fail":
+                raise RuntimeError("search error")
+            return [SourceData(number=0, url=url, title=url, snippet=f"about {url}") for url in RESULTS[query]]
+
+        search_service.search = AsyncMock(side_effect=search)
+        return ResearchContext(
+            search_service=search_service,
+            max_searches=max_searches,
+            search_semaphore=asyncio.Semaphore(concurrency),
+        )
+
+    @pytest.mark.asyncio
+    async def test_results_merged_by_url(self):
+        """Test that sources are deduplicated by URL and numbered in query
+        order."""
+        context = self.create_context()
+        context.sources["https://c.com"] = SourceData(number=1, url="https://c.com")
+        tool = MultiWebSearchTool(reasoning="Test", queries=["q1", "q2"], max_results=5)
+
+        result = await tool(context)
+
+        assert {url: source.number for url, source in context.sources.items()} == {
+            "https://c.com": 1,
+            "https://a.com": 2,
+            "https://b.com": 3,
+        }
+        assert [[s.number for s in search.citations] for search in context.searches] == [[2, 3], [3, 1]]
+        assert context.searches_used == 2
+        assert "Search Query: q1" in result and "[1] " in result
+
+    @pytest.mark.asyncio
+    async def test_queries_run_concurrently_within_limit(self):
+        """Test that queries run in parallel bounded by the agent
+        semaphore."""
+        context = self.create_context(concurrency=2)
+        tool = MultiWebSearchTool(reasoning="Test", queries=["q1", "q2", "q3"], max_results=5)
+
+        await tool(context)
+
+        assert context.search_service.peak == 2
+        assert context.search_service.search.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_search_budget(self):
+        """Test that queries beyond max_searches are skipped and
+        reported."""
+        context = self.create_context(max_searches=3)
+        context.searches_used = 1
+        tool = MultiWebSearchTool(reasoning="Test", queries=["q1", "q2", "q1", "q3"], max_results=5)
+
+        result = await tool(context)
+
+        assert [call.kwargs["query"] for call in context.search_service.search.await_args_list] == ["q1", "q2"]
+        assert context.searches_used == 3
+        assert "queries not searched: ['q3']" in result
+
+    @pytest.mark.asyncio
+    async def test_failed_query_does_not_fail_others(self):
+        """Test that a failed query is reported and not counted."""
+        context = self.create_context()
+        tool = MultiWebSearchTool(reasoning="Test", queries=["fail", "q3"], max_results=5)
+
+        result = await tool(context)
+
+        assert "Search failed: search error" in result
+        assert list(context.sources) == ["https://d.com"]
+        assert context.searches_used == 1
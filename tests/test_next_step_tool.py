@@ -0,0 +1,105 @@
+"""Tests for NextStepToolsBuilder.
+
+This module contains tests for dynamic NextStepTools model building and
+its cache.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from sgr_deep_research.core.next_step_tool import NextStepToolsBuilder, NextStepToolStub
+from sgr_deep_research.core.tools import ClarificationTool, FinalAnswerTool, GeneratePlanTool, WebSearchTool
+
+
+class TestNextStepToolsBuilder:
+    """Tests for NextStepTools model building."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        NextStepToolsBuilder.clear_cache()
+
+    def test_build_returns_stub_subclass(self):
+        """Test that built model is a NextStepToolStub subclass."""
+        model = NextStepToolsBuilder.build_NextStepTools([ClarificationTool, FinalAnswerTool])
+
+        assert issubclass(model, NextStepToolStub)
+        assert "function" in model.model_fields
+
+    def test_built_model_validates_discriminated_tool(self):
+        """Test that built model parses the selected tool by discriminator."""
+        model = NextStepToolsBuilder.build_NextStepTools([ClarificationTool, GeneratePlanTool])
+
+        parsed = model.model_validate(
+            {
+                "reasoning_steps": ["Step 1", "Step 2"],
+                "current_situation": "Test",
+                "plan_status": "Test",
+                "remaining_steps": ["Step 1"],
+                "task_completed": False,
+                "function": {
+                    "tool_name_discriminator": ClarificationTool.tool_name,
+                    "reasoning": "Test",
+                    "unclear_terms": ["term"],
+                    "assumptions": ["a", "b"],
+                    "questions": ["q"],
+                },
+            }
+        )
+
+        assert isinstance(parsed.function, ClarificationTool)
+        with pytest.raises(ValidationError):
+            model.model_validate({"function": {"tool_name_discriminator": "unknown"}})
+
+
+class TestNextStepToolsBuilderCache:
+    """Tests for NextStepTools model cache."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        NextStepToolsBuilder.clear_cache()
+
+    def test_same_tool_set_reuses_model(self):
+        """Test that the same tool set returns the cached model regardless of
+        order."""
+        model1 = NextStepToolsBuilder.build_NextStepTools([ClarificationTool, FinalAnswerTool])
+        model2 = NextStepToolsBuilder.build_NextStepTools([FinalAnswerTool, ClarificationTool])
+
+        assert model1 is model2
+
+    def test_different_tool_set_builds_new_model(self):
+        """Test that a changed tool set produces a different model."""
+        model1 = NextStepToolsBuilder.build_NextStepTools([ClarificationTool, FinalAnswerTool])
+        model2 = NextStepToolsBuilder.build_NextStepTools([FinalAnswerTool])
+
+        assert model1 is not model2
+
+    def test_cache_evicts_least_recently_used(self, monkeypatch):
+        """Test that cache size is bounded with LRU eviction."""
+        monkeypatch.setattr(NextStepToolsBuilder, "cache_size", 2)
+        model1 = NextStepToolsBuilder.build_NextStepTools([ClarificationTool])
+        NextStepToolsBuilder.build_NextStepTools([FinalAnswerTool])
+        NextStepToolsBuilder.build_NextStepTools([ClarificationTool])  # refresh model1
+        NextStepToolsBuilder.build_NextStepTools([WebSearchTool])  # evicts FinalAnswerTool set
+
+        assert len(NextStepToolsBuilder._cache) == 2
+        assert frozenset([FinalAnswerTool]) not in NextStepToolsBuilder._cache
+        assert NextStepToolsBuilder.build_NextStepTools([ClarificationTool]) is model1
+
+    def test_json_schema_is_cached_and_copied(self):
+        """Test that JSON schema is generated once and callers get
+        independent copies."""
+        model = NextStepToolsBuilder.build_NextStepTools([ClarificationTool, FinalAnswerTool])
+
+        schema1 = model.model_json_schema()
+        schema1["properties"].clear()
+        schema2 = model.model_json_schema()
+
+        assert "_json_schema" in model.__dict__
+        assert "function" in schema2["properties"]
+
+    def test_json_schema_is_per_model(self):
+        """Test that schema cache is not shared between built models."""
+        model1 = NextStepToolsBuilder.build_NextStepTools([ClarificationTool])
+        model2 = NextStepToolsBuilder.build_NextStepTools([FinalAnswerTool])
+
+        assert model1.model_json_schema() != model2.model_json_schema()
@@ -0,0 +1,205 @@
+"""Tests for PageCache.
+
+This module contains tests for URL canonicalization, the two-tier page
+contents cache and its use by ExtractPageContentTool.
+"""
+
+import sqlite3
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from sgr_deep_research.core.agent_config import PageCacheConfig
+from sgr_deep_research.core.agent_definition import SearchConfig
+from sgr_deep_research.core.models import ResearchContext, SourceData
+from sgr_deep_research.core.services.page_cache import PageCache, canonicalize_url
+from sgr_deep_research.core.services.tavily_search import TavilySearchService
+from sgr_deep_research.core.tools import ExtractPageContentTool
+
+
+def create_page(url: str, content: str = "page content") -> SourceData:
+    """Create extracted page source."""
+    return SourceData(number=0, title="Page", url=url, full_content=content, char_count=len(content))
+
+
+class TestCanonicalizeUrl:
+    """Tests for URL canonicalization."""
+
+    def test_equivalent_urls_share_key(self):
+        """Test that case, default port, fragment, parameter order and
+        tracking parameters are ignored."""
+        assert canonicalize_url("HTTPS://Example.com:443/a?b=2&a=1&utm_source=x#top") == canonicalize_url(
+            "https://example.com/a?a=1&b=2"
+        )
+
+    def test_meaningful_differences_are_kept(self):
+        """Test that path, query and non-default port are significant."""
+        assert canonicalize_url("https://example.com/a") != canonicalize_url("https://example.com/A")
+        assert canonicalize_url("https://example.com/a?id=1") != canonicalize_url("https://example.com/a?id=2")
+        assert canonicalize_url("https://example.com:8443/") != canonicalize_url("https://example.com/")
+
+    def test_empty_path(self):
+        """Test that empty path is the root path."""
+        assert canonicalize_url("https://example.com") == "https://example.com/"
+
+
+class TestPageCache:
+    """Tests for the hot tier and the compressed SQLite tier."""
+
+    @pytest.fixture(params=["memory", "sqlite"])
+    def cache(self, request, tmp_path):
+        """Page cache of both kinds."""
+        cache = PageCache(str(tmp_path / "pages.db") if request.param == "sqlite" else None)
+        yield cache
+        cache.close()
+
+    def test_set_and_get(self, cache):
+        """Test that a cached page is returned for equivalent URLs with the
+        requested URL."""
+        cache.set(create_page("https://example.com/a?x=1&y=2"))
+
+        page = cache.get("https://EXAMPLE.com/a?y=2&x=1#part")
+
+        assert page.full_content == "page content"
+        assert page.url == "https://EXAMPLE.com/a?y=2&x=1#part"
+        assert cache.get("https://example.com/b") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_empty_content_not_cached(self, cache):
+        """Test that failed extractions are not cached."""
+        cache.set(create_page("https://example.com/", content=""))
+
+        assert cache.get("https://example.com/") is None
+
+    def test_expired_pages_are_missing(self, cache):
+        """Test that pages older than TTL are not returned."""
+        cache.ttl = 60
+        with patch("time.time", return_value=1000.0):
+            cache.set(create_page("https://example.com/"))
+        with patch("time.time", return_value=1061.0):
+            assert cache.get("https://example.com/") is None
+
+    def test_returned_pages_are_copies(self, cache):
+        """Test that changing a returned page does not change the cache."""
+        cache.set(create_page("https://example.com/"))
+
+        cache.get("https://example.com/").number = 5
+
+        assert cache.get("https://example.com/").number == 0
+
+    def test_disk_tier_serves_evicted_hot_pages(self, tmp_path):
+        """Test that pages evicted from the hot tier are loaded from disk."""
+        cache = PageCache(str(tmp_path / "pages.db"), hot_size=1)
+        cache.set(create_page("https://a.com/", "content a"))
+        cache.set(create_page("https://b.com/", "content b"))
+
+        assert "https://a.com/" not in cache._hot
+        assert cache.get("https://a.com/").full_content == "content a"
+        assert "https://a.com/" in cache._hot
+
+    def test_disk_contents_compressed_and_deduplicated(self, tmp_path):
+        """Test that identical contents are stored once, compressed."""
+        path = str(tmp_path / "pages.db")
+        content = "same text " * 1000
+        cache = PageCache(path)
+        cache.set(create_page("https://a.com/", content))
+        cache.set(create_page("https://mirror.com/", content))
+        cache.close()
+
+        ((count, size),) = sqlite3.connect(path).execute("SELECT COUNT(*), SUM(LENGTH(data)) FROM contents")
+        assert count == 1
+        assert size < len(content) / 10
+        assert PageCache(path).get("https://mirror.com/").full_content == content
+
+    def test_disk_size_cap_evicts_least_recently_used(self, tmp_path):
+        """Test that the disk tier keeps at most max_pages pages and drops
+        their contents."""
+        cache = PageCache(str(tmp_path / "pages.db"), max_pages=2, hot_size=1, ttl=None)
+        with patch("time.time", return_value=1.0):
+            cache.set(create_page("https://a.com/", "a"))
+        with patch("time.time", return_value=2.0):
+            cache.set(create_page("https://b.com/", "b"))
+        with patch("time.time", return_value=3.0):
+            cache.get("https://a.com/")  # refresh a
+        with patch("time.time", return_value=4.0):
+            cache.set(create_page("https://c.com/", "c"))  # evicts b
+
+        assert len(cache) == 2
+        assert cache.get("https://b.com/") is None
+        assert cache._conn.execute("SELECT COUNT(*) FROM contents").fetchone()[0] == 2
+
+    def test_configure(self, tmp_path):
+        """Test that configure switches storage and limits."""
+        cache = PageCache()
+        cache.configure(PageCacheConfig(backend="sqlite", sqlite_path=str(tmp_path / "pages.db"), hot_size=3))
+
+        assert cache._conn is not None
+        assert cache.hot_size == 3
+        cache.close()
+
+
+class TestExtractPageContentToolPageCache:
+    """Tests for page cache use in ExtractPageContentTool."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        TavilySearchService.page_cache.clear()
+
+    def teardown_method(self):
+        """Cleanup after each test method."""
+        TavilySearchService.page_cache.clear()
+
+    def create_context(self) -> ResearchContext:
+        """Create context with a mocked search service."""
+        search_service = Mock(config=SearchConfig(tavily_api_key="key"))
+        search_service.extract = AsyncMock(
+            side_effect=lambda urls: [create_page(url, f"content of {url}") for url in urls]
+        )
+        return ResearchContext(search_service=search_service)
+
+    @pytest.mark.asyncio
+    async def test_only_missing_urls_extracted(self):
+        """Test that cached pages are not extracted again and results keep
+        the requested order."""
+        TavilySearchService.page_cache.set(create_page("https://b.com/", "cached b"))
+        context = self.create_context()
+        tool = ExtractPageContentTool(reasoning="Test", urls=["https://a.com/", "https://b.com/", "https://c.com/"])
+
+        result = await tool(context)
+
+        context.search_service.extract.assert_awaited_once_with(urls=["https://a.com/", "https://c.com/"])
+        assert list(context.sources) == ["https://a.com/", "https://b.com/", "https://c.com/"]
+        assert context.sources["https://b.com/"].full_content == "cached b"
+        assert result.index("content of https://a.com/") < result.index("cached b") < result.index("https://c.com/\n")
+
+    @pytest.mark.asyncio
+    async def test_extracted_pages_reused_by_other_agents(self):
+        """Test that a page extracted by one agent is served from cache to
+        another."""
+        tool = ExtractPageContentTool(reasoning="Test", urls=["https://a.com/"])
+        await tool(self.create_context())
+        context = self.create_context()
+
+        await tool(context)
+
+        context.search_service.extract.assert_not_awaited()
+        assert context.sources["https://a.com/"].full_content == "content of https://a.com/"
+
+    @pytest.mark.asyncio
+    async def test_page_returned_under_other_url(self):
+        """Test that a page Tavily returns under another URL is shown, kept
+        and cached under the requested URL."""
+        service = TavilySearchService(SearchConfig(tavily_api_key="key"))
+        service._client.extract = AsyncMock(
+            return_value={"results": [{"url": "https://ex.com/page/", "raw_content": "page content"}]}
+        )
+        tool = ExtractPageContentTool(reasoning="Test", urls=["https://ex.com/page"])
+        context = ResearchContext(search_service=service)
+
+        result = await tool(context)
+        await tool(ResearchContext(search_service=service))
+
+        assert "page content" in result
+        assert list(context.sources) == ["https://ex.com/page"]
+        assert TavilySearchService.page_cache.get("https://ex.com/page").full_content == "page content"
+        service._client.extract.assert_awaited_once()
@@ -0,0 +1,277 @@
+"""Tests for parallel execution of tool calls.
+
+This module contains tests for running all tool calls of one agent step
+concurrently, with a concurrency cap and deterministic ordering of their
+results in the conversation.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+from sgr_deep_research.core.agent_definition import ExecutionConfig, SearchConfig
+from sgr_deep_research.core.agents import SGRToolCallingAgent, ToolCallingAgent
+from sgr_deep_research.core.base_tool import BaseTool
+from sgr_deep_research.core.models import AgentStatesEnum, SourceData
+from sgr_deep_research.core.tools import FinalAnswerTool, MultiWebSearchTool, ReasoningTool, WebSearchTool
+from tests.conftest import create_test_agent
+
+
+class SleepTool(BaseTool):
+    """Tool that returns its name after a delay."""
+
+    name: str
+    delay: float = 0
+
+    async def __call__(self, context) -> str:
+        await asyncio.sleep(self.delay)
+        return f"result {self.name}"
+
+
+class FailingTool(BaseTool):
+    """Tool that always fails."""
+
+    async def __call__(self, context) -> str:
+        raise RuntimeError("tool failed")
+
+
+def final_answer() -> FinalAnswerTool:
+    """Create final answer tool."""
+    return FinalAnswerTool(
+        reasoning="Done",
+        completed_steps=["Searched"],
+        answer="Answer",
+        status=AgentStatesEnum.COMPLETED,
+    )
+
+
+def mock_completion_stream(agent, tools: list[BaseTool]) -> None:
+    """Make agent's LLM client stream a completion calling the tools."""
+    completion = Mock(usage=None)
+    completion.choices = [Mock(message=Mock(tool_calls=[Mock(function=Mock(parsed_arguments=tool)) for tool in tools]))]
+    stream = MagicMock()
+    stream.__aiter__.return_value = []
+    stream.get_final_completion = AsyncMock(return_value=completion)
+    stream_manager = MagicMock()
+    stream_manager.__aenter__ = AsyncMock(return_value=stream)
+    stream_manager.__aexit__ = AsyncMock(return_value=None)
+    agent.openai_client = Mock(chat=Mock(completions=Mock(stream=Mock(return_value=stream_manager))))
+    agent._prepare_tools = AsyncMock(return_value=[])
+
+
+class TestSelectToolCalls:
+    """Tests for tool call ids and control flow tools."""
+
+    def test_single_call_id(self):
+        """Test that a single call keeps the step action id."""
+        agent = create_test_agent(ToolCallingAgent)
+        agent._context.iteration = 3
+        tool = SleepTool(name="a")
+
+        assert agent._select_tool_calls([tool]) == [("3-action", tool)]
+
+    def test_multiple_call_ids(self):
+        """Test that several calls get distinct ids in call order."""
+        agent = create_test_agent(ToolCallingAgent)
+        agent._context.iteration = 2
+        tools = [SleepTool(name="a"), SleepTool(name="b")]
+
+        assert agent._select_tool_calls(tools) == [("2-action-1", tools[0]), ("2-action-2", tools[1])]
+
+    def test_final_answer_runs_alone(self):
+        """Test that other calls are dropped when final answer is
+        selected."""
+        agent = create_test_agent(ToolCallingAgent)
+        agent._context.iteration = 1
+        final = final_answer()
+
+        assert agent._select_tool_calls([SleepTool(name="a"), final]) == [("1-action", final)]
+
+
+class TestExecuteToolCalls:
+    """Tests for concurrent execution of tool calls."""
+
+    @pytest.mark.asyncio
+    async def test_results_added_in_call_order(self):
+        """Test that results follow call order, not completion order."""
+        agent = create_test_agent(ToolCallingAgent)
+        calls = [("1-action-1", SleepTool(name="slow", delay=0.05)), ("1-action-2", SleepTool(name="fast"))]
+
+        results = await agent._execute_tool_calls(calls)
+
+        assert results == ["result slow", "result fast"]
+        assert agent.conversation == [
+            {"role": "tool", "content": "result slow", "tool_call_id": "1-action-1"},
+            {"role": "tool", "content": "result fast", "tool_call_id": "1-action-2"},
+        ]
+        assert [entry["tool_name"] for entry in agent.log] == ["sleeptool", "sleeptool"]
+
+    @pytest.mark.asyncio
+    async def test_calls_run_concurrently(self):
+        """Test that calls overlap instead of running one by one."""
+        agent = create_test_agent(ToolCallingAgent)
+        calls = [(f"1-action-{i}", SleepTool(name=str(i), delay=0.1)) for i in range(4)]
+
+        start = asyncio.get_running_loop().time()
+        await agent._execute_tool_calls(calls)
+
+        assert asyncio.get_running_loop().time() - start < 0.3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_capped(self):
+        """Test that at most max_parallel_tool_calls calls run at once."""
+        agent = create_test_agent(ToolCallingAgent, execution_config=ExecutionConfig(max_parallel_tool_calls=2))
+        running = 0
+        peak = 0
+
+        class CountingTool(BaseTool):
+            async def __call__(self, context) -> str:
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                return "done"
+
+        await agent._execute_tool_calls([(f"1-action-{i}", CountingTool()) for i in range(5)])
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_error_propagated_without_results(self):
+        """Test that a failed call raises and adds no partial results."""
+        agent = create_test_agent(ToolCallingAgent)
+
+        with pytest.raises(RuntimeError, match="tool failed"):
+            await agent._execute_tool_calls([("1-action-1", SleepTool(name="a")), ("1-action-2", FailingTool())])
+
+        assert agent.conversation == []
+
+
+class TestParallelActionPhase:
+    """Tests for agents running all tool calls of a step."""
+
+    @pytest.mark.asyncio
+    async def test_tool_calling_agent_runs_all_calls(self):
+        """Test that every emitted tool call is answered with matching
+        id."""
+        agent = create_test_agent(ToolCallingAgent)
+        agent._context.iteration = 1
+        tools = [SleepTool(name="a", delay=0.02), SleepTool(name="b")]
+        mock_completion_stream(agent, tools)
+
+        tool = await agent._select_action_phase()
+        result = await agent._action_phase(tool)
+
+        assert tool is tools[0]
+        assert result == "result a\nresult b"
+        assert [call["id"] for call in agent.conversation[0]["tool_calls"]] == ["1-action-1", "1-action-2"]
+        assert [message["tool_call_id"] for message in agent.conversation[1:]] == ["1-action-1", "1-action-2"]
+
+    @pytest.mark.asyncio
+    async def test_sgr_tool_calling_agent_runs_all_calls(self):
+        """Test that SGR tool calling agent runs all calls of the step."""
+        agent = create_test_agent(SGRToolCallingAgent)
+        agent._context.iteration = 2
+        tools = [SleepTool(name="a"), SleepTool(name="b")]
+        mock_completion_stream(agent, tools)
+        reasoning = Mock(spec=ReasoningTool, remaining_steps=["Search"])
+
+        tool = await agent._select_action_phase(reasoning)
+        result = await agent._action_phase(tool)
+
+        assert result == "result a\nresult b"
+        assert agent.conversation[0]["content"] == "Search"
+        assert [message["tool_call_id"] for message in agent.conversation[1:]] == ["2-action-1", "2-action-2"]
+
+    @pytest.mark.asyncio
+    async def test_single_call_keeps_action_id(self):
+        """Test that a single tool call is answered as before."""
+        agent = create_test_agent(ToolCallingAgent)
+        agent._context.iteration = 1
+        mock_completion_stream(agent, [SleepTool(name="a")])
+
+        tool = await agent._select_action_phase()
+        await agent._action_phase(tool)
+
+        assert agent.conversation[-1] == {"role": "tool", "content": "result a", "tool_call_id": "1-action"}
+
+
+class TestParallelSearchBudget:
+    """Tests for the search budget of concurrent search tool calls."""
+
+    @staticmethod
+    def create_agent(max_searches: int, max_concurrent_searches: int = 3) -> ToolCallingAgent:
+        """Create agent with a mocked search service tracking
+        concurrency."""
+        agent = create_test_agent(
+            ToolCallingAgent,
+            execution_config=ExecutionConfig(
+                max_searches=max_searches, max_concurrent_searches=max_concurrent_searches
+            ),
+        )
+        search_service = Mock(config=SearchConfig(tavily_api_key="key"))
+        search_service.running = search_service.peak = 0
+
+        async def search(query, max_results, include_raw_content):
+            search_service.running += 1
+            search_service.peak = max(search_service.peak, search_service.running)
+            await asyncio.sleep(0.01)
+            search_service.running -= 1
+            return [SourceData(number=0, url=f"https://{query}.com", title=query, snippet=query)]
+
+        search_service.search = AsyncMock(side_effect=search)
+        agent._context.search_service = search_service
+        return agent
+
+    @pytest.mark.asyncio
+    async def test_parallel_web_searches_respect_max_searches(self):
+        """Test that concurrent WebSearchTool calls share the search
+        budget."""
+        agent = self.create_agent(max_searches=1)
+        calls = [(f"1-action-{i}", WebSearchTool(reasoning="Test", query=f"q{i}", max_results=5)) for i in range(4)]
+
+        results = await agent._execute_tool_calls(calls)
+
+        assert agent._context.searches_used == 1
+        assert agent._context.search_service.search.await_count == 1
+        assert sum("Search limit reached" in result for result in results) == 3
+
+    @pytest.mark.asyncio
+    async def test_parallel_multi_searches_respect_max_searches(self):
+        """Test that concurrent MultiWebSearchTool calls share the search
+        budget."""
+        agent = self.create_agent(max_searches=2)
+        calls = [
+            ("1-action-1", MultiWebSearchTool(reasoning="Test", queries=["a", "b"], max_results=5)),
+            ("1-action-2", MultiWebSearchTool(reasoning="Test", queries=["c", "d"], max_results=5)),
+        ]
+
+        await agent._execute_tool_calls(calls)
+
+        assert agent._context.searches_used == 2
+        assert agent._context.search_service.search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_parallel_web_searches_limited_by_search_semaphore(self):
+        """Test that concurrent WebSearchTool calls are limited by
+        max_concurrent_searches."""
+        agent = self.create_agent(max_searches=4, max_concurrent_searches=1)
+        calls = [(f"1-action-{i}", WebSearchTool(reasoning="Test", query=f"q{i}", max_results=5)) for i in range(3)]
+
+        await agent._execute_tool_calls(calls)
+
+        assert agent._context.searches_used == 3
+        assert agent._context.search_service.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_search_gives_back_budget(self):
+        """Test that a failed search does not count against the budget."""
+        agent = self.create_agent(max_searches=2)
+        agent._context.search_service.search.side_effect = RuntimeError("search error")
+
+        with pytest.raises(RuntimeError):
+            await WebSearchTool(reasoning="Test", query="q", max_results=5)(agent._context)
+
+        assert agent._context.searches_used == 0
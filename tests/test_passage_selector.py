@@ -0,0 +1,139 @@
+"""Tests for PassageSelector.
+
+This module contains tests for page splitting, BM25 passage scoring and
+relevance-ranked page content in ExtractPageContentTool.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from sgr_deep_research.core.agent_definition import SearchConfig
+from sgr_deep_research.core.models import ResearchContext, SourceData
+from sgr_deep_research.core.services.passage_selector import PassageSelector, query_text
+from sgr_deep_research.core.services.tavily_search import TavilySearchService
+from sgr_deep_research.core.tools import ExtractPageContentTool
+
+NAVIGATION = "\n\n".join(f"Menu item {i} | Home | About | Contacts | Subscribe to newsletter" for i in range(20))
+ANSWER = "The Eiffel Tower is 330 metres tall after the addition of a new antenna in 2022."
+PAGE = f"{NAVIGATION}\n\n{ANSWER}\n\nCopyright notice. All rights reserved."
+
+
+class TestPassageSplitting:
+    """Tests for splitting pages into passages."""
+
+    def test_short_paragraphs_merged(self):
+        """Test that short paragraphs are merged up to passage size."""
+        selector = PassageSelector(passage_chars=20)
+
+        assert selector.split("one\n\ntwo\n\n\nthree four five six") == ["one\n\ntwo", "three four five six"]
+
+    def test_long_paragraph_split_at_sentences(self):
+        """Test that long paragraphs are split at sentence and word
+        boundaries within passage size."""
+        selector = PassageSelector(passage_chars=30)
+        text = "First sentence here. Second sentence here. " + "word " * 20
+
+        passages = selector.split(text)
+
+        assert passages[:2] == ["First sentence here.", "Second sentence here."]
+        assert all(len(passage) <= 30 for passage in passages)
+        assert " ".join(passages).split() == text.split()
+
+
+class TestPassageSelection:
+    """Tests for BM25 passage selection."""
+
+    def test_relevant_passage_selected(self):
+        """Test that the passage matching the query is selected over the
+        page beginning."""
+        selector = PassageSelector(passage_chars=100)
+
+        result = selector.select(PAGE, "How tall is the Eiffel tower?", 200)
+
+        assert ANSWER in result
+        assert "Menu item 0" not in result
+        assert len(result) <= 200
+
+    def test_rare_terms_score_higher(self):
+        """Test that passages with rare query terms outrank passages with
+        common ones."""
+        selector = PassageSelector()
+        passages = ["the tower", "the tower", "the antenna", "the city"]
+
+        scores = selector.score(passages, "tower antenna")
+
+        assert scores[2] > scores[0] > scores[3] == 0
+
+    def test_selected_passages_in_page_order(self):
+        """Test that selected passages keep their page order and are
+        joined with the separator."""
+        selector = PassageSelector(passage_chars=20)
+        text = "alpha match\n\nfiller text here\n\nbeta match match\n\nmore filler"
+
+        result = selector.select(text, "match", 40)
+
+        assert result == f"alpha match{selector.separator}beta match match"
+
+    def test_short_page_returned_whole(self):
+        """Test that pages within the budget are not changed."""
+        assert PassageSelector().select("short page", "query", 100) == "short page"
+
+    def test_no_matching_terms_falls_back_to_prefix(self):
+        """Test that the page beginning is returned when nothing matches the
+        query."""
+        assert PassageSelector(passage_chars=100).select(PAGE, "unrelated words", 50) == PAGE[:50]
+
+    def test_query_text_collects_nested_values(self):
+        """Test that query text is collected from strings, models, dicts and
+        lists."""
+        source = SourceData(number=1, url="https://a.com", title="Title")
+
+        text = query_text("task", None, {"steps": ["one", "two"]}, source)
+
+        assert text.startswith("task one two")
+        assert "https://a.com" in text and "Title" in text
+
+
+class TestExtractPassageSelection:
+    """Tests for passage selection in ExtractPageContentTool."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        TavilySearchService.page_cache.clear()
+
+    def teardown_method(self):
+        """Cleanup after each test method."""
+        TavilySearchService.page_cache.clear()
+
+    def create_context(self, passage_selection: bool) -> ResearchContext:
+        """Create context with a mocked search service returning a long
+        page."""
+        config = SearchConfig(
+            tavily_api_key="key", content_limit=200, passage_chars=100, passage_selection=passage_selection
+        )
+        search_service = Mock(config=config)
+        search_service.extract = AsyncMock(
+            return_value=[SourceData(number=0, url="https://a.com", full_content=PAGE, char_count=len(PAGE))]
+        )
+        return ResearchContext(task="Find the height of the Eiffel Tower", search_service=search_service)
+
+    @pytest.mark.asyncio
+    async def test_extract_sends_relevant_passages(self):
+        """Test that extracted content is selected by the agent task."""
+        tool = ExtractPageContentTool(reasoning="Check the page", urls=["https://a.com"])
+
+        result = await tool(self.create_context(passage_selection=True))
+
+        assert ANSWER in result
+        assert "Menu item 0" not in result
+
+    @pytest.mark.asyncio
+    async def test_extract_without_passage_selection_sends_prefix(self):
+        """Test that disabled passage selection keeps the page beginning."""
+        tool = ExtractPageContentTool(reasoning="Check the page", urls=["https://a.com"])
+
+        result = await tool(self.create_context(passage_selection=False))
+
+        assert PAGE[:200] in result
+        assert ANSWER not in result
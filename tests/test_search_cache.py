@@ -0,0 +1,206 @@
+"""Tests for SearchCache.
+
+This module contains tests for the cross-agent search results cache,
+its memory and SQLite backends, and its use by TavilySearchService.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from sgr_deep_research.core.agent_config import SearchCacheConfig
+from sgr_deep_research.core.agent_definition import SearchConfig
+from sgr_deep_research.core.models import ResearchContext, SourceData
+from sgr_deep_research.core.services.search_cache import (
+    InMemorySearchCacheBackend,
+    SearchCache,
+    SQLiteSearchCacheBackend,
+)
+from sgr_deep_research.core.services.tavily_search import TavilySearchService
+from sgr_deep_research.core.tools import WebSearchTool
+
+
+def create_sources(*urls: str) -> list[SourceData]:
+    """Create search sources for URLs."""
+    return [SourceData(number=i, url=url, title=url, snippet=f"about {url}") for i, url in enumerate(urls)]
+
+
+class TestSearchCacheBackends:
+    """Tests for search cache backends."""
+
+    @pytest.fixture(params=["memory", "sqlite"])
+    def create_backend(self, request, tmp_path):
+        """Factory of backends of both kinds."""
+
+        def create(**kwargs):
+            if request.param == "sqlite":
+                return SQLiteSearchCacheBackend(str(tmp_path / "search_cache.db"), **kwargs)
+            return InMemorySearchCacheBackend(**kwargs)
+
+        return create
+
+    def test_set_and_get(self, create_backend):
+        """Test that stored sources are returned by key."""
+        backend = create_backend()
+        backend.set("key", create_sources("https://a.com", "https://b.com"))
+
+        sources = backend.get("key")
+
+        assert [source.url for source in sources] == ["https://a.com", "https://b.com"]
+        assert backend.get("other") is None
+        assert len(backend) == 1
+
+    def test_evicts_least_recently_used(self, create_backend):
+        """Test that size is bounded with LRU eviction."""
+        backend = create_backend(max_size=2)
+        backend.set("a", create_sources("https://a.com"))
+        backend.set("b", create_sources("https://b.com"))
+        backend.get("a")  # refresh a
+        backend.set("c", create_sources("https://c.com"))  # evicts b
+
+        assert len(backend) == 2
+        assert backend.get("b") is None
+        assert backend.get("a") is not None
+
+    def test_expired_entries_are_missing(self, create_backend):
+        """Test that entries older than TTL are not returned."""
+        backend = create_backend(ttl=60)
+        with patch("time.monotonic", return_value=1000.0), patch("time.time", return_value=1000.0):
+            backend.set("key", create_sources("https://a.com"))
+        with patch("time.monotonic", return_value=1061.0), patch("time.time", return_value=1061.0):
+            assert backend.get("key") is None
+
+    def test_clear(self, create_backend):
+        """Test that clear removes all entries."""
+        backend = create_backend()
+        backend.set("key", create_sources("https://a.com"))
+
+        backend.clear()
+
+        assert len(backend) == 0
+
+    def test_sqlite_survives_reopen(self, tmp_path):
+        """Test that the SQLite cache is shared between backend
+        instances."""
+        path = str(tmp_path / "search_cache.db")
+        backend = SQLiteSearchCacheBackend(path)
+        backend.set("key", create_sources("https://a.com"))
+        backend.close()
+
+        assert SQLiteSearchCacheBackend(path).get("key")[0].url == "https://a.com"
+
+
+class TestSearchCache:
+    """Tests for SearchCache keys, copies and metrics."""
+
+    def test_key_normalizes_query(self):
+        """Test that queries differing only in case and whitespace share a
+        key."""
+        assert SearchCache.make_key("  BMW  X6 2025", 5, False) == SearchCache.make_key("bmw x6\t2025 ", 5, False)
+        assert SearchCache.make_key("bmw", 5, False) != SearchCache.make_key("bmw", 10, False)
+        assert SearchCache.make_key("bmw", 5, False) != SearchCache.make_key("bmw", 5, True)
+
+    def test_hit_and_miss_metrics(self):
+        """Test that lookups are counted as hits and misses."""
+        cache = SearchCache()
+        assert cache.get("query", 5, False) is None
+        cache.set("query", 5, False, create_sources("https://a.com"))
+        assert cache.get("Query", 5, False) is not None
+
+        stats = cache.stats()
+
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_returns_independent_copies(self):
+        """Test that renumbering returned sources does not change cached
+        ones."""
+        cache = SearchCache()
+        sources = create_sources("https://a.com")
+        cache.set("query", 5, False, sources)
+        sources[0].number = 42
+
+        cached = cache.get("query", 5, False)
+        cached[0].number = 7
+
+        assert cache.get("query", 5, False)[0].number == 0
+
+    def test_disabled_cache(self):
+        """Test that disabled cache neither stores nor counts lookups."""
+        cache = SearchCache(enabled=False)
+        cache.set("query", 5, False, create_sources("https://a.com"))
+
+        assert cache.get("query", 5, False) is None
+        assert cache.stats().misses == 0
+
+    def test_configure_sqlite(self, tmp_path):
+        """Test that configure switches backend."""
+        cache = SearchCache()
+        cache.configure(SearchCacheConfig(backend="sqlite", sqlite_path=str(tmp_path / "cache.db"), max_size=5))
+
+        assert isinstance(cache.backend, SQLiteSearchCacheBackend)
+        assert cache.backend.max_size == 5
+        cache.close()
+
+
+class TestTavilySearchServiceCache:
+    """Tests for cached searches in TavilySearchService."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        TavilySearchService._instances.clear()
+        TavilySearchService.cache.clear()
+
+    def teardown_method(self):
+        """Cleanup after each test method."""
+        TavilySearchService.cache.clear()
+
+    def create_service(self) -> TavilySearchService:
+        """Create service with a mocked Tavily client."""
+        service = TavilySearchService.get(SearchConfig(tavily_api_key="key"))
+        service._client.search = AsyncMock(
+            return_value={
+                "results": [
+                    {"url": "https://a.com", "title": "A", "content": "a"},
+                    {"url": "https://b.com", "title": "B", "content": "b"},
+                ]
+            }
+        )
+        return service
+
+    @pytest.mark.asyncio
+    async def test_repeated_search_is_cached(self):
+        """Test that the same normalized search calls Tavily once."""
+        service = self.create_service()
+
+        first = await service.search("BMW X6", max_results=5, include_raw_content=False)
+        second = await service.search("bmw  x6", max_results=5, include_raw_content=False)
+
+        service._client.search.assert_awaited_once()
+        assert [s.url for s in first] == [s.url for s in second]
+
+    @pytest.mark.asyncio
+    async def test_different_parameters_are_not_shared(self):
+        """Test that searches with other parameters miss the cache."""
+        service = self.create_service()
+
+        await service.search("BMW X6", max_results=5, include_raw_content=False)
+        await service.search("BMW X6", max_results=5, include_raw_content=True)
+
+        assert service._client.search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_sources_renumbered_per_agent(self):
+        """Test that agents sharing cached results number sources in their
+        own context."""
+        service = self.create_service()
+        context1 = ResearchContext(search_service=service)
+        context1.sources["https://x.com"] = SourceData(number=1, url="https://x.com")
+        context2 = ResearchContext(search_service=service)
+        tool = WebSearchTool(reasoning="Test", query="BMW X6", max_results=5)
+
+        await tool(context1)
+        await tool(context2)
+
+        assert [s.number for s in context1.sources.values()] == [1, 2, 3]
+        assert [s.number for s in context2.sources.values()] == [1, 2]
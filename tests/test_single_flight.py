@@ -0,0 +1,231 @@
+"""Tests for SingleFlight.
+
+This module contains tests for deduplication of concurrent calls, both
+single and batched, including error and cancellation handling.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from sgr_deep_research.core.agent_definition import SearchConfig
+from sgr_deep_research.core.models import SourceData
+from sgr_deep_research.core.services.single_flight import SingleFlight
+from sgr_deep_research.core.services.tavily_search import TavilySearchService
+
+
+class TestSingleFlight:
+    """Tests for deduplication of single calls."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_result(self):
+        """Test that concurrent callers of a key make one call."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def func():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "result"
+
+        tasks = [asyncio.create_task(flight.do("key", func)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == ["result"] * 5
+        assert calls == 1
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_shared(self):
+        """Test that a finished call is not reused."""
+        flight = SingleFlight()
+        func = AsyncMock(side_effect=["first", "second"])
+
+        assert await flight.do("key", func) == "first"
+        assert await flight.do("key", func) == "second"
+
+    @pytest.mark.asyncio
+    async def test_error_propagates_to_all_callers(self):
+        """Test that a failed call raises for every waiting caller."""
+        flight = SingleFlight()
+
+        async def func():
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(flight.do("key", func), flight.do("key", func), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        """Test that cancelling one caller keeps the call running for the
+        others."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def func():
+            await release.wait()
+            return "result"
+
+        first = asyncio.create_task(flight.do("key", func))
+        second = asyncio.create_task(flight.do("key", func))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await second == "result"
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_call_cancelled_when_all_callers_cancelled(self):
+        """Test that the call is cancelled without callers and later callers
+        start a new one."""
+        flight = SingleFlight()
+
+        async def func():
+            await asyncio.Event().wait()
+
+        task = asyncio.create_task(flight.do("key", func))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert "key" not in flight
+        assert await flight.do("key", AsyncMock(return_value="new")) == "new"
+
+
+class TestSingleFlightBatch:
+    """Tests for deduplication of batched calls."""
+
+    @pytest.mark.asyncio
+    async def test_batch_requests_only_missing_keys(self):
+        """Test that keys in flight are awaited and only new keys are
+        requested."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+        requested = []
+
+        async def func(keys):
+            requested.append(keys)
+            await release.wait()
+            return {key: key.upper() for key in keys}
+
+        first = asyncio.create_task(flight.do_many(["a", "b"], func))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(flight.do_many(["b", "c", "c"], func))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await first == {"a": "A", "b": "B"}
+        assert await second == {"b": "B", "c": "C"}
+        assert requested == [["a", "b"], ["c"]]
+
+    @pytest.mark.asyncio
+    async def test_missing_results_map_to_none(self):
+        """Test that keys without result map to None."""
+        flight = SingleFlight()
+
+        assert await flight.do_many(["a", "b"], AsyncMock(return_value={"a": 1})) == {"a": 1, "b": None}
+
+
+class TestTavilySearchServiceSingleFlight:
+    """Tests for deduplicated Tavily searches and extracts."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        TavilySearchService.cache.clear()
+
+    def teardown_method(self):
+        """Cleanup after each test method."""
+        TavilySearchService.cache.clear()
+
+    def create_service(self) -> TavilySearchService:
+        """Create service with a slow mocked Tavily client."""
+        service = TavilySearchService(SearchConfig(tavily_api_key="key"))
+
+        async def search(**kwargs):
+            await asyncio.sleep(0.01)
+            return {"results": [{"url": "https://a.com", "title": "A", "content": "a"}]}
+
+        async def extract(urls):
+            await asyncio.sleep(0.01)
+            return {"results": [{"url": url, "raw_content": f"content of {url}"} for url in urls]}
+
+        service._client.search = AsyncMock(side_effect=search)
+        service._client.extract = AsyncMock(side_effect=extract)
+        return service
+
+    @pytest.mark.asyncio
+    async def test_concurrent_searches_sent_once(self):
+        """Test that identical concurrent searches reach Tavily once and
+        callers get own copies."""
+        service = self.create_service()
+
+        results = await asyncio.gather(*(service.search("query", max_results=5) for _ in range(3)))
+
+        service._client.search.assert_awaited_once()
+        assert [[s.url for s in sources] for sources in results] == [["https://a.com"]] * 3
+        assert len({id(sources[0]) for sources in results}) == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_extracts_share_urls(self):
+        """Test that URLs in flight are not extracted again."""
+        service = self.create_service()
+
+        first, second = await asyncio.gather(
+            service.extract(["https://a.com", "https://b.com"]),
+            service.extract(["https://b.com", "https://c.com"]),
+        )
+
+        requested = [call.kwargs["urls"] for call in service._client.extract.await_args_list]
+        assert requested == [["https://a.com", "https://b.com"], ["https://c.com"]]
+        assert [s.url for s in first] == ["https://a.com", "https://b.com"]
+        assert [s.url for s in second] == ["https://b.com", "https://c.com"]
+        assert isinstance(second[0], SourceData) and second[0].full_content == "content of https://b.com"
+
+    @pytest.mark.asyncio
+    async def test_extract_result_under_different_url(self):
+        """Test that pages returned under another URL are not dropped."""
+        service = self.create_service()
+        service._client.extract = AsyncMock(
+            return_value={
+                "results": [
+                    {"url": "https://example.com/a/", "raw_content": "page a"},
+                    {"url": "https://example.com/final", "raw_content": "page b"},
+                ]
+            }
+        )
+
+        sources = await service.extract(["https://example.com/a", "https://example.com/redirect"])
+
+        assert [(s.url, s.full_content) for s in sources] == [
+            ("https://example.com/a", "page a"),
+            ("https://example.com/redirect", "page b"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_extract_unmatched_results_with_failures(self):
+        """Test that unmatched results are not guessed when some URLs
+        failed."""
+        service = self.create_service()
+        service._client.extract = AsyncMock(
+            return_value={
+                "results": [
+                    {"url": "https://example.com/a", "raw_content": "page a"},
+                    {"url": "https://other.com/", "raw_content": "other"},
+                ],
+                "failed_results": ["https://example.com/b"],
+            }
+        )
+
+        sources = await service.extract(["https://example.com/a", "https://example.com/b", "https://example.com/c"])
+
+        assert [s.url for s in sources] == ["https://example.com/a"]
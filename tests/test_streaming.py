@@ -4,11 +4,15 @@ This module contains comprehensive tests for the StreamingGenerator and
 OpenAIStreamingGenerator classes used for SSE-like streaming.
 """
 
+import asyncio
 import json
+import time
 
 import pytest
+from openai.types.chat import ChatCompletionChunk
+from openai.types.chat.chat_completion_chunk import Choice, ChoiceDelta, ChoiceDeltaToolCall
 
-from sgr_deep_research.core.stream import OpenAIStreamingGenerator, StreamingGenerator
+from sgr_deep_research.core.stream import OpenAIStreamingGenerator, SinkStreamingGenerator, StreamingGenerator
 
 
 class TestStreamingGenerator:
@@ -17,14 +21,14 @@ class TestStreamingGenerator:
     def test_initialization(self):
         """Test that StreamingGenerator initializes correctly."""
         generator = StreamingGenerator()
-        assert generator.queue is not None
-        assert generator.queue.qsize() == 0
+        assert len(generator._buffer) == 0
+        assert generator.last_seq == -1
 
     def test_add_single_item(self):
         """Test adding a single item to the queue."""
         generator = StreamingGenerator()
         generator.add("test data")
-        assert generator.queue.qsize() == 1
+        assert len(generator._buffer) == 1
 
     def test_add_multiple_items(self):
         """Test adding multiple items to the queue."""
@@ -32,7 +36,7 @@ class TestStreamingGenerator:
         generator.add("item 1")
         generator.add("item 2")
         generator.add("item 3")
-        assert generator.queue.qsize() == 3
+        assert len(generator._buffer) == 3
 
     def test_finish_adds_none(self):
         """Test that finish() adds None as termination signal."""
@@ -40,8 +44,9 @@ class TestStreamingGenerator:
         generator.add("data")
         generator.finish()
 
-        # Queue should have 2 items: "data" and None
-        assert generator.queue.qsize() == 2
+        # Buffer should have 2 items: "data" and None
+        assert len(generator._buffer) == 2
+        assert generator._buffer[-1] == (1, None)
 
     @pytest.mark.asyncio
     async def test_stream_empty(self):
@@ -161,6 +166,179 @@ class TestStreamingGenerator:
         assert items == special_chars
 
 
+class TestStreamingGeneratorBroadcast:
+    """Tests for StreamingGenerator subscribers, replay and overflow."""
+
+    @staticmethod
+    async def collect(stream) -> list:
+        return [item async for item in stream]
+
+    @pytest.mark.asyncio
+    async def test_multiple_subscribers_receive_all_data(self):
+        """Test that concurrent subscribers each receive every item."""
+        generator = StreamingGenerator()
+        readers = [asyncio.create_task(self.collect(generator.stream())) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        for item in ["a", "b", "c"]:
+            generator.add(item)
+            await asyncio.sleep(0)
+        generator.finish()
+
+        assert await asyncio.gather(*readers) == [["a", "b", "c"]] * 3
+
+    @pytest.mark.asyncio
+    async def test_next_stream_starts_after_consumed_segment(self):
+        """Test that finish() separates segments like clarification
+        pauses."""
+        generator = StreamingGenerator()
+        generator.add("question")
+        generator.finish()
+        assert await self.collect(generator.stream()) == ["question"]
+
+        generator.add("answer")
+        generator.finish()
+
+        assert await self.collect(generator.stream()) == ["answer"]
+
+    @pytest.mark.asyncio
+    async def test_replay_from_sequence_number(self):
+        """Test that a late subscriber can replay from a sequence number."""
+        generator = StreamingGenerator()
+        for item in ["a", "b", "c"]:
+            generator.add(item)
+        generator.finish()
+
+        assert await self.collect(generator.subscribe(from_seq=1)) == [(1, "b"), (2, "c")]
+
+    @pytest.mark.asyncio
+    async def test_disconnected_subscriber_is_released(self):
+        """Test that closing a stream removes its subscription."""
+        generator = StreamingGenerator()
+        generator.add("a")
+        stream = generator.stream()
+
+        assert await anext(stream) == "a"
+        await stream.aclose()
+
+        assert not generator._subscriptions
+
+    def test_drop_oldest_overflow(self):
+        """Test that drop_oldest keeps only the newest entries."""
+        generator = StreamingGenerator(max_size=3, overflow="drop_oldest")
+
+        for item in ["a", "b", "c", "d", "e"]:
+            generator.add(item)
+
+        assert list(generator._buffer) == [(2, "c"), (3, "d"), (4, "e")]
+        assert generator.dropped == 2
+
+    def test_coalesce_overflow_keeps_data(self):
+        """Test that coalesce merges oldest entries without losing data."""
+        generator = StreamingGenerator(max_size=3, overflow="coalesce")
+
+        for item in ["a", "b", "c", "d", "e"]:
+            generator.add(item)
+
+        assert list(generator._buffer) == [(2, "abc"), (3, "d"), (4, "e")]
+        assert generator.dropped == 0
+
+    @pytest.mark.asyncio
+    async def test_coalesce_respects_subscriber_offsets(self):
+        """Test that entries split by a subscriber position are not
+        merged."""
+        generator = StreamingGenerator(max_size=3, overflow="coalesce")
+        generator.add("a")
+        generator.add("b")
+        stream = generator.stream()
+        assert await anext(stream) == "a"  # subscriber is between "a" and "b"
+
+        generator.add("c")
+        generator.add("d")
+
+        assert list(generator._buffer) == [(0, "a"), (2, "bc"), (3, "d")]
+        assert [await anext(stream), await anext(stream)] == ["bc", "d"]
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_released_stream_trimmed_after_read(self):
+        """Test that a finished stream drops its replay data once the last
+        segment is read."""
+        generator = OpenAIStreamingGenerator()
+        for i in range(1000):
+            generator.add_chunk_from_str(f"token {i} ")
+        generator.finish()
+        generator.release()
+        assert len(generator._buffer) == 1003  # unread output is kept
+
+        frames = await self.collect(generator.event_stream())
+
+        assert len(frames) == 1002
+        assert len(generator._buffer) == 0 and generator._size == 0
+        assert await self.collect(generator.event_stream()) == []
+
+    @pytest.mark.asyncio
+    async def test_release_keeps_data_of_lagging_subscriber(self):
+        """Test that entries a subscriber has not read yet are kept."""
+        generator = StreamingGenerator()
+        lagging = generator.stream()
+        for item in ["a", "b", "c"]:
+            generator.add(item)
+        assert await anext(lagging) == "a"
+        generator.finish()
+        generator.release()
+
+        assert await self.collect(generator.stream()) == ["a", "b", "c"]
+        assert [seq for seq, _ in generator._buffer] == [1, 2, 3]
+        assert await self.collect(lagging) == ["b", "c"]
+        assert len(generator._buffer) == 0
+
+    def test_default_overflow_drops_oldest(self):
+        """Test that full buffers drop oldest entries by default."""
+        assert StreamingGenerator().overflow == "drop_oldest"
+        assert OpenAIStreamingGenerator().overflow == "drop_oldest"
+
+    @pytest.mark.parametrize("overflow", ["drop_oldest", "coalesce"])
+    def test_long_stream_stays_bounded(self, overflow):
+        """Test that a stream far longer than the buffer keeps bounded
+        data."""
+        generator = OpenAIStreamingGenerator(max_size=100, overflow=overflow, max_bytes=100_000)
+        generator.max_entry_bytes = 4096
+
+        for i in range(20_000):
+            generator.add_chunk_from_str(f"token {i} ")
+
+        sizes = [len(data) for _, data in generator._buffer]
+        assert generator._size == sum(sizes) <= 100_000
+        assert len(sizes) <= 100
+        # each append copies at most one merged entry, so its cost is bounded too
+        assert max(sizes) <= 4096
+        assert generator.dropped > 0
+
+    def test_coalesce_stops_at_entry_size_limit(self):
+        """Test that coalesce drops oldest instead of growing entries past
+        max_entry_bytes."""
+        generator = StreamingGenerator(max_size=3, overflow="coalesce", max_entry_bytes=2)
+
+        for item in ["a", "b", "c", "d", "e", "f"]:
+            generator.add(item)
+
+        assert list(generator._buffer) == [(3, "cd"), (4, "e"), (5, "f")]
+        assert generator.dropped == 1
+
+    def test_max_bytes_drops_oldest(self):
+        """Test that entries are dropped once buffered data exceeds
+        max_bytes."""
+        generator = StreamingGenerator(max_bytes=5)
+
+        for item in ["ab", "cd", "ef"]:
+            generator.add(item)
+
+        assert list(generator._buffer) == [(1, "cd"), (2, "ef")]
+        assert generator._size == 4
+        assert generator.dropped == 1
+
+
 class TestOpenAIStreamingGenerator:
     """Tests for OpenAIStreamingGenerator class."""
 
@@ -216,7 +394,7 @@ class TestOpenAIStreamingGenerator:
 
         items = []
         async for item in generator.stream():
-            items.append(item)
+            items.append(item.decode())
 
         # Should have 3 items: content chunk, final chunk, [DONE]
         assert len(items) >= 2
@@ -231,7 +409,7 @@ class TestOpenAIStreamingGenerator:
 
         items = []
         async for item in generator.stream():
-            items.append(item)
+            items.append(item.decode())
 
         # Parse first chunk
         first_chunk = items[0]
@@ -254,7 +432,7 @@ class TestOpenAIStreamingGenerator:
 
         items = []
         async for item in generator.stream():
-            items.append(item)
+            items.append(item.decode())
 
         first_chunk = items[0]
         json_str = first_chunk[6:].strip()
@@ -273,7 +451,7 @@ class TestOpenAIStreamingGenerator:
 
         items = []
         async for item in generator.stream():
-            items.append(item)
+            items.append(item.decode())
 
         # Should have 3 content chunks + 2 final chunks
         assert len(items) >= 4
@@ -287,7 +465,7 @@ class TestOpenAIStreamingGenerator:
 
         items = []
         async for item in generator.stream():
-            items.append(item)
+            items.append(item.decode())
 
         tool_chunk = items[0]
         json_str = tool_chunk[6:].strip()
@@ -312,7 +490,7 @@ class TestOpenAIStreamingGenerator:
 
         items = []
         async for item in generator.stream():
-            items.append(item)
+            items.append(item.decode())
 
         tool_chunk = items[0]
         json_str = tool_chunk[6:].strip()
@@ -332,7 +510,7 @@ class TestOpenAIStreamingGenerator:
 
         items = []
         async for item in generator.stream():
-            items.append(item)
+            items.append(item.decode())
 
         # Second to last should be final chunk with finish_reason
         final_chunk = items[-2]
@@ -350,7 +528,7 @@ class TestOpenAIStreamingGenerator:
 
         items = []
         async for item in generator.stream():
-            items.append(item)
+            items.append(item.decode())
 
         final_chunk = items[-2]
         json_str = final_chunk[6:].strip()
@@ -366,7 +544,7 @@ class TestOpenAIStreamingGenerator:
 
         items = []
         async for item in generator.stream():
-            items.append(item)
+            items.append(item.decode())
 
         final_chunk = items[-2]
         json_str = final_chunk[6:].strip()
@@ -377,6 +555,17 @@ class TestOpenAIStreamingGenerator:
         assert "completion_tokens" in data["usage"]
         assert "total_tokens" in data["usage"]
 
+    @pytest.mark.asyncio
+    async def test_finish_reports_usage(self):
+        """Test that final chunk carries the given token usage."""
+        generator = OpenAIStreamingGenerator()
+        usage = {"prompt_tokens": 100, "completion_tokens": 20, "total_tokens": 120}
+        generator.finish(usage=usage)
+
+        items = [item.decode() async for item in generator.stream()]
+
+        assert json.loads(items[-2][6:])["usage"] == usage
+
     @pytest.mark.asyncio
     async def test_finish_adds_done_marker(self):
         """Test that finish() adds [DONE] marker."""
@@ -385,7 +574,7 @@ class TestOpenAIStreamingGenerator:
 
         items = []
         async for item in generator.stream():
-            items.append(item)
+            items.append(item.decode())
 
         # Last item should be [DONE]
         assert items[-1] == "data: [DONE]\n\n"
@@ -400,7 +589,7 @@ class TestOpenAIStreamingGenerator:
 
         items = []
         async for item in generator.stream():
-            items.append(item)
+            items.append(item.decode())
 
         # Should have: 2 content chunks + final chunk + [DONE]
         assert len(items) == 4
@@ -414,7 +603,7 @@ class TestOpenAIStreamingGenerator:
 
         items = []
         async for item in generator.stream():
-            items.append(item)
+            items.append(item.decode())
 
         # Should have: tool chunk + final chunk + [DONE]
         assert len(items) == 3
@@ -430,7 +619,7 @@ class TestOpenAIStreamingGenerator:
 
         items = []
         async for item in generator.stream():
-            items.append(item)
+            items.append(item.decode())
 
         # Should have: 3 chunks + final + [DONE] = 5
         assert len(items) == 5
@@ -445,7 +634,7 @@ class TestOpenAIStreamingGenerator:
 
         items = []
         async for item in generator.stream():
-            items.append(item)
+            items.append(item.decode())
 
         first_chunk = items[0]
         json_str = first_chunk[6:].strip()
@@ -463,7 +652,7 @@ class TestOpenAIStreamingGenerator:
 
         items = []
         async for item in generator.stream():
-            items.append(item)
+            items.append(item.decode())
 
         first_chunk = items[0]
         json_str = first_chunk[6:].strip()
@@ -481,7 +670,7 @@ class TestOpenAIStreamingGenerator:
 
         items = []
         async for item in generator.stream():
-            items.append(item)
+            items.append(item.decode())
 
         first_chunk = items[0]
         json_str = first_chunk[6:].strip()
@@ -498,7 +687,7 @@ class TestOpenAIStreamingGenerator:
 
         items = []
         async for item in generator.stream():
-            items.append(item)
+            items.append(item.decode())
 
         first_chunk = items[0]
         json_str = first_chunk[6:].strip()
@@ -516,13 +705,78 @@ class TestOpenAIStreamingGenerator:
 
         items = []
         async for item in generator.stream():
-            items.append(item)
+            items.append(item.decode())
 
         # All items should start with "data: " and end with "\n\n"
         for item in items:
             assert item.startswith("data: ")
             assert item.endswith("\n\n")
 
+    @pytest.mark.asyncio
+    async def test_event_stream_adds_event_ids(self):
+        """Test that event_stream frames carry increasing event ids."""
+        generator = OpenAIStreamingGenerator()
+        generator.add_chunk_from_str("a")
+        generator.add_chunk_from_str("b")
+        generator.finish()
+
+        items = [item.decode() async for item in generator.event_stream()]
+
+        assert [item.split("\n", 1)[0] for item in items] == ["id: 0", "id: 1", "id: 2", "id: 3"]
+        assert all(item.split("\n", 1)[1].startswith("data: ") for item in items)
+
+    @pytest.mark.asyncio
+    async def test_event_stream_resumes_after_last_event_id(self):
+        """Test that event_stream replays events after the given id."""
+        generator = OpenAIStreamingGenerator()
+        for content in ["a", "b", "c"]:
+            generator.add_chunk_from_str(content)
+        generator.finish()
+
+        items = [item.decode() async for item in generator.event_stream(last_event_id=1)]
+
+        assert json.loads(items[0].split("data: ", 1)[1])["choices"][0]["delta"]["content"] == "c"
+        assert len(items) == 3
+
+    def test_event_id_on_last_coalesced_frame(self):
+        """Test that coalesced frames carry the id on the last frame."""
+        frames = b"data: 1\n\ndata: 2\n\n"
+
+        assert OpenAIStreamingGenerator._with_event_id(7, frames) == b"data: 1\n\nid: 7\ndata: 2\n\n"
+
+    @pytest.mark.asyncio
+    async def test_add_chunk_token_delta(self):
+        """Test that LLM token chunks are re-enveloped with generator id and
+        model."""
+        generator = OpenAIStreamingGenerator(model="agent-model")
+        generator.add_chunk(create_token_chunk('Hello "world"'))
+        generator.finish()
+
+        items = [item async for item in generator.stream()]
+        data = json.loads(items[0][6:])
+
+        assert isinstance(items[0], bytes)
+        assert data["id"] == generator.id
+        assert data["model"] == "agent-model"
+        assert data["choices"][0]["delta"] == {"content": 'Hello "world"', "role": None}
+        assert data["choices"][0]["finish_reason"] is None
+
+    @pytest.mark.asyncio
+    async def test_add_chunk_tool_call_delta(self):
+        """Test that non-content deltas are serialized in full."""
+        generator = OpenAIStreamingGenerator()
+        chunk = create_token_chunk(None)
+        chunk.choices[0].delta.tool_calls = [ChoiceDeltaToolCall(index=0, id="call_1", type="function")]
+        chunk.choices[0].finish_reason = "tool_calls"
+        generator.add_chunk(chunk)
+        generator.finish()
+
+        items = [item async for item in generator.stream()]
+        choice = json.loads(items[0][6:])["choices"][0]
+
+        assert choice["delta"]["tool_calls"][0]["id"] == "call_1"
+        assert choice["finish_reason"] == "tool_calls"
+
     def test_model_preserved_across_chunks(self):
         """Test that model name is consistent across all chunks."""
         generator = OpenAIStreamingGenerator(model="custom-model")
@@ -561,8 +815,8 @@ class TestOpenAIStreamingGenerator:
 
         # Models should definitely be different
         assert gen1.model != gen2.model
-        # Queues should be independent
-        assert gen1.queue != gen2.queue
+        # Buffers should be independent
+        assert gen1._buffer != gen2._buffer
 
     @pytest.mark.asyncio
     async def test_long_content_stream(self):
@@ -574,10 +828,216 @@ class TestOpenAIStreamingGenerator:
 
         items = []
         async for item in generator.stream():
-            items.append(item)
+            items.append(item.decode())
 
         first_chunk = items[0]
         json_str = first_chunk[6:].strip()
         data = json.loads(json_str)
 
         assert len(data["choices"][0]["delta"]["content"]) == 10000
+
+
+def create_token_chunk(content: str | None) -> ChatCompletionChunk:
+    """Create LLM chunk with a single token delta."""
+    return ChatCompletionChunk(
+        id="chatcmpl-llm",
+        object="chat.completion.chunk",
+        created=0,
+        model="llm-model",
+        choices=[Choice(index=0, delta=ChoiceDelta(content=content), finish_reason=None)],
+    )
+
+
+class TestOpenAIStreamingGeneratorCoalescing:
+    """Tests for token delta coalescing."""
+
+    @staticmethod
+    def contents(generator: OpenAIStreamingGenerator) -> list:
+        """Delta contents of buffered frames, None for non-content frames."""
+        return [
+            json.loads(data[6:])["choices"][0]["delta"].get("content") if data.startswith(b"data: {") else None
+            for _, data in generator._buffer
+        ]
+
+    @pytest.mark.asyncio
+    async def test_deltas_flushed_after_interval(self):
+        """Test that content deltas are batched into one frame per
+        interval."""
+        generator = OpenAIStreamingGenerator(coalesce_ms=10)
+
+        for token in ["Hel", "lo ", '"wor', 'ld"']:
+            generator.add_chunk(create_token_chunk(token))
+        assert len(generator._buffer) == 0
+
+        await asyncio.sleep(0.02)
+
+        assert self.contents(generator) == ['Hello "world"']
+
+    @pytest.mark.asyncio
+    async def test_deltas_flushed_by_size(self):
+        """Test that pending content is flushed once size limit is
+        reached."""
+        generator = OpenAIStreamingGenerator(coalesce_ms=1000, coalesce_bytes=4)
+
+        for token in ["ab", "cd", "ef"]:
+            generator.add_chunk_from_str(token)
+
+        assert self.contents(generator) == ["abcd"]
+        assert generator._pending == [b"ef"]
+        generator.flush()
+
+    @pytest.mark.asyncio
+    async def test_tool_call_and_finish_flush_immediately(self):
+        """Test that pending deltas precede tool call and finish frames."""
+        generator = OpenAIStreamingGenerator(coalesce_ms=1000)
+
+        generator.add_chunk_from_str("thinking")
+        generator.add_tool_call("call_1", "search", "{}")
+        generator.add_chunk_from_str("done")
+        generator.finish()
+
+        items = [json.loads(item[6:]) for item in [item async for item in generator.stream()][:-1]]
+        assert items[0]["choices"][0]["delta"]["content"] == "thinking"
+        assert items[1]["choices"][0]["delta"]["tool_calls"][0]["id"] == "call_1"
+        assert items[2]["choices"][0]["delta"]["content"] == "done"
+        assert items[3]["choices"][0]["finish_reason"] == "stop"
+        assert generator._flush_handle is None
+
+    @pytest.mark.asyncio
+    async def test_different_delta_kinds_not_merged(self):
+        """Test that LLM deltas and agent text are framed separately."""
+        generator = OpenAIStreamingGenerator(coalesce_ms=1000)
+
+        generator.add_chunk(create_token_chunk("llm "))
+        generator.add_chunk(create_token_chunk("tokens"))
+        generator.add_chunk_from_str("result")
+        generator.flush()
+
+        assert self.contents(generator) == ["llm tokens", "result"]
+        assert json.loads(generator._buffer[1][1][6:])["choices"][0]["delta"]["role"] == "assistant"
+
+
+class TestSinkStreamingGenerator:
+    """Tests for no-op SinkStreamingGenerator."""
+
+    def test_output_is_discarded(self):
+        """Test that sink does not build or buffer frames."""
+        generator = SinkStreamingGenerator(model="agent")
+
+        generator.add_chunk(create_token_chunk("token"))
+        generator.add_chunk_from_str("text")
+        generator.add_tool_call("call_1", "tool", "{}")
+
+        assert len(generator._buffer) == 0
+        assert not generator.finished.is_set()
+
+    @pytest.mark.asyncio
+    async def test_finish_sets_finished(self):
+        """Test that finish signals completion and ends subscribers without
+        streaming frames."""
+        generator = SinkStreamingGenerator()
+        subscriber = asyncio.create_task(anext(generator.event_stream(), None))
+        await asyncio.sleep(0)
+
+        generator.finish()
+
+        assert generator.finished.is_set()
+        assert list(generator._buffer) == [(0, None)]
+        assert await asyncio.wait_for(subscriber, 1) is None
+
+    @pytest.mark.asyncio
+    async def test_close_ends_subscribers(self):
+        """Test that closing a replaced generator ends its subscribers."""
+        generator = OpenAIStreamingGenerator(coalesce_ms=1000)
+        generator.add_chunk_from_str("token")
+        generator.finish()
+        assert [frame async for frame in generator.event_stream()]
+        subscriber = asyncio.create_task(anext(generator.event_stream(), None))
+        await asyncio.sleep(0)
+
+        generator.close()
+
+        assert await asyncio.wait_for(subscriber, 1) is None
+        assert [frame async for frame in generator.event_stream()] == []
+
+
+class TestOpenAIStreamingGeneratorBenchmark:
+    """Micro-benchmark of chunk serialization, the hottest streaming
+    path."""
+
+    CHUNKS = 5000
+
+    def measure(self, add) -> float:
+        """Chunks per second of the add callable."""
+        start = time.perf_counter()
+        for _ in range(self.CHUNKS):
+            add()
+        return self.CHUNKS / (time.perf_counter() - start)
+
+    def test_frames_match_full_serialization(self):
+        """Test that precomputed envelopes produce the same frames as full
+        serialization."""
+        generator = OpenAIStreamingGenerator()
+        response = {
+            "id": generator.id,
+            "object": "chat.completion.chunk",
+            "created": generator.created,
+            "model": generator.model,
+            "system_fingerprint": f"fp_{hex(hash(generator.model))[-8:]}",
+            "choices": [
+                {
+                    "delta": {"content": "token", "role": "assistant", "tool_calls": None},
+                    "index": 0,
+                    "finish_reason": None,
+                    "logprobs": None,
+                }
+            ],
+            "usage": None,
+        }
+
+        generator.add_chunk_from_str("token")
+
+        assert generator._buffer[-1][1] == f"data: {json.dumps(response)}\n\n".encode()
+
+    @pytest.mark.benchmark
+    def test_chunk_serialization_throughput(self):
+        """Test that precomputed envelopes beat per-chunk full
+        serialization."""
+        chunk = create_token_chunk("token")
+        legacy = StreamingGenerator(max_size=2 * self.CHUNKS)
+        generator = OpenAIStreamingGenerator(max_size=2 * self.CHUNKS)
+
+        def legacy_add_chunk():
+            chunk.model = generator.model
+            legacy.add(f"data: {chunk.model_dump_json()}\n\n")
+
+        def legacy_add_chunk_from_str():
+            response = {
+                "id": generator.id,
+                "object": "chat.completion.chunk",
+                "created": generator.created,
+                "model": generator.model,
+                "system_fingerprint": f"fp_{hex(hash(generator.model))[-8:]}",
+                "choices": [
+                    {
+                        "delta": {"content": "token", "role": "assistant", "tool_calls": None},
+                        "index": 0,
+                        "finish_reason": None,
+                        "logprobs": None,
+                    }
+                ],
+                "usage": None,
+            }
+            legacy.add(f"data: {json.dumps(response)}\n\n")
+
+        results = {
+            "add_chunk": (self.measure(legacy_add_chunk), self.measure(lambda: generator.add_chunk(chunk))),
+            "add_chunk_from_str": (
+                self.measure(legacy_add_chunk_from_str),
+                self.measure(lambda: generator.add_chunk_from_str("token")),
+            ),
+        }
+
+        for name, (before, after) in results.items():
+            print(f"{name}: {before:,.0f} -> {after:,.0f} chunks/s ({after / before:.1f}x)")
+            assert after > before
@@ -0,0 +1,101 @@
+"""Tests for TavilySearchService.
+
+This module contains tests for sharing pooled Tavily search services
+between agents and their injection into tools through the context.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from sgr_deep_research.core.agent_definition import SearchConfig
+from sgr_deep_research.core.models import ResearchContext, SourceData
+from sgr_deep_research.core.services.tavily_search import TavilySearchService
+from sgr_deep_research.core.tools import ExtractPageContentTool, WebSearchTool
+
+
+class TestTavilySearchServicePool:
+    """Tests for shared TavilySearchService instances."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        TavilySearchService._instances.clear()
+
+    def test_same_config_shares_service(self):
+        """Test that equal search configs share one service."""
+        service1 = TavilySearchService.get(SearchConfig(tavily_api_key="key"))
+        service2 = TavilySearchService.get(SearchConfig(tavily_api_key="key"))
+
+        assert service1 is service2
+        assert service1._client._client is service1._http_client
+
+    def test_different_config_gets_own_service(self):
+        """Test that different search configs do not share a service."""
+        service1 = TavilySearchService.get(SearchConfig(tavily_api_key="key1"))
+        service2 = TavilySearchService.get(SearchConfig(tavily_api_key="key2"))
+
+        assert service1 is not service2
+
+    def test_pool_limits_from_config(self):
+        """Test that HTTP pool is configured from search config."""
+        service = TavilySearchService.get(SearchConfig(tavily_api_key="key", max_connections=7, timeout=5.0))
+
+        assert service._http_client._transport._pool._max_connections == 7
+        assert service._http_client.timeout.read == 5.0
+
+    @pytest.mark.asyncio
+    async def test_close_all(self):
+        """Test that closing services closes pools and empties the
+        registry."""
+        service = TavilySearchService.get(SearchConfig(tavily_api_key="key"))
+
+        await TavilySearchService.close_all()
+
+        assert service._http_client.is_closed
+        assert TavilySearchService._instances == {}
+        assert TavilySearchService.get(SearchConfig(tavily_api_key="key")) is not service
+
+
+class TestSearchServiceInjection:
+    """Tests for tools using the search service from context."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        TavilySearchService.page_cache.clear()
+
+    def create_context(self) -> ResearchContext:
+        """Create context with a mocked search service."""
+        search_service = Mock(config=SearchConfig(tavily_api_key="key", content_limit=4))
+        search_service.search = AsyncMock(return_value=[SourceData(number=1, url="https://a.com", snippet="a")])
+        search_service.extract = AsyncMock(
+            return_value=[SourceData(number=1, url="https://a.com", full_content="full text")]
+        )
+        return ResearchContext(search_service=search_service)
+
+    @pytest.mark.asyncio
+    async def test_web_search_uses_context_service(self):
+        """Test that WebSearchTool searches through the injected service."""
+        context = self.create_context()
+        tool = WebSearchTool(reasoning="Test", query="query", max_results=3)
+
+        await tool(context)
+
+        context.search_service.search.assert_awaited_once_with(query="query", max_results=3, include_raw_content=False)
+        assert "https://a.com" in context.sources
+
+    @pytest.mark.asyncio
+    async def test_extract_uses_context_service_config(self):
+        """Test that ExtractPageContentTool uses injected service and its
+        content limit."""
+        context = self.create_context()
+        tool = ExtractPageContentTool(reasoning="Test", urls=["https://a.com"])
+
+        result = await tool(context)
+
+        context.search_service.extract.assert_awaited_once_with(urls=["https://a.com"])
+        assert "full\n" in result
+        assert "full text" not in result
+
+    def test_search_service_not_serialized(self):
+        """Test that the service is excluded from context dumps."""
+        assert "search_service" not in self.create_context().model_dump()
@@ -0,0 +1,132 @@
+"""Tests for ToolSchemaCache.
+
+This module contains tests for cached function tool definitions used by
+tool calling agents.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from openai import pydantic_function_tool
+
+from sgr_deep_research.core.agents import SGRToolCallingAgent, ToolCallingAgent
+from sgr_deep_research.core.base_tool import MCPBaseTool
+from sgr_deep_research.core.services.mcp_service import MCP2ToolConverter
+from sgr_deep_research.core.services.tool_schema_cache import ToolSchemaCache
+from sgr_deep_research.core.tools import ClarificationTool, FinalAnswerTool, ReasoningTool
+from tests.conftest import create_test_agent
+
+
+class TestToolSchemaCache:
+    """Tests for ToolSchemaCache behavior."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        ToolSchemaCache.invalidate()
+
+    def test_cannot_instantiate(self):
+        """Test that ToolSchemaCache is a static class."""
+        with pytest.raises(TypeError):
+            ToolSchemaCache()
+
+    def test_get_returns_function_tool(self):
+        """Test that definition matches pydantic_function_tool output."""
+        definition = ToolSchemaCache.get(ClarificationTool)
+
+        assert definition["type"] == "function"
+        assert definition["function"]["name"] == ClarificationTool.tool_name
+        assert definition["function"]["strict"] is True
+        assert "questions" in definition["function"]["parameters"]["properties"]
+
+    def test_get_is_cached(self):
+        """Test that repeated calls reuse the same definition."""
+        with patch(
+            "sgr_deep_research.core.services.tool_schema_cache.pydantic_function_tool",
+            wraps=pydantic_function_tool,
+        ) as mock_convert:
+            first = ToolSchemaCache.get(ClarificationTool)
+            second = ToolSchemaCache.get(ClarificationTool)
+
+        assert first is second
+        mock_convert.assert_called_once()
+
+    def test_cache_keyed_by_name(self):
+        """Test that different function names get separate definitions."""
+        default = ToolSchemaCache.get(ClarificationTool)
+        custom = ToolSchemaCache.get(ClarificationTool, name="ask_user")
+
+        assert default is not custom
+        assert custom["function"]["name"] == "ask_user"
+
+    def test_invalidate_by_base_class(self):
+        """Test that invalidation only drops subclasses of given base."""
+
+        class MCPTestTool(MCPBaseTool):
+            query: str
+
+        ToolSchemaCache.get(MCPTestTool)
+        ToolSchemaCache.get(ClarificationTool)
+
+        ToolSchemaCache.invalidate(MCPBaseTool)
+
+        assert (MCPTestTool, MCPTestTool.tool_name) not in ToolSchemaCache._items
+        assert (ClarificationTool, ClarificationTool.tool_name) in ToolSchemaCache._items
+
+    def test_invalidate_all(self):
+        """Test that invalidation without base drops everything."""
+        ToolSchemaCache.get(ClarificationTool)
+        ToolSchemaCache.invalidate()
+
+        assert ToolSchemaCache._items == {}
+
+    @pytest.mark.asyncio
+    async def test_mcp_rebuild_invalidates_mcp_tools(self):
+        """Test that building MCP tools drops stale MCP tool schemas."""
+
+        class MCPStaleTool(MCPBaseTool):
+            query: str
+
+        ToolSchemaCache.get(MCPStaleTool)
+        config = type("Config", (), {"mcpServers": {"test": {}}})()
+
+        with patch(
+            "sgr_deep_research.core.services.mcp_service.MCPSessionPool.get", side_effect=RuntimeError("no server")
+        ):
+            with pytest.raises(RuntimeError):
+                await MCP2ToolConverter.build_tools_from_mcp(config)
+
+        assert (MCPStaleTool, MCPStaleTool.tool_name) not in ToolSchemaCache._items
+
+
+class TestAgentsUseToolSchemaCache:
+    """Tests for tool calling agents preparing tools from cache."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        ToolSchemaCache.invalidate()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("agent_class", [ToolCallingAgent, SGRToolCallingAgent])
+    async def test_prepare_tools_reuses_definitions(self, agent_class):
+        """Test that consecutive _prepare_tools calls return cached
+        definitions."""
+        agent = create_test_agent(agent_class, toolkit=[ClarificationTool, FinalAnswerTool])
+
+        first = await agent._prepare_tools()
+        second = await agent._prepare_tools()
+
+        by_name = {tool["function"]["name"]: tool for tool in first}
+        for tool in second:
+            assert tool is by_name[tool["function"]["name"]]
+
+    @pytest.mark.asyncio
+    async def test_prepare_tools_shared_between_agents(self):
+        """Test that agents share cached definitions."""
+        agent1 = create_test_agent(SGRToolCallingAgent, toolkit=[FinalAnswerTool])
+        agent2 = create_test_agent(SGRToolCallingAgent, toolkit=[FinalAnswerTool])
+
+        tools1 = {tool["function"]["name"]: tool for tool in await agent1._prepare_tools()}
+        tools2 = {tool["function"]["name"]: tool for tool in await agent2._prepare_tools()}
+
+        assert tools1[ReasoningTool.tool_name] is tools2[ReasoningTool.tool_name]
+        assert tools1[FinalAnswerTool.tool_name] is tools2[FinalAnswerTool.tool_name]
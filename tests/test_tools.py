@@ -86,7 +86,7 @@ class TestToolsInitialization:
         """Test WebSearchTool initialization."""
         with (
             patch("sgr_deep_research.core.tools.web_search_tool.GlobalConfig") as mock_config_class,
-            patch("sgr_deep_research.core.tools.web_search_tool.TavilySearchService"),
+            patch("sgr_deep_research.core.tools.web_search_tool.SearchBackend"),
         ):
             mock_config = Mock()
             mock_config.search.max_results = 5
@@ -129,7 +129,7 @@ class TestToolsConfigReading:
         """Test WebSearchTool reads search config for max_results."""
         with (
             patch("sgr_deep_research.core.tools.web_search_tool.GlobalConfig") as mock_config_class,
-            patch("sgr_deep_research.core.tools.web_search_tool.TavilySearchService"),
+            patch("sgr_deep_research.core.tools.web_search_tool.SearchBackend"),
         ):
             mock_config = Mock()
             mock_config.search.max_results = 5